@@ -0,0 +1,218 @@
+# benchmarks/bench_render.py
+"""Бенчмарк малювання на offscreen Surface під dummy-драйвером SDL.
+
+Ганяє Renderer.draw, HUD.draw, MainMenu.draw і IntroScreen.draw для кількох
+роздільностей, розмірів тайла, кількостей сутностей і з відкритим
+інвентарем. Пише час кожного кадру (p50/p99/max) у JSON і падає з кодом 1,
+якщо кадр не вкладається в бюджет (за замовчуванням 16.6 мс на p99).
+
+Запуск з теки RPG_GAMES (працює на headless Linux):
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --resolutions 1920x1080 --tiles 48 --budget-ms 16.6
+    python benchmarks/bench_render.py --dirty --output render.json
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+
+# dummy-драйвери треба виставити до імпорту pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# stdout — лише JSON-звіт (можна пайпити в json.tool / jq)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import common  # noqa: F401  (додає RPG_GAMES у sys.path)
+from common import (
+    summarize, environment_info, write_report, load_report,
+    compare_with_baseline, print_regressions,
+)
+from bench_simulation import make_level, make_simulation, parse_size
+
+import time
+import pygame
+
+import settings
+from view.renderer import Renderer
+from view.camera import Camera
+from view.hud import HUD
+from view.menu import MainMenu
+from view.intro_screen import IntroScreen
+
+
+DEFAULT_RESOLUTIONS = ("1280x720", "1920x1080", "2560x1440")
+DEFAULT_TILES = (32, 48)
+DEFAULT_COUNTS = (10, 1000)
+DEFAULT_MAP = "200x200"
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def time_frames(draw, frames: int, before=None):
+    """Час кожного з frames викликів draw() у нс; before() — поза заміром."""
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(frames):
+        if before is not None:
+            before()
+        start = clock()
+        draw()
+        samples.append(clock() - start)
+    return samples
+
+
+# ---------- сцени ----------
+
+def bench_playing(surface, map_size, tile: int, count: int, inventory: bool,
+                  dirty: bool, frames: int, seed: int):
+    """Renderer.draw (з HUD) і окремо HUD.draw для однієї сцени гри."""
+    width, height = map_size
+    screen_w, screen_h = surface.get_size()
+
+    settings.TILE_SIZE = tile
+    sim = make_simulation(make_level(width, height, count, count, seed=seed), "numpy")
+    player = sim.player
+
+    hud = HUD(player)
+    for i in range(20):
+        hud.add_message(f"Повідомлення {i}")
+    if inventory:
+        for item in list(sim.items[:8]):
+            player.add_item(item)
+        hud.show_inventory = True
+
+    camera = Camera(screen_w, screen_h, width, height, tile)
+    camera.snap_to(player.x, player.y)
+    renderer = Renderer(surface, sim.dungeon, player, sim.enemies, sim.items, hud,
+                        camera, enemy_index=sim.enemy_index, item_index=sim.item_index)
+    renderer.dirty_rects_enabled = dirty
+
+    rng = random.Random(seed)
+
+    # між кадрами світ живе як у грі: крок гравця, тік; у час кадру не входить
+    def step():
+        sim.try_move_or_attack(*rng.choice(DIRECTIONS))
+        sim.tick()
+        renderer.doors_open = sim.doors_open
+
+    # прогрів: запікання чанків, кеш спрайтів і шарів HUD
+    for _ in range(3):
+        renderer.draw()
+
+    results = {
+        "renderer_draw": summarize(time_frames(renderer.draw, frames, step)),
+        "hud_draw": summarize(time_frames(lambda: hud.draw(surface), frames)),
+    }
+    return results
+
+
+def bench_screens(surface, frames: int):
+    """Меню і вступ на роздільності surface."""
+    screen_w, screen_h = surface.get_size()
+    menu = MainMenu(screen_w, screen_h)
+    intro = IntroScreen(screen_w, screen_h)
+    return {
+        "menu_draw": summarize(time_frames(lambda: menu.draw(surface), frames)),
+        "intro_draw": summarize(time_frames(lambda: intro.draw(surface), frames)),
+    }
+
+
+def run(args):
+    pygame.init()
+    # convert_alpha() у AssetManager потребує режиму екрана; малюємо все одно offscreen
+    pygame.display.set_mode((1, 1))
+
+    map_size = parse_size(args.map)
+    results = {}
+    for resolution in args.resolutions:
+        surface = pygame.Surface(parse_size(resolution))
+        print(f"[INFO] {resolution}: меню / вступ ...", file=sys.stderr)
+        for name, summary in bench_screens(surface, args.frames).items():
+            results[f"{resolution}/{name}"] = summary
+
+        for tile in args.tiles:
+            for count in args.counts:
+                for inventory in (False, True):
+                    label = (f"{resolution}/tile={tile}/n={count}"
+                             f"/inv={'open' if inventory else 'closed'}")
+                    print(f"[INFO] {label} ...", file=sys.stderr)
+                    scene = bench_playing(surface, map_size, tile, count, inventory,
+                                          args.dirty, args.frames, args.seed)
+                    for name, summary in scene.items():
+                        results[f"{label}/{name}"] = summary
+
+    pygame.quit()
+    return results
+
+
+def check_budget(results: dict, budget_ms: float, metric: str):
+    """Назви замірів, що не вклалися в бюджет кадру."""
+    over = []
+    for name, summary in results.items():
+        if summary[metric] > budget_ms:
+            over.append((name, summary[metric]))
+    return over
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк малювання (JSON)")
+    parser.add_argument("--resolutions", nargs="+", default=list(DEFAULT_RESOLUTIONS),
+                        help="роздільності WxH")
+    parser.add_argument("--tiles", nargs="+", type=int, default=list(DEFAULT_TILES),
+                        help="розміри тайла в пікселях")
+    parser.add_argument("--counts", nargs="+", type=int, default=list(DEFAULT_COUNTS),
+                        help="кількість ворогів (і стільки ж предметів)")
+    parser.add_argument("--map", default=DEFAULT_MAP, help="розмір карти WxH")
+    parser.add_argument("--frames", type=int, default=120, help="кадрів на сцену")
+    parser.add_argument("--dirty", action="store_true", help="увімкнути dirty-rect режим")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget-ms", type=float, default=16.6,
+                        help="бюджет кадру в мс (0 — не перевіряти)")
+    parser.add_argument("--budget-metric", default="p99_ms",
+                        choices=("p50_ms", "p99_ms", "max_ms"))
+    parser.add_argument("--output", help="куди записати JSON (інакше stdout)")
+    parser.add_argument("--baseline", help="JSON попереднього запуску для порівняння")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="допустиме погіршення p50 (0.2 = +20%%)")
+    args = parser.parse_args(argv)
+
+    # [INFO]-логи AssetManager / Renderer під час замірів — у stderr, не в звіт
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run(args)
+    report = {
+        "benchmark": "render",
+        "environment": environment_info(),
+        "params": {
+            "resolutions": args.resolutions,
+            "tiles": args.tiles,
+            "counts": args.counts,
+            "map": args.map,
+            "frames": args.frames,
+            "dirty": args.dirty,
+            "budget_ms": args.budget_ms,
+            "budget_metric": args.budget_metric,
+        },
+        "results": results,
+    }
+    write_report(report, args.output)
+
+    failed = False
+    if args.budget_ms > 0:
+        over = check_budget(results, args.budget_ms, args.budget_metric)
+        for name, value in over:
+            print(f"[ERROR] {name}: {args.budget_metric} {value:.2f} мс > "
+                  f"бюджет {args.budget_ms} мс", file=sys.stderr)
+        failed = bool(over)
+
+    if args.baseline:
+        baseline = load_report(args.baseline).get("results", {})
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        print_regressions(regressions)
+        failed = failed or bool(regressions)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+# benchmarks/bench_simulation.py
+"""Бенчмарк гарячих шляхів симуляції на синтетичних підземеллях.
+
+Міряє, як масштабуються update_enemies_ai, tick, try_move_or_attack,
+check_item_pickup і запити до DungeonMap залежно від розміру карти
+і кількості ворогів/предметів. Результат — JSON (ops/sec, p50/p99).
+
+Запуск з теки RPG_GAMES:
+    python benchmarks/bench_simulation.py
+    python benchmarks/bench_simulation.py --sizes 24x12 200x200 --counts 10 100
+    python benchmarks/bench_simulation.py --output base.json
+    python benchmarks/bench_simulation.py --baseline base.json --tolerance 0.25
+
+З --baseline код виходу 1, якщо p50 хоч одного заміру погіршився
+більше ніж на tolerance.
+"""
+
+import argparse
+import random
+import sys
+
+import common  # noqa: F401  (додає RPG_GAMES у sys.path)
+from common import (
+    measure, summarize, environment_info, write_report, load_report,
+    compare_with_baseline, print_regressions,
+)
+
+import settings
+from model.simulation import Simulation
+
+
+DEFAULT_SIZES = ("24x12", "200x200", "1000x1000")
+DEFAULT_COUNTS = (10, 100, 1000, 10000)
+ITEM_CHARS = "HAWR"
+
+
+# ---------- синтетичні карти ----------
+
+def parse_size(text: str):
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def make_level(width: int, height: int, enemies: int, items: int,
+               wall_density: float = 0.12, seed: int = 0):
+    """Рядки карти: стіни по краях, випадкові стіни всередині,
+    гравець у центрі, вороги і предмети на випадкових вільних клітинках.
+    Якщо вільних клітинок замало — ставимо скільки влізе.
+    """
+    rng = random.Random(seed)
+    grid = [["."] * width for _ in range(height)]
+    for x in range(width):
+        grid[0][x] = grid[height - 1][x] = "#"
+    for y in range(height):
+        grid[y][0] = grid[y][width - 1] = "#"
+
+    px, py = width // 2, height // 2
+    for y in range(1, height - 1):
+        row = grid[y]
+        for x in range(1, width - 1):
+            if rng.random() < wall_density and abs(x - px) + abs(y - py) > 2:
+                row[x] = "#"
+    grid[py][px] = "P"
+
+    free = [
+        (x, y)
+        for y in range(1, height - 1)
+        for x in range(1, width - 1)
+        if grid[y][x] == "."
+    ]
+    rng.shuffle(free)
+    wanted = enemies + items
+    if wanted > len(free):
+        print(f"[WARN] {width}x{height}: лише {len(free)} вільних клітинок "
+              f"на {wanted} сутностей", file=sys.stderr)
+
+    for x, y in free[:enemies]:
+        grid[y][x] = "M"
+    for i, (x, y) in enumerate(free[enemies:enemies + items]):
+        grid[y][x] = ITEM_CHARS[i % len(ITEM_CHARS)]
+
+    return ["".join(row) for row in grid]
+
+
+def make_simulation(level, backend: str):
+    sim = Simulation(
+        level,
+        dungeon_backend=backend,
+        chase_radius=settings.ENEMY_CHASE_RADIUS,
+        tracking_radius=settings.ENEMY_TRACKING_RADIUS,
+    )
+    # гравець безсмертний, щоб бенчмарк не обірвався на game_over
+    sim.player.max_hp = sim.player.hp = 10 ** 9
+    return sim
+
+
+# ---------- заміри ----------
+
+def bench_case(width: int, height: int, count: int, backend: str,
+               min_time: float, seed: int):
+    """Усі заміри для однієї карти. Повертає dict назва -> summary."""
+    level = make_level(width, height, count, count, seed=seed)
+    sim = make_simulation(level, backend)
+    dungeon = sim.dungeon
+    player = sim.player
+    prefix = f"{width}x{height}/n={count}"
+    results = {}
+
+    def record(name, samples):
+        results[f"{prefix}/{name}"] = summarize(samples)
+
+    # AI у найгіршому випадку: у всіх ворогів скінчився кулдаун
+    def ready_all():
+        for enemy in sim.enemies:
+            enemy.move_timer = 0
+
+    record("update_enemies_ai", measure(sim.update_enemies_ai, ready_all, min_time))
+
+    # звичайний тік: більшість ворогів чекає кулдаун
+    record("tick", measure(sim.tick, None, min_time))
+
+    # гравець ходить туди-сюди (поле відстаней перераховується щокроку)
+    step = [1]
+
+    def move():
+        sim.try_move_or_attack(step[0], 0)
+        step[0] = -step[0]
+
+    record("try_move_or_attack", measure(move, None, min_time))
+
+    record("check_item_pickup", measure(sim.check_item_pickup, None, min_time))
+
+    # запити до карти: пачка випадкових клітинок за один замір
+    rng = random.Random(seed + 1)
+    probes = [(rng.randrange(width), rng.randrange(height)) for _ in range(1000)]
+    is_walkable = dungeon.is_walkable
+
+    def walkable_batch():
+        for x, y in probes:
+            is_walkable(x, y)
+
+    record("is_walkable_x1000", measure(walkable_batch, None, min_time))
+    record("find_enemy_positions", measure(dungeon.find_enemy_positions, None, min_time, 200))
+    record("find_item_positions", measure(dungeon.find_item_positions, None, min_time, 200))
+    record("fov_compute_uncached",
+           measure(lambda: sim.fov.compute(player.x, player.y, sim.chase_radius),
+                   sim.fov.clear_cache, min_time))
+    record("flow_field_compute",
+           measure(lambda: sim.flow_field.compute(player.x, player.y), None, min_time))
+
+    return results
+
+
+def run(sizes, counts, backend: str, min_time: float, seed: int):
+    results = {}
+    for size in sizes:
+        width, height = parse_size(size)
+        for count in counts:
+            # на дрібній карті десятки тисяч сутностей не влізуть — пропускаємо
+            if 2 * count > (width - 2) * (height - 2) // 2:
+                print(f"[INFO] Пропуск {size} n={count}: замало місця", file=sys.stderr)
+                continue
+            print(f"[INFO] {size} n={count} ...", file=sys.stderr)
+            results.update(bench_case(width, height, count, backend, min_time, seed))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк симуляції (JSON)")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="розміри карт WxH")
+    parser.add_argument("--counts", nargs="+", type=int, default=list(DEFAULT_COUNTS),
+                        help="кількість ворогів (і стільки ж предметів)")
+    parser.add_argument("--backend", default=settings.DUNGEON_BACKEND,
+                        help="бекенд DungeonMap: numpy або list")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="мінімум секунд на один замір")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="куди записати JSON (інакше stdout)")
+    parser.add_argument("--baseline", help="JSON попереднього запуску для порівняння")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="допустиме погіршення p50 (0.2 = +20%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.counts, args.backend, args.min_time, args.seed)
+    report = {
+        "benchmark": "simulation",
+        "environment": environment_info(),
+        "params": {
+            "sizes": args.sizes,
+            "counts": args.counts,
+            "backend": args.backend,
+            "min_time": args.min_time,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    write_report(report, args.output)
+
+    if args.baseline:
+        baseline = load_report(args.baseline).get("results", {})
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        print_regressions(regressions)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
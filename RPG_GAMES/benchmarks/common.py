@@ -0,0 +1,111 @@
+# benchmarks/common.py
+"""Спільне для бенчмарків: заміри, перцентилі, JSON-звіт і порівняння з baseline."""
+
+import json
+import os
+import sys
+import time
+
+# щоб `python benchmarks/xxx.py` бачив settings, model, view (як main.py)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def percentile(sorted_values, fraction: float):
+    """Перцентиль з уже відсортованого списку (найближчий ранг)."""
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def summarize(samples_ns):
+    """Статистика по замірах у наносекундах -> dict у мілісекундах + ops/sec."""
+    values = sorted(samples_ns)
+    total = sum(values)
+    return {
+        "iterations": len(values),
+        "ops_per_sec": (len(values) * 1e9 / total) if total else 0.0,
+        "mean_ms": (total / len(values) / 1e6) if values else 0.0,
+        "p50_ms": percentile(values, 0.50) / 1e6,
+        "p99_ms": percentile(values, 0.99) / 1e6,
+        "max_ms": (values[-1] / 1e6) if values else 0.0,
+    }
+
+
+def measure(func, setup=None, min_time: float = 0.2, max_iterations: int = 10000,
+            min_iterations: int = 5):
+    """Викликає func, поки не набереться min_time секунд (або max_iterations).
+
+    setup() (якщо є) викликається перед кожним заміром і в час не входить.
+    Повертає список часів одного виклику в наносекундах.
+    """
+    samples = []
+    clock = time.perf_counter_ns
+    deadline = time.perf_counter() + min_time
+    while len(samples) < max_iterations:
+        if setup is not None:
+            setup()
+        start = clock()
+        func()
+        samples.append(clock() - start)
+        if len(samples) >= min_iterations and time.perf_counter() >= deadline:
+            break
+    return samples
+
+
+def environment_info():
+    import platform
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def write_report(report: dict, path: str = None):
+    """JSON-звіт у файл або в stdout."""
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+def load_report(path: str):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float,
+                          metric: str = "p50_ms"):
+    """Порівнює results і baseline (dict name -> summary).
+
+    Регресія — якщо metric погіршився більш ніж на tolerance (0.2 = +20%).
+    Повертає список (name, old, new, ratio) для регресій.
+    """
+    regressions = []
+    for name, current in results.items():
+        old = baseline.get(name)
+        if old is None or metric not in old or metric not in current:
+            continue
+        if old[metric] <= 0:
+            continue
+        ratio = current[metric] / old[metric]
+        if ratio > 1.0 + tolerance:
+            regressions.append((name, old[metric], current[metric], ratio))
+    return regressions
+
+
+def print_regressions(regressions, metric: str = "p50_ms"):
+    if not regressions:
+        print("[INFO] Регресій відносно baseline немає", file=sys.stderr)
+        return
+    for name, old, new, ratio in regressions:
+        print(
+            f"[WARN] Регресія {name}: {metric} {old:.4f} -> {new:.4f} ({ratio:.2f}x)",
+            file=sys.stderr,
+        )
@@ -1,30 +1,47 @@
+import os
 import sys
+import time
+import random
 import pygame
 from enum import Enum, auto
-import random
+from functools import partial
 
 
 import settings
-from model.dungeon import DungeonMap
-from model.player import Player
-from model.enemy import Enemy
-from model.item import Item, ItemType, ItemRarity
+from model.simulation import Simulation
+from model import savegame
+from model.replay import Recorder, Replayer
+from model.generator import generate_level
+from model.chunked_dungeon import ChunkedDungeonMap
 from view.renderer import Renderer
+from view.camera import Camera
 from view.hud import HUD
 from view.menu import MainMenu
 from view.intro_screen import IntroScreen
+from view.loading_screen import LoadingScreen
+from view.perf_overlay import PerfOverlay
+from view.assets import assets
+from view.atlas import SpriteAtlas
 from .input import InputHandler
+from .loader import BackgroundLoader
+from .perf import FrameProfiler
 from pygame import mixer, mixer_music
 
 
 class GameState(Enum):
     MENU = auto()
     INTRO = auto()
+    LOADING = auto()
     PLAYING = auto()
 
 
+# подія від фонового завантажувача: «задача готова» — будить pygame.event.wait
+LOADER_EVENT = pygame.event.custom_type()
+
+
 class Game:
-    def __init__(self):
+    def __init__(self, replay=None):
+        """replay — Recording, який треба показати замість живої гри."""
         pygame.init()
         pygame.mixer.init()
 
@@ -43,93 +60,301 @@ class Game:
         # одразу включаємо музику меню
         self.play_menu_music()
 
-        self.doors_open = False
-
-
         # --- Меню та вступ ---
         self.menu = MainMenu(screen_w, screen_h)
         self.intro_screen = IntroScreen(screen_w, screen_h)
 
-        # --- Модель: карта, гравець, вороги, предмети ---
-        self.dungeon = DungeonMap(settings.LEVEL_MAP)
-        start_x, start_y = self.dungeon.find_player_start()
-        self.player = Player(start_x, start_y)
-
-        # Вороги
-        enemy_positions = self.dungeon.find_enemy_positions()
-        self.enemies = [Enemy(x, y) for x, y in enemy_positions]
-
-        # Предмети
-        self.items = []
-        for x, y, ch in self.dungeon.find_item_positions():
-            rarity = self.get_random_rarity()
-
-            if ch == "H":
-                heal_value = self.get_heal_value_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.HEAL, value=heal_value, rarity=rarity)
-                )
-
-            elif ch == "A":
-                atk_value = self.get_attack_value_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.ATTACK, value=atk_value, rarity=rarity)
-                )
-
-            elif ch == "W":
-                value, dur = self.get_weapon_stats_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.WEAPON, value=value,
-                         rarity=rarity, durability=dur)
-                )
-
-            elif ch == "R":
-                value, dur = self.get_armor_stats_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.ARMOR, value=value,
-                         rarity=rarity, durability=dur)
-                )
-
-        # --- Розрахунок TILE_SIZE під карту ---
-        tile_size = min(
-            screen_w // self.dungeon.width,
-            screen_h // self.dungeon.height
+        self.loading_screen = LoadingScreen(screen_w, screen_h)
+        self.screen_size = (screen_w, screen_h)
+
+        # --- Модель, спрайти і view готуються у фоні (submit_loading), поки видно меню ---
+        self.sim = None
+        self.loaded = False
+        self.pending_action = None    # що зробити, щойно завантаження закінчиться
+
+        # Controller
+        self.input_handler = InputHandler()
+
+        # --- Збереження: F5/F9 і фонове автозбереження ---
+        self.autosaver = savegame.AutoSaver(
+            settings.SAVE_PATH, settings.AUTOSAVE_INTERVAL_TICKS
         )
-        if tile_size <= 0:
-            tile_size = 32
+        self.game_in_progress = False   # є перервана (не завершена) гра в пам'яті
+        self.refresh_menu_options()
 
-        settings.TILE_SIZE = tile_size
+        # --- Запис / відтворення сесії ---
+        self.recorder = Recorder(settings.TICK_RATE) if settings.RECORD_PATH else None
+        self.replayer = None
 
-        map_w = self.dungeon.width * tile_size
-        map_h = self.dungeon.height * tile_size
+        self.clock = pygame.time.Clock()
+        self.running = True
 
-        offset_x = (screen_w - map_w) // 2
-        offset_y = (screen_h - map_h) // 2
+        # для dirty-rect режиму: що малювали минулого кадру
+        self.last_drawn_state = None
+
+        # що показано на статичному екрані (меню / вступ); None — показати заново
+        self.presented_idle_key = None
+
+        # --- Оверлей продуктивності (F3) і запис таймінгів кадрів у CSV (F4) ---
+        self.profiler = FrameProfiler(settings.PERF_HISTORY)
+        self.perf_overlay = PerfOverlay(budget_ms=1000.0 / (settings.FPS or 60))
+        self.show_perf_overlay = False
+
+        # --- Фонове завантаження ---
+        workers = settings.LOADER_WORKERS if settings.BACKGROUND_LOADING else 0
+        self.loader = BackgroundLoader(workers, wake=self.wake_main_loop)
+        self.submit_loading()
+        if not settings.BACKGROUND_LOADING:
+            self.wait_until_loaded()
+
+        if replay is not None:
+            self.run_when_loaded(partial(self.start_replay, replay))
+
+    # ---------- Стан моделі (живе в Simulation) ----------
+    @property
+    def dungeon(self):
+        return self.sim.dungeon
+
+    @property
+    def player(self):
+        return self.sim.player
+
+    @property
+    def enemies(self):
+        return self.sim.enemies
+
+    @property
+    def items(self):
+        return self.sim.items
+
+    @property
+    def doors_open(self):
+        return self.sim.doors_open
+
+    # ---------- Рівень ----------
+    def create_level(self):
+        """Карта для Simulation: ручна LEVEL_MAP або згенерована (settings.LEVEL_GENERATOR)."""
+        generator = settings.LEVEL_GENERATOR
+        if generator is None:
+            return settings.LEVEL_MAP
+
+        seed = settings.LEVEL_SEED
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        print(f"[INFO] Генерація рівня '{generator}', seed={seed}")
+
+        if generator == "bsp":
+            width, height = settings.GENERATED_LEVEL_SIZE
+            return generate_level(width, height, seed=seed)
+        if generator == "chunked":
+            width, height = settings.WORLD_SIZE
+            return ChunkedDungeonMap(width, height, seed=seed,
+                                     chunk_size=settings.WORLD_CHUNK_SIZE)
+
+        print(f"[WARN] Невідомий LEVEL_GENERATOR '{generator}' — беру LEVEL_MAP")
+        return settings.LEVEL_MAP
+
+    def create_simulation(self):
+        """Рівень + Simulation (без pygame — можна у фоновому потоці)."""
+        return Simulation(
+            self.create_level(),
+            dungeon_backend=settings.DUNGEON_BACKEND,
+            chase_radius=settings.ENEMY_CHASE_RADIUS,
+            tracking_radius=settings.ENEMY_TRACKING_RADIUS,
+            seed=settings.LEVEL_SEED,
+        )
+
+    def get_tile_size(self, dungeon) -> int:
+        """TILE_SIZE під карту: маленька вміщується на екран цілком; велика — фіксований тайл + камера."""
+        screen_w, screen_h = self.screen_size
+        tile_size = min(screen_w // dungeon.width, screen_h // dungeon.height)
+        if tile_size < settings.MIN_TILE_SIZE:
+            tile_size = settings.CAMERA_TILE_SIZE
+        return tile_size
+
+    # ---------- Фонове завантаження ----------
+    def submit_loading(self):
+        """Задачі завантажувача в порядку потреби: атлас, рівень, сітка атласу під тайл, PNG.
+
+        Декодування і генерація йдуть у робочих потоках; усе, що потребує
+        display (convert, Renderer), робить finish_loading у головному.
+        """
+        loader = self.loader
+        loader.submit("atlas", lambda: SpriteAtlas.load(settings.ATLAS_MANIFEST, settings.ASSET_CACHE_DIR),
+                      priority=0, label="Атлас спрайтів")
+        loader.submit("level", self.create_simulation, priority=1, label="Рівень", weight=3.0)
+        loader.submit("tiles", self.prefetch_tiles, priority=2, after=("atlas", "level"),
+                      label="Спрайти під розмір тайла", weight=2.0)
+        for i, path in enumerate(Renderer.sprite_files()):
+            loader.submit(f"sprite:{path}", partial(self.preload_sprite, path),
+                          priority=3 + i, after=("atlas",), label="Спрайти", weight=0.25)
+
+    def preload_sprite(self, path: str):
+        """Декодувати PNG, якого нема в атласі (робочий потік)."""
+        atlas = self.loader.result("atlas")
+        if atlas is not None and (atlas.has_sprite(path) or path in atlas.sheets):
+            return
+        assets.preload(path)
+
+    def prefetch_tiles(self):
+        """Прочитати з кешу (або побудувати) спрайти атласу під TILE_SIZE рівня (робочий потік)."""
+        atlas = self.loader.result("atlas")
+        sim = self.loader.result("level")
+        if atlas is not None and sim is not None:
+            atlas.prefetch(self.get_tile_size(sim.dungeon))
+
+    def wake_main_loop(self):
+        """Викликається з робочого потоку: розбудити run_idle_frame, щоб оновити прогрес."""
+        try:
+            pygame.event.post(pygame.event.Event(LOADER_EVENT))
+        except pygame.error:
+            pass     # pygame вже закрито (вихід під час завантаження)
+
+    def poll_loading(self):
+        """Головний потік: забрати готові задачі; коли все готово — зібрати гру."""
+        if self.loaded:
+            return
+        self.loader.poll()
+        if self.loader.is_done():
+            self.finish_loading()
+            return
+        fraction, label = self.loader.progress()
+        self.menu.set_progress(fraction, label)
+        self.loading_screen.set_progress(fraction, label)
+
+    def wait_until_loaded(self):
+        """Блокуюче завершення завантаження (без фону / headless)."""
+        self.loader.wait()
+        self.poll_loading()
+
+    def run_when_loaded(self, action):
+        """Виконати action зараз або (поки вантажиться) після екрана завантаження."""
+        if self.loaded:
+            action()
+            return
+        # те, що потрібне грі, — поперед решти черги
+        self.loader.prioritize(("level", "tiles"))
+        self.pending_action = action
+        self.state = GameState.LOADING
+
+    def finish_loading(self):
+        """Симуляція готова — створюємо камеру, HUD і Renderer (потребують display)."""
+        self.sim = self.loader.result("level")
+        if self.sim is None:
+            # генерація у фоні впала ([ERROR] вже надруковано) — ще раз, тут
+            self.sim = self.create_simulation()
+        self.sim.on_player_death = self.go_to_menu
+        self.sim.on_level_exit = self.go_to_menu
+
+        tile_size = self.get_tile_size(self.dungeon)
+        settings.TILE_SIZE = tile_size
+
+        screen_w, screen_h = self.screen_size
+        self.camera = Camera(
+            screen_w, screen_h,
+            self.dungeon.width, self.dungeon.height,
+            tile_size
+        )
+        self.camera.snap_to(self.player.x, self.player.y)
 
         # HUD та Renderer (для PLAYING)
         self.hud = HUD(self.player)
         self.hud.add_message("Ласкаво просимо до підземелля!")
+        self.sim.on_message = self.hud.add_message
+
+        # спрайти — із запеченого атласу, якщо він є
+        assets.use_atlas(self.loader.result("atlas"))
 
         self.renderer = Renderer(
             self.screen, self.dungeon, self.player,
             self.enemies, self.items,
-            self.hud, offset_x=offset_x, offset_y=offset_y
+            self.hud, self.camera,
+            enemy_index=self.sim.enemy_index, item_index=self.sim.item_index
         )
 
-        # Controller
-        self.input_handler = InputHandler()
+        self.loaded = True
+        self.loader.shutdown()
+        self.menu.set_progress(None)
+        if settings.PERF_OVERLAY:
+            self.toggle_perf_overlay()
 
-        self.clock = pygame.time.Clock()
-        self.running = True
+        action, self.pending_action = self.pending_action, None
+        if self.state == GameState.LOADING:
+            self.state = GameState.MENU
+        if action is not None:
+            action()
 
     # ---------- Головний цикл ----------
     def run(self):
+        """Фіксований крок: тіки симуляції з акумулятором, кадри — скільки встигаємо.
+
+        За кадр проганяємо стільки тіків по 1/TICK_RATE с, скільки набігло часу
+        (не більше MAX_CATCHUP_TICKS), а залишок (alpha) іде в інтерполяцію
+        позицій спрайтів між тіками.
+        """
+        tick_dt = 1.0 / settings.TICK_RATE
+        accumulator = 0.0
+        previous = time.perf_counter()
+
         while self.running:
+            if self.state != GameState.PLAYING:
+                # меню / вступ: чекаємо подій замість крутити кадри
+                self.run_idle_frame()
+                previous = time.perf_counter()
+                accumulator = 0.0
+                self.profiler.pause()
+                continue
+
+            # після гри меню / вступ треба буде показати заново
+            self.presented_idle_key = None
+
+            now = time.perf_counter()
+            frame_time = now - previous
+            previous = now
+            accumulator += frame_time
+
             self.handle_events()
-            self.update()
-            self.draw()  # <- малюємо через Game.draw, а не напряму Renderer.draw
+
+            ticks = 0
+            while accumulator >= tick_dt and ticks < settings.MAX_CATCHUP_TICKS:
+                self.update()
+                accumulator -= tick_dt
+                ticks += 1
+            if accumulator >= tick_dt:
+                # не встигаємо — відкидаємо відставання замість «спіралі смерті»
+                accumulator %= tick_dt
+
+            self.draw(accumulator / tick_dt, frame_time / tick_dt)
             self.clock.tick(settings.FPS)
 
+            if self.profiler.enabled:
+                self.profiler.end_frame(ticks, **self.get_frame_counts())
+
+    def run_idle_frame(self):
+        """Один «кадр» статичного екрана: показати, якщо щось змінилось, і спати до події."""
+        self.poll_loading()
+        if self.state == GameState.PLAYING:
+            return        # завантаження завершилось і відкладена дія запустила гру
+        key = self.get_idle_key()
+        if key != self.presented_idle_key:
+            self.draw()
+            self.presented_idle_key = key
+
+        event = pygame.event.wait(settings.IDLE_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return
+        self.handle_events([event] + pygame.event.get())
+
+    def get_idle_key(self):
+        """Що зараз на статичному екрані (для рішення, чи показувати кадр знову)."""
+        if self.state == GameState.MENU:
+            return self.state, self.menu.get_state_key()
+        if self.state == GameState.INTRO:
+            return self.state, self.intro_screen.get_state_key()
+        if self.state == GameState.LOADING:
+            return self.state, self.loading_screen.get_state_key()
+        return None
+
         # ---------- МУЗИКА ----------
     def play_menu_music(self):
         """Включити музику головного меню (по колу)."""
@@ -146,14 +371,33 @@ class Game:
 
     def go_to_menu(self):
         """Перехід у головне меню + включення музики."""
+        if self.state == GameState.PLAYING and not self.sim.game_over and self.replayer is None:
+            # вихід з гри в меню — автозбереження у фоні
+            self.autosaver.request(self.sim)
+        self.save_recording()
+        self.game_in_progress = self.state == GameState.PLAYING and not self.sim.game_over
         self.state = GameState.MENU
+        self.refresh_menu_options()
         self.play_menu_music()
+
+    def refresh_menu_options(self):
+        """«Продовжити» в меню — якщо є перервана гра або файл збереження."""
+        self.menu.set_continue_available(
+            self.game_in_progress or os.path.exists(settings.SAVE_PATH)
+        )
     # ---------- Обробка подій ----------
-    def handle_events(self):
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """Обробка подій (events — вже отримані події, інакше забираємо з черги)."""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            # вікно перекрили / розгорнули — статичний екран треба показати знову
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.presented_idle_key = None
+
             # спільне: вихід через хрестик
             if event.type == pygame.QUIT:
-                self.running = False
+                self.quit()
                 return
 
             # ESC
@@ -161,9 +405,13 @@ class Game:
                 if self.state == GameState.PLAYING:
                     # з гри → в меню
                     self.go_to_menu()
+                elif self.state == GameState.LOADING:
+                    # передумали чекати — назад у меню, завантаження йде далі
+                    self.pending_action = None
+                    self.state = GameState.MENU
                 else:
                     # з меню / інтро → вихід з гри
-                    self.running = False
+                    self.quit()
                 return
 
             # обробка по станах
@@ -171,7 +419,8 @@ class Game:
                 self.handle_menu_event(event)
             elif self.state == GameState.INTRO:
                 self.handle_intro_event(event)
-            elif self.state == GameState.PLAYING:
+            elif self.state == GameState.PLAYING and self.replayer is None:
+                # під час відтворення гравцем керує запис
                 self.input_handler.handle_event(event, self)
 
     def handle_menu_event(self, event):
@@ -184,238 +433,149 @@ class Game:
             self.menu.move_selection(1)
         elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
             option = self.menu.get_selected_option()
-            if option == "Нова гра":
-                self.start_new_game()
+            if option == "Продовжити":
+                self.run_when_loaded(self.continue_game)
+            elif option == "Нова гра":
+                # вступ не потребує рівня — він довантажується, поки гравець читає
+                self.stop_music()
+                self.loader.prioritize(("level", "tiles"))
                 self.state = GameState.INTRO
             elif option == "Вихід":
-                self.running = False
+                self.quit()
 
     def handle_intro_event(self, event):
-        # будь-яка клавіша → у гру
+        # будь-яка клавіша → у гру (через екран завантаження, якщо рівень ще не готовий)
         if event.type == pygame.KEYDOWN:
-            self.state = GameState.PLAYING
+            self.run_when_loaded(self.enter_new_game)
 
     # ---------- Ігрова логіка ----------
     def start_new_game(self):
         """Скидаємо стати, відновлюємо монстрів і предмети."""
         self.stop_music()
-        self.doors_open = False
-        self.renderer.doors_open = False
-        start_x, start_y = self.dungeon.find_player_start()
-        self.player.x = start_x
-        self.player.y = start_y
-        self.player.hp = self.player.max_hp
-        self.hud.messages.clear()
+        self.hud.clear_messages()
         self.hud.add_message("Ти прокинувся в підземеллі...")
 
-        # відновимо монстрів
-        self.enemies = [Enemy(x, y) for x, y in self.dungeon.find_enemy_positions()]
-        self.renderer.enemies = self.enemies
-
-        # відновимо предмети
-        self.items = []
-        for x, y, ch in self.dungeon.find_item_positions():
-            rarity = self.get_random_rarity()
-
-            if ch == "H":
-                heal_value = self.get_heal_value_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.HEAL, value=heal_value, rarity=rarity)
-                )
-
-            elif ch == "A":
-                atk_value = self.get_attack_value_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.ATTACK, value=atk_value, rarity=rarity)
-                )
-
-            elif ch == "W":
-                value, dur = self.get_weapon_stats_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.WEAPON, value=value,
-                         rarity=rarity, durability=dur)
-                )
-
-            elif ch == "R":
-                value, dur = self.get_armor_stats_by_rarity(rarity)
-                self.items.append(
-                    Item(x, y, ItemType.ARMOR, value=value,
-                         rarity=rarity, durability=dur)
-                )
+        self.replayer = None
+        self.sim.reset()
+        self.autosaver.reset(self.sim)
+        if self.recorder is not None:
+            self.recorder.start(self.sim)
 
+        # Simulation створила нові списки — оновлюємо посилання Renderer'а
+        self.renderer.doors_open = False
+        self.renderer.enemies = self.enemies
         self.renderer.items = self.items
+        self.camera.snap_to(self.player.x, self.player.y)
 
-    def get_random_rarity(self) -> ItemRarity:
-        """Випадкова рідкість з вагами."""
-        r = random.random()
-        if r < 0.6:
-            return ItemRarity.COMMON
-        elif r < 0.85:
-            return ItemRarity.UNCOMMON
-        elif r < 0.95:
-            return ItemRarity.RARE
-        else:
-            return ItemRarity.LEGENDARY
-
-    def get_weapon_stats_by_rarity(self, rarity: ItemRarity):
-        """Повертає (attack_bonus, durability) для зброї."""
-        if rarity == ItemRarity.COMMON:
-            return 1, 10
-        elif rarity == ItemRarity.UNCOMMON:
-            return 2, 15
-        elif rarity == ItemRarity.RARE:
-            return 3, 20
-        elif rarity == ItemRarity.LEGENDARY:
-            return 5, 30
-        return 1, 8
-
-    def get_armor_stats_by_rarity(self, rarity: ItemRarity):
-        """Повертає (defense_bonus, durability) для броні."""
-        if rarity == ItemRarity.COMMON:
-            return 1, 12
-        elif rarity == ItemRarity.UNCOMMON:
-            return 2, 18
-        elif rarity == ItemRarity.RARE:
-            return 3, 24
-        elif rarity == ItemRarity.LEGENDARY:
-            return 5, 35
-        return 1, 10
-
-    def get_heal_value_by_rarity(self, rarity: ItemRarity) -> int:
-        """Скільки HP відновлює зілля залежно від рідкості."""
-        if rarity == ItemRarity.COMMON:
-            return 5
-        elif rarity == ItemRarity.UNCOMMON:
-            return 10
-        elif rarity == ItemRarity.RARE:
-            return 15
-        elif rarity == ItemRarity.LEGENDARY:
-            return 20
-        return 5
-
-    def get_attack_value_by_rarity(self, rarity: ItemRarity) -> int:
-        """Скільки ATK дає зілля сили залежно від рідкості."""
-        if rarity == ItemRarity.COMMON:
-            return 1
-        elif rarity == ItemRarity.UNCOMMON:
-            return 2
-        elif rarity == ItemRarity.RARE:
-            return 3
-        elif rarity == ItemRarity.LEGENDARY:
-            return 5
-        return 1
+    def enter_new_game(self):
+        self.start_new_game()
+        self.state = GameState.PLAYING
 
+    def continue_game(self):
+        """Повернутись у перервану гру або завантажити збереження з диска."""
+        if self.game_in_progress or self.load_game():
+            self.stop_music()
+            self.state = GameState.PLAYING
 
-    def try_move_or_attack(self, dx: int, dy: int):
-        """Рух або атака по ворогу в напрямку."""
-        if self.state != GameState.PLAYING:
+    def quit(self):
+        """Вихід: дочекатися, поки автозбереження допише файл."""
+        self.running = False
+        self.loader.shutdown()
+        self.save_recording()
+        self.profiler.stop_csv()
+        if not self.autosaver.flush():
+            print("[WARN] Автозбереження не встигло завершитись до виходу")
+
+    # ---------- Збереження ----------
+    def save_game(self):
+        """Швидке збереження (F5) — у фоні, кадр не чекає на диск."""
+        if self.sim.game_over:
             return
-
-        new_x = self.player.x + dx
-        new_y = self.player.y + dy
-
-        if not self.dungeon.is_walkable(new_x, new_y):
+        self.autosaver.request(self.sim)
+        self.hud.add_message("Гру збережено.")
+
+    def load_game(self) -> bool:
+        """Завантаження (F9 / «Продовжити»). False — збереження нема або воно пошкоджене."""
+        # спершу дописуємо незавершене автозбереження, щоб не прочитати старий файл
+        self.autosaver.flush()
+        if not savegame.load_game(self.sim, settings.SAVE_PATH):
+            self.refresh_menu_options()
+            return False
+
+        self.replayer = None
+        # tick_count завантаженої гри може бути меншим за останній збережений
+        self.autosaver.reset(self.sim)
+        if self.recorder is not None:
+            # запис продовжується вже від завантаженого стану
+            self.recorder.start(self.sim)
+
+        self.bind_view()
+        self.hud.clear_messages()
+        self.hud.add_message("Гру завантажено.")
+        self.game_in_progress = True
+        return True
+
+    def bind_view(self):
+        """Simulation замінила карту і списки — оновлюємо посилання view."""
+        # карта іншого розміру (збереження / запис) — інший тайл, як у finish_loading
+        tile_size = self.get_tile_size(self.dungeon)
+        if tile_size != settings.TILE_SIZE:
+            settings.TILE_SIZE = tile_size
+            self.camera.tile_size = tile_size
+            self.renderer.load_sprites()
+            self.renderer.request_full_redraw()
+
+        self.renderer.dungeon = self.dungeon
+        self.renderer.invalidate_map_cache()
+        self.renderer.doors_open = self.doors_open
+        self.renderer.enemies = self.enemies
+        self.renderer.items = self.items
+        self.camera.map_w = self.dungeon.width
+        self.camera.map_h = self.dungeon.height
+        self.camera.snap_to(self.player.x, self.player.y)
+
+    # ---------- Запис / відтворення ----------
+    def save_recording(self):
+        """Записати поточну сесію у settings.RECORD_PATH (якщо запис увімкнено)."""
+        if self.recorder is None or not self.recorder.active:
             return
+        try:
+            self.recorder.save(self.sim, settings.RECORD_PATH)
+        except OSError as e:
+            print(f"[WARN] Не вдалося записати сесію: {e}")
+
+    def start_replay(self, recording):
+        """Показати запис: стан зі стартового знімка, далі дії по тіках."""
+        self.replayer = Replayer(recording, sim=self.sim)
+        self.autosaver.reset(self.sim)
+        self.bind_view()
+        self.hud.clear_messages()
+        self.hud.add_message("Відтворення запису...")
+        self.stop_music()
+        self.state = GameState.PLAYING
 
-        target_enemy = None
-        for enemy in self.enemies:
-            if enemy.is_alive() and enemy.x == new_x and enemy.y == new_y:
-                target_enemy = enemy
-                break
-
-        if target_enemy:
-            self.handle_combat(target_enemy)
+    def finish_replay(self):
+        result = self.replayer.diverged_at
+        if result is None:
+            print(f"[INFO] Запис відтворено до кінця ({self.sim.tick_count} тіків)")
         else:
-            # рух
-            self.player.move(dx, dy, self.dungeon)
-            # перевірка, чи наступив на предмет
-            self.check_item_pickup()
-            #перевірка, чи наступив на двері
-            self.check_exit_tile()
-
-    def handle_combat(self, enemy: Enemy):
-        """Гравець атакує ворога, ворог (якщо живий) б'є у відповідь."""
-        enemy.take_damage(self.player.attack)
-        self.hud.add_message("Ти вдарив монстра!")
-
-        # 🔹 знос зброї
-        if self.player.weapon is not None:
-            self.player.weapon.durability -= 1
-            if self.player.weapon.durability <= 0:
-                broken = self.player.weapon
-                self.player.attack -= broken.value
-                self.player.weapon = None
-                self.hud.add_message("Твоя зброя зламалася!")
-
-        if not enemy.is_alive():
-            self.hud.add_message("Монстр переможений!")
-            return
-
-        self.player.take_damage(enemy.attack)
-        self.hud.add_message("Монстр вдарив у відповідь!")
-
-        # 🔹 знос броні
-        if self.player.armor is not None:
-            self.player.armor.durability -= 1
-            if self.player.armor.durability <= 0:
-                broken = self.player.armor
-                self.player.defense -= broken.value
-                self.player.armor = None
-                self.hud.add_message("Твоя броня зламалася!")
-
-        if not self.player.is_alive():
-            self.hud.add_message("Ви загинули...")
-            self.go_to_menu()
-
-    def check_item_pickup(self):
-        """Перевіряє, чи на клітинці гравця є предмет, і кладе його в інвентар."""
-        inventory = self.player.inventory
-
-        for item in list(self.items):
-            if item.x == self.player.x and item.y == self.player.y:
-                if len(inventory) >= self.player.inventory_capacity:
-                    self.hud.add_message("Інвентар повний! Не можу підняти предмет.")
-                    continue
-
-                inventory.append(item)
-                self.items.remove(item)
-
-                from model.item import ItemType
-                if item.type == ItemType.HEAL:
-                    self.hud.add_message("Підібрано зілля лікування.")
-                elif item.type == ItemType.ATTACK:
-                    self.hud.add_message("Підібрано зілля сили.")
-                elif item.type == ItemType.WEAPON:
-                    self.hud.add_message("Підібрано зброю.")
-                elif item.type == ItemType.ARMOR:
-                    self.hud.add_message("Підібрано броню.")
-                else:
-                    self.hud.add_message("Підібрано предмет.")
-
-    def check_exit_tile(self):
-        """Якщо гравець стоїть на 'E' і двері відкриті — перехід до наступної локації."""
-        x = self.player.x
-        y = self.player.y
-
-        # перевірка меж
-        if y < 0 or y >= self.dungeon.height:
-            return
-        if x < 0 or x >= self.dungeon.width:
-            return
-
-        ch = self.dungeon.level_data[y][x]
-
-        if ch != "E":
-            return
+            print(f"[WARN] Відтворення розійшлося з записом на тіку {result}")
+        self.go_to_menu()
+        # далі можна грати з цього місця («Продовжити»)
+        self.replayer = None
 
-        if not self.doors_open:
-            self.hud.add_message("Двері зачинені. Спочатку переможи всіх монстрів.")
+    def try_move_or_attack(self, dx: int, dy: int):
+        """Рух або атака по ворогу в напрямку."""
+        if self.state != GameState.PLAYING:
             return
+        if self.recorder is not None:
+            self.recorder.record_move(self.sim, dx, dy)
+        self.sim.try_move_or_attack(dx, dy)
 
-        # 🔹 Тут поки що просто повертаємось в меню
-        self.hud.add_message("Ти проходиш крізь двері в наступну локацію!")
-        self.go_to_menu()
-
+    # ---------- ЛОГ ----------
+    def scroll_messages(self, delta: int):
+        """Гортання історії повідомлень (PageUp / PageDown)."""
+        self.hud.scroll_messages(delta)
 
     # ---------- ІНВЕНТАР ----------
     def toggle_inventory(self):
@@ -444,187 +604,125 @@ class Game:
 
     def use_selected_item(self):
         """Використати виділений у інвентарі предмет."""
-        inv = self.player.inventory
-        if not inv:
-            self.hud.add_message("Інвентар порожній.")
-            return
-
-        idx = self.hud.inventory_selected_index
-        if idx < 0 or idx >= len(inv):
-            return
-
-        item = inv[idx]
-        from model.item import ItemType
-
-        if item.type == ItemType.HEAL:
-            old_hp = self.player.hp
-            self.player.hp = min(self.player.max_hp, self.player.hp + item.value)
-            gained = self.player.hp - old_hp
-            if gained > 0:
-                self.hud.add_message(f"Використано зілля: +{gained} HP")
-            else:
-                self.hud.add_message("HP вже повне.")
-            del inv[idx]
-
-        elif item.type == ItemType.ATTACK:
-            self.player.attack += item.value
-            self.hud.add_message(f"Використано зілля сили: +{item.value} ATK")
-            del inv[idx]
-
-        elif item.type == ItemType.WEAPON:
-            self.player.equip_weapon(item)
-            self.hud.add_message(
-                f"Екіповано зброю (+{item.value} ATK, durability {item.durability})."
-            )
-            # зброю прибираємо з інвентарю, тепер вона в слоті weapon
-            del inv[idx]
-
-        elif item.type == ItemType.ARMOR:
-            self.player.equip_armor(item)
-            self.hud.add_message(
-                f"Екіповано броню (+{item.value} DEF, durability {item.durability})."
-            )
-            del inv[idx]
-
-        else:
-            self.hud.add_message("Нічого не сталося...")
+        if self.recorder is not None:
+            self.recorder.record_use_item(self.sim, self.hud.inventory_selected_index)
+        self.sim.use_item(self.hud.inventory_selected_index)
 
+        inv = self.player.inventory
         if self.hud.inventory_selected_index >= len(inv):
             self.hud.inventory_selected_index = max(0, len(inv) - 1)
 
-    def update_enemies_ai(self):
-        """Простий AI: скелети крокують до гравця.
-        Якщо хоч раз тебе побачили в радіусі — переслідують завжди.
-        """
-        for enemy in self.enemies:
-            if not enemy.is_alive():
-                continue
-
-            # чекаємо кулдаун руху
-            if enemy.move_timer > 0:
-                continue
-
-            enemy.move_timer = enemy.move_cooldown
-
-            dx = self.player.x - enemy.x
-            dy = self.player.y - enemy.y
-            dist = abs(dx) + abs(dy)
-
-            # радіус, з якого ВПЕРШЕ помічають гравця
-            chase_radius = 4  # твоє число тут
-
-            # 🔹 якщо ще не агро і гравець далеко — ігноримо
-            if not enemy.aggro and dist > chase_radius:
-                continue
-
-            # 🔹 якщо гравця хоч раз побачили в радіусі — запам’ятали
-            if dist <= chase_radius:
-                enemy.aggro = True
-
-            # якщо раптом опинились на тій самій клітинці
-            if dist == 0:
-                self.enemy_attack(enemy)
-                continue
-
-            # вибираємо напрямок кроку (до гравця)
-            step_x, step_y = 0, 0
-            if abs(dx) >= abs(dy) and dx != 0:
-                step_x = 1 if dx > 0 else -1
-            elif dy != 0:
-                step_y = 1 if dy > 0 else -1
-
-            target_x = enemy.x + step_x
-            target_y = enemy.y + step_y
-
-            # атака, якщо впритул заходить на клітинку гравця
-            if target_x == self.player.x and target_y == self.player.y:
-                self.enemy_attack(enemy)
-                continue
-
-            # не проходимо крізь стіни
-            if not self.dungeon.is_walkable(target_x, target_y):
-                continue
-
-            # не ліземо в іншого ворога
-            blocked = False
-            for other in self.enemies:
-                if other is enemy or not other.is_alive():
-                    continue
-                if other.x == target_x and other.y == target_y:
-                    blocked = True
-                    break
-            if blocked:
-                continue
-
-            # рухаємо ворога
-            enemy.x = target_x
-            enemy.y = target_y
-
-            # напрямок для анімації
-            if step_x > 0:
-                enemy.direction = "right"
-            elif step_x < 0:
-                enemy.direction = "left"
-            elif step_y > 0:
-                enemy.direction = "down"
-            elif step_y < 0:
-                enemy.direction = "up"
-
-            enemy.start_walk()
-
     def update(self):
+        """Один тік симуляції (викликається з run() з фіксованим кроком)."""
         if self.state != GameState.PLAYING:
             return
 
+        if self.replayer is not None:
+            # відтворення: дії і тіки беруться з запису
+            if not self.replayer.step():
+                self.finish_replay()
+            self.renderer.doors_open = self.sim.doors_open
+            return
+
         # 🔹 Якщо відкритий інвентар — гра "на паузі"
         if self.hud.show_inventory:
             return
 
-        # Звичайний апдейт, коли інвентар закритий
-        self.player.update()
-
-        for enemy in self.enemies:
-            enemy.update()
-
-        self.update_enemies_ai()
-        # 🔹 Якщо всі вороги мертві — відкриваємо двері
-        if not self.doors_open:
-            all_dead = True
-            for enemy in self.enemies:
-                if enemy.is_alive():
-                    all_dead = False
-                    break
-
-            if all_dead:
-                self.doors_open = True
-                self.renderer.doors_open = True
-                self.hud.add_message("Десь у підземеллі відчинилися двері...")
-
-
-    def enemy_attack(self, enemy: Enemy):
-        """Скелет б'є гравця, без зустрічного удару."""
-        self.player.take_damage(enemy.attack)
-        self.hud.add_message("Скелет вдарив тебе!")
-
-        if not self.player.is_alive():
-            self.hud.add_message("Ти загинув...")
-            self.go_to_menu()
+        # Звичайний тік світу, коли інвентар закритий
+        self.sim.tick()
+        self.renderer.doors_open = self.sim.doors_open
+        self.autosaver.maybe_save(self.sim)
+        if self.recorder is not None:
+            self.recorder.on_tick(self.sim)
 
     # ---------- Малювання ----------
-    def draw(self):
+    def draw(self, alpha: float = 1.0, frame_ticks: float = 1.0):
+        """Кадр: alpha — частка до наступного тіку, frame_ticks — тривалість кадру в тіках."""
         if self.state == GameState.MENU:
             self.menu.draw(self.screen)
         elif self.state == GameState.INTRO:
             self.intro_screen.draw(self.screen)
+        elif self.state == GameState.LOADING:
+            self.loading_screen.draw(self.screen)
         elif self.state == GameState.PLAYING:
-            self.renderer.draw()
-
-        pygame.display.flip()
-
-
-
-
-
-
-
+            if self.last_drawn_state != GameState.PLAYING:
+                # екран перемальовувало меню — фон треба відновити повністю
+                self.renderer.request_full_redraw()
+            self.last_drawn_state = self.state
+
+            self.renderer.set_interpolation(alpha, self.sim.tick_count, frame_ticks)
+            dirty_rects = self.renderer.draw()
+
+            if self.show_perf_overlay:
+                stats = self.get_frame_counts()
+                stats.update(assets.get_stats())
+                rect = self.perf_overlay.draw(self.screen, self.profiler, stats)
+                if dirty_rects is not None:
+                    # оверлей оновлюється щокадру, а під ним наступного кадру — відновлюємо фон
+                    dirty_rects.append(rect)
+                    self.renderer.invalidate_rect(rect)
+
+            self.present(dirty_rects)
+            return
 
+        self.last_drawn_state = self.state
+        self.present()
+
+    def present(self, dirty_rects=None):
+        """Показати кадр: flip або (dirty-rect режим) лише змінені прямокутники."""
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    # ---------- Продуктивність ----------
+    def get_frame_counts(self):
+        """Лічильники кадру для оверлею і CSV."""
+        return {
+            "enemies": self.sim.enemy_store.alive_count(),
+            "items": len(self.items),
+            "sprites": self.renderer.sprites_drawn,
+        }
+
+    def toggle_perf_overlay(self):
+        """F3: показати / сховати оверлей продуктивності."""
+        self.show_perf_overlay = not self.show_perf_overlay
+        if self.show_perf_overlay:
+            self.perf_overlay.reset()
+        else:
+            # прибрати оверлей з екрана (у dirty-режимі сам він не зітреться)
+            self.renderer.request_full_redraw()
+        self.sync_profiler()
+
+    def toggle_perf_csv(self):
+        """F4: почати / завершити запис таймінгів кожного кадру в CSV."""
+        if self.profiler.csv_active:
+            self.profiler.stop_csv()
+            self.hud.add_message("Запис таймінгів зупинено.")
+        else:
+            self.sync_profiler(force=True)
+            try:
+                self.profiler.start_csv(settings.PERF_CSV_PATH,
+                                        extra_fields=tuple(self.get_frame_counts()))
+            except OSError as e:
+                print(f"[WARN] Не вдалося відкрити {settings.PERF_CSV_PATH}: {e}")
+            else:
+                self.hud.add_message(f"Таймінги кадрів → {settings.PERF_CSV_PATH}")
+        self.sync_profiler()
+
+    def sync_profiler(self, force: bool = False):
+        """Профайлер працює (і обгортає методи), лише поки є оверлей або CSV."""
+        needed = force or self.show_perf_overlay or self.profiler.csv_active
+        if needed and not self.profiler.enabled:
+            targets = [
+                (self, "handle_events", "handle_events"),
+                (self, "update", "update"),
+                (self.sim, "update_enemies_ai", "update_enemies_ai"),
+                (self.renderer, "draw", "renderer_draw"),
+                (self.hud, "draw", "hud_draw"),
+                (self, "present", "flip"),
+                (self.perf_overlay, "draw", "overlay"),
+            ]
+            self.profiler.enable(targets)
+        elif not needed and self.profiler.enabled:
+            self.profiler.disable()
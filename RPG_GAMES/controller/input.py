@@ -9,7 +9,7 @@ class InputHandler:
     def handle_event(self, event, game):
         # Закриття вікна
         if event.type == pygame.QUIT:
-            game.running = False
+            game.quit()
             return
 
         if event.type != pygame.KEYDOWN:
@@ -26,6 +26,30 @@ class InputHandler:
             game.toggle_inventory()
             return
 
+        # F5 / F9 — швидке збереження / завантаження
+        if key == pygame.K_F5:
+            game.save_game()
+            return
+        if key == pygame.K_F9:
+            game.load_game()
+            return
+
+        # F3 — оверлей продуктивності, F4 — запис таймінгів кадрів у CSV
+        if key == pygame.K_F3:
+            game.toggle_perf_overlay()
+            return
+        if key == pygame.K_F4:
+            game.toggle_perf_csv()
+            return
+
+        # PageUp / PageDown — гортати лог повідомлень
+        if key == pygame.K_PAGEUP:
+            game.scroll_messages(1)
+            return
+        if key == pygame.K_PAGEDOWN:
+            game.scroll_messages(-1)
+            return
+
         # Якщо інвентар відкритий — працюємо тільки з ним
         if game.hud.show_inventory:
             if key in (pygame.K_UP, pygame.K_w):
@@ -42,7 +66,7 @@ class InputHandler:
         # Якщо інвентар закритий — звичайний рух / ESC
         if key == pygame.K_ESCAPE:
             # можна буде зробити паузу, поки просто вихід з гри
-            game.running = False
+            game.quit()
             return
 
         dx, dy = 0, 0
@@ -0,0 +1,206 @@
+# controller/loader.py
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+
+class LoadTask:
+    """Одна задача завантаження: fn виконується у робочому потоці, on_done — у головному."""
+
+    __slots__ = ("name", "fn", "priority", "after", "on_done", "label", "weight",
+                 "state", "result", "error", "seconds")
+
+    def __init__(self, name, fn, priority, after, on_done, label, weight):
+        self.name = name
+        self.fn = fn
+        self.priority = priority
+        self.after = tuple(after)
+        self.on_done = on_done
+        self.label = label or name
+        self.weight = weight
+        self.state = "waiting"      # waiting → queued → running → done / failed
+        self.result = None
+        self.error = None
+        self.seconds = 0.0
+
+
+class BackgroundLoader:
+    """Пул потоків для завантаження з пріоритетами і залежностями.
+
+    Менший priority — раніше. Задача стає в чергу, коли виконані всі after.
+    prioritize() піднімає задачі (разом з їхніми залежностями), які потрібні
+    наступному екрану. Результати забирає головний потік у poll(): там же
+    викликаються on_done (усе, що чіпає display / pygame-стан гри).
+
+    workers=0 — без потоків: задачі виконуються в wait() у головному потоці.
+    wake — викликається з робочого потоку після кожної задачі (напр. post події,
+    щоб головний цикл прокинувся з pygame.event.wait).
+    """
+
+    def __init__(self, workers: int = 2, wake=None):
+        self.tasks = {}
+        self._heap = []                  # (priority, seq, name) — із «лінивим» видаленням
+        self._seq = itertools.count()
+        self._finished = deque()         # задачі, чиї on_done ще не викликані
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._wake = wake
+        self._closed = False
+
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"loader-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ---------- задачі ----------
+
+    def submit(self, name: str, fn, priority: int = 10, after=(), on_done=None,
+               label: str = None, weight: float = 1.0):
+        """Додати задачу. fn() — без аргументів (результати залежностей — через result())."""
+        with self._lock:
+            if name in self.tasks:
+                raise ValueError(f"задача '{name}' вже є")
+            task = LoadTask(name, fn, priority, after, on_done, label, weight)
+            self.tasks[name] = task
+            self._enqueue_if_ready(task)
+            self._cond.notify_all()
+        return task
+
+    def prioritize(self, names, priority: int = 0):
+        """Піднять пріоритет задач names і всього, від чого вони залежать."""
+        with self._lock:
+            stack = list(names)
+            while stack:
+                task = self.tasks.get(stack.pop())
+                if task is None or task.priority <= priority:
+                    continue
+                task.priority = priority
+                stack.extend(task.after)
+                if task.state == "queued":
+                    # старий запис у купі лишається — worker пропустить його як дубль
+                    heapq.heappush(self._heap, (priority, next(self._seq), task.name))
+            self._cond.notify_all()
+
+    def result(self, name: str):
+        """Результат виконаної задачі (None — ще не готова або впала)."""
+        task = self.tasks.get(name)
+        return task.result if task is not None and task.state == "done" else None
+
+    def is_done(self, names=None) -> bool:
+        """Чи виконані (і оброблені в poll) задачі names (None — усі)."""
+        tasks = self.tasks.values() if names is None else (self.tasks[n] for n in names)
+        with self._lock:
+            return not self._finished and all(t.state in ("done", "failed") for t in tasks)
+
+    def progress(self):
+        """(частка 0..1 за вагами, підпис поточної задачі)."""
+        with self._lock:
+            total = sum(t.weight for t in self.tasks.values())
+            done = sum(t.weight for t in self.tasks.values() if t.state in ("done", "failed"))
+            running = [t for t in self.tasks.values() if t.state != "done" and t.state != "failed"]
+        label = min(running, key=lambda t: t.priority).label if running else ""
+        return (done / total if total else 1.0), label
+
+    # ---------- головний потік ----------
+
+    def poll(self) -> int:
+        """Викликати on_done для всіх завершених задач; повертає їх кількість."""
+        count = 0
+        while True:
+            with self._lock:
+                if not self._finished:
+                    return count
+                task = self._finished.popleft()
+            count += 1
+            if task.state == "failed":
+                print(f"[ERROR] Завантаження '{task.name}' не вдалося: {task.error!r}")
+            if task.on_done is not None:
+                task.on_done(task)
+
+    def wait(self, names=None, timeout: float = None) -> bool:
+        """Блокуюче очікування задач (для headless-запуску і коли показати нічого)."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            self.poll()
+            if self.is_done(names):
+                return True
+            if not self._threads:
+                self._run_next()
+                continue
+            with self._lock:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return False
+                if not self._finished:
+                    self._cond.wait(0.05 if remaining is None else min(0.05, remaining))
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            self._cond.notify_all()
+
+    # ---------- внутрішнє ----------
+
+    def _enqueue_if_ready(self, task):
+        """Під self._lock: waiting → queued, якщо всі залежності виконані."""
+        if task.state != "waiting":
+            return
+        for dep in task.after:
+            dep_task = self.tasks.get(dep)
+            if dep_task is None or dep_task.state not in ("done", "failed"):
+                return
+        task.state = "queued"
+        heapq.heappush(self._heap, (task.priority, next(self._seq), task.name))
+
+    def _take(self):
+        """Під self._lock: наступна задача з купи (пропускаючи дублі) або None."""
+        while self._heap:
+            priority, _, name = heapq.heappop(self._heap)
+            task = self.tasks[name]
+            if task.state == "queued" and task.priority == priority:
+                task.state = "running"
+                return task
+        return None
+
+    def _execute(self, task):
+        start = time.perf_counter()
+        try:
+            result = task.fn()
+            error = None
+        except Exception as e:
+            result, error = None, e
+        with self._lock:
+            task.seconds = time.perf_counter() - start
+            task.result = result
+            task.error = error
+            task.state = "failed" if error is not None else "done"
+            self._finished.append(task)
+            for other in self.tasks.values():
+                if task.name in other.after:
+                    self._enqueue_if_ready(other)
+            self._cond.notify_all()
+        if self._wake is not None:
+            self._wake()
+
+    def _run_next(self):
+        with self._lock:
+            task = self._take()
+        if task is None:
+            raise RuntimeError("задачі завантаження чекають на залежність, якої нема")
+        self._execute(task)
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                task = self._take()
+                while task is None and not self._closed:
+                    self._cond.wait()
+                    task = self._take()
+                if task is None:
+                    return
+            self._execute(task)
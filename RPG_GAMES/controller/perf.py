@@ -0,0 +1,156 @@
+# controller/perf.py
+
+import csv
+import os
+import time
+from collections import deque
+
+
+# фази кадру Game.run у порядку показу; вкладені (рахуються і всередині батьківської):
+#   update_enemies_ai ⊂ update,  hud_draw ⊂ renderer_draw
+PHASES = (
+    "handle_events", "update", "update_enemies_ai",
+    "renderer_draw", "hud_draw", "overlay", "flip",
+)
+NESTED_IN = {"update_enemies_ai": "update", "hud_draw": "renderer_draw"}
+
+
+class FrameProfiler:
+    """Час кожної фази кадру + історія останніх кадрів (для оверлею і CSV).
+
+    Методи, які треба міряти, обгортаються на конкретних об'єктах (instrument),
+    тож поки профайлер вимкнений, гра не платить нічого — обгорток просто нема.
+    """
+
+    phases = PHASES
+    nested_in = NESTED_IN
+
+    def __init__(self, history: int = 240):
+        self.enabled = False
+        self.history = deque(maxlen=history)   # dict на кадр (див. end_frame)
+        self.frame_index = 0
+
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._frame_start = None
+        self._t0 = 0.0
+        self._wrapped = []          # (об'єкт, назва атрибута)
+
+        self._csv_file = None
+        self._csv_writer = None
+        self.csv_path = None
+
+    # ---------- обгортки ----------
+
+    def instrument(self, obj, attr: str, phase: str):
+        """Міряти кожен виклик obj.attr() як фазу phase (поки не викликано restore)."""
+        original = getattr(obj, attr)
+        current = self._current
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                current[phase] += perf_counter() - start
+
+        setattr(obj, attr, timed)
+        self._wrapped.append((obj, attr))
+
+    def restore(self):
+        """Прибрати всі обгортки (атрибут екземпляра знову веде на метод класу)."""
+        for obj, attr in self._wrapped:
+            obj.__dict__.pop(attr, None)
+        self._wrapped.clear()
+
+    def enable(self, targets):
+        """targets — [(об'єкт, атрибут, фаза), ...]."""
+        if self.enabled:
+            return
+        for obj, attr, phase in targets:
+            self.instrument(obj, attr, phase)
+        self.enabled = True
+        self._frame_start = None
+        self._t0 = time.perf_counter()
+
+    def disable(self):
+        self.stop_csv()
+        self.restore()
+        self.enabled = False
+
+    # ---------- кадри ----------
+
+    def pause(self):
+        """Гра не малює кадри (меню): наступний кадр почне відлік заново."""
+        self._frame_start = None
+
+    def end_frame(self, ticks: int = 0, **counts):
+        """Закрити кадр: записати фази, тривалість і лічильники (counts — напр. enemies=...)."""
+        now = time.perf_counter()
+        if self._frame_start is None:
+            # перший кадр після ввімкнення — лише точка відліку
+            self._frame_start = now
+            self._current.update(dict.fromkeys(PHASES, 0.0))
+            return
+
+        sample = {name: value * 1000.0 for name, value in self._current.items()}
+        sample["frame"] = self.frame_index
+        sample["time"] = now - self._t0      # секунди від увімкнення
+        sample["frame_ms"] = (now - self._frame_start) * 1000.0
+        sample["ticks"] = ticks
+        sample.update(counts)
+
+        self.history.append(sample)
+        self.frame_index += 1
+        self._frame_start = now
+        for name in PHASES:
+            self._current[name] = 0.0
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(sample)
+
+    def get_fps(self) -> float:
+        """Середній FPS за історію."""
+        if not self.history:
+            return 0.0
+        total = sum(s["frame_ms"] for s in self.history)
+        return 1000.0 * len(self.history) / total if total > 0 else 0.0
+
+    def get_averages(self, frames: int = 60) -> dict:
+        """Середній час фаз (мс) за останні frames кадрів."""
+        recent = list(self.history)[-frames:]
+        if not recent:
+            return {}
+        keys = PHASES + ("frame_ms",)
+        return {k: sum(s[k] for s in recent) / len(recent) for k in keys}
+
+    def get_worst(self, frames: int = 60):
+        """Найдовший з останніх frames кадрів (або None)."""
+        recent = list(self.history)[-frames:]
+        return max(recent, key=lambda s: s["frame_ms"]) if recent else None
+
+    # ---------- CSV ----------
+
+    @property
+    def csv_active(self) -> bool:
+        return self._csv_writer is not None
+
+    def start_csv(self, path: str, extra_fields=()):
+        """Писати кожен кадр рядком у CSV (мс; extra_fields — ключі counts з end_frame)."""
+        self.stop_csv()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        fields = ["frame", "time", "frame_ms", "ticks", *PHASES, *extra_fields]
+        self._csv_file = open(path, "w", newline="", encoding="utf-8")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=fields,
+                                          extrasaction="ignore")
+        self._csv_writer.writeheader()
+        self.csv_path = path
+
+    def stop_csv(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            print(f"[INFO] Таймінги кадрів записано: {self.csv_path}")
+        self._csv_file = None
+        self._csv_writer = None
@@ -0,0 +1,172 @@
+# controller/sampler.py
+
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class SamplingProfiler:
+    """Семплувальний профайлер головного потоку: раз на interval секунд — знімок стеку.
+
+    На відміну від cProfile, гра не обгортається нічим — кожен семпл коштує
+    один прохід по кадрах стеку (мікросекунди), тож його можна тримати
+    ввімкненим на staging. Результат — collapsed stacks
+    ("main;run;draw;_draw_full 42"), які їдять flamegraph.pl, speedscope,
+    inferno тощо.
+
+    Де є setitimer (Linux / macOS), семпли бере обробник SIGALRM прямо в
+    головному потоці: потік-семплер отримує GIL лише тоді, коли головний
+    його відпускає (хешування, I/O, flip), і тому бачив би переважно ці місця.
+    Якщо сигнал прийшов, поки головний потік сидів у довгому C-виклику
+    (clock.tick, event.wait), семпл зараховується з вагою пропущених періодів.
+    Інакше (Windows) — окремий потік з sys._current_frames().
+    """
+
+    def __init__(self, path: str, interval: float = 0.005, thread_id: int = None):
+        self.path = path
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+
+        self.samples = 0
+        self._stacks = Counter()     # кортеж кодів (корінь → лист) -> кількість семплів
+        self._labels = {}            # code object -> "функція (файл:рядок)"
+        self._stop = threading.Event()
+        self._thread = None
+        self._signal_mode = False
+        self._prev_handler = None
+        self._last_sample = 0.0
+        self._root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # ---------- керування ----------
+
+    def start(self):
+        if self._thread is not None or self._signal_mode:
+            return
+        if (hasattr(signal, "setitimer")
+                and threading.current_thread() is threading.main_thread()
+                and self.thread_id == threading.get_ident()):
+            self._prev_handler = signal.signal(signal.SIGALRM, self._on_signal)
+            signal.siginterrupt(signal.SIGALRM, False)   # не рвати системні виклики (EINTR)
+            self._last_sample = time.perf_counter()
+            signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+            self._signal_mode = True
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Зупинити семплування і записати файл."""
+        if self._signal_mode:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._prev_handler or signal.SIG_DFL)
+            self._signal_mode = False
+        elif self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        else:
+            return
+        try:
+            self.write(self.path)
+        except OSError as e:
+            print(f"[WARN] Не вдалося записати профіль {self.path}: {e}")
+            return
+        print(f"[INFO] Профіль: {self.samples} семплів → {self.path}")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    # ---------- семплування ----------
+
+    def _record(self, frame, weight: int = 1):
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        self._stacks[tuple(codes)] += weight
+        self.samples += weight
+
+    def _on_signal(self, signum, frame):
+        now = time.perf_counter()
+        # один сигнал за довгий C-виклик «ковтає» кілька періодів — враховуємо їх вагою
+        weight = max(1, int((now - self._last_sample) / self.interval + 0.5))
+        self._last_sample = now
+        self._record(frame, weight)
+
+    def _run(self):
+        interval = self.interval
+        stop = self._stop
+        current_frames = sys._current_frames
+        tid = self.thread_id
+
+        next_time = time.perf_counter()
+        while not stop.is_set():
+            frame = current_frames().get(tid)
+            if frame is None:
+                break            # головний потік завершився
+            self._record(frame)
+            del frame
+
+            # фіксований темп без накопичення дрейфу; якщо відстали — не доганяємо пачкою
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay < 0:
+                next_time = time.perf_counter()
+                delay = 0
+            stop.wait(delay)
+
+    # ---------- вивід ----------
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(self._root):
+                filename = os.path.relpath(filename, self._root)
+            else:
+                filename = os.path.basename(filename)
+            # ";" розділяє кадри в collapsed-форматі
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def get_collapsed(self):
+        """Рядки collapsed stacks: "корінь;...;лист кількість", найчастіші першими."""
+        merged = Counter()
+        for codes, count in self._stacks.items():
+            merged[";".join(self._label(c) for c in reversed(codes))] += count
+        return [f"{stack} {count}" for stack, count in merged.most_common()]
+
+    def write(self, path: str):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.get_collapsed():
+                f.write(line + "\n")
+
+
+def sampler_from_env(path: str = None, interval_ms: float = None):
+    """SamplingProfiler з аргументів або змінних оточення (None — профайлер вимкнений).
+
+    RPG_PROFILE=<файл> вмикає, RPG_PROFILE_INTERVAL_MS — період семплування (мс).
+    """
+    path = path or os.environ.get("RPG_PROFILE")
+    if not path:
+        return None
+    if interval_ms is None:
+        try:
+            interval_ms = float(os.environ.get("RPG_PROFILE_INTERVAL_MS", 5))
+        except ValueError:
+            print("[WARN] RPG_PROFILE_INTERVAL_MS має бути числом — беру 5 мс")
+            interval_ms = 5.0
+    return SamplingProfiler(path, interval=max(0.0005, interval_ms / 1000.0))
@@ -1,10 +1,71 @@
-from controller.game import Game
+import argparse
+import sys
+from contextlib import nullcontext
+
+from controller.sampler import sampler_from_env
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Dungeon of Lost Memories")
+    parser.add_argument("--record", metavar="FILE",
+                        help="записувати сесію у файл (для відтворення)")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="відтворити записану сесію")
+    parser.add_argument("--fast", action="store_true",
+                        help="з --replay: без вікна і без пауз, так швидко, як дозволяє CPU")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="семплувати стек головного потоку і записати collapsed stacks "
+                             "(те саме, що RPG_PROFILE=FILE)")
+    parser.add_argument("--profile-interval", metavar="MS", type=float,
+                        help="період семплування в мс (типово 5, або RPG_PROFILE_INTERVAL_MS)")
+    return parser.parse_args()
+
+
+def run_fast_replay(recording) -> int:
+    """Headless-відтворення з перевіркою хешів; код виходу 1 — прогін розійшовся."""
+    import settings
+    from model.replay import Replayer
+
+    result = Replayer(recording, dungeon_backend=settings.DUNGEON_BACKEND).run()
+    print(f"[INFO] Тіків: {result['ticks']} за {result['seconds']:.3f} с "
+          f"({result['ticks_per_sec']:.0f} тіків/с)")
+    if result["diverged_at"] is not None:
+        print(f"[ERROR] Розбіжність зі записом на тіку {result['diverged_at']}")
+        return 1
+    if not result["final_match"]:
+        print("[ERROR] Кінцевий стан не збігається з записом")
+        return 1
+    print("[INFO] Відтворення збігається з записом")
+    return 0
 
 
 def main():
-    game = Game()
-    game.run()
+    args = parse_args()
+    sampler = sampler_from_env(args.profile, args.profile_interval)
+
+    recording = None
+    if args.replay:
+        from model.replay import Recording
+        from model.savegame import SaveError
+        try:
+            recording = Recording.load(args.replay)
+        except (OSError, SaveError) as e:
+            print(f"[ERROR] Не вдалося прочитати запис {args.replay}: {e}")
+            sys.exit(2)
+        if args.fast:
+            with sampler or nullcontext():
+                code = run_fast_replay(recording)
+            sys.exit(code)
+
+    if args.record:
+        import settings
+        settings.RECORD_PATH = args.record
+
+    from controller.game import Game
+    game = Game(replay=recording)
+    with sampler or nullcontext():
+        game.run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
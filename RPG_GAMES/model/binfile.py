@@ -0,0 +1,130 @@
+# model/binfile.py
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy — необов'язкова залежність
+    np = None
+
+
+# Спільний контейнер для бінарних файлів гри (збереження, записи сесій):
+#   MAGIC (8 байт) | version u16 | довжина payload u32 | crc32 payload u32 | zlib(payload)
+# payload пишеться Writer'ом і читається Reader'ом, усе little-endian.
+HEADER = struct.Struct("<8sHII")
+
+_NP_DTYPES = {"I": "<u4", "i": "<i4", "h": "<i2", "B": "u1"}
+
+
+class SaveError(ValueError):
+    """Файл пошкоджений або несумісної версії."""
+
+
+# ---------- payload ----------
+
+class Writer:
+    def __init__(self):
+        self._parts = []
+
+    def pack(self, fmt: str, *values):
+        self._parts.append(struct.pack("<" + fmt, *values))
+
+    def blob(self, data: bytes):
+        self.pack("I", len(data))
+        self._parts.append(bytes(data))
+
+    def column(self, values, code: str):
+        """Масив чисел одного типу (numpy-масив або будь-яка послідовність)."""
+        if np is not None and isinstance(values, np.ndarray):
+            data = values.astype(_NP_DTYPES[code]).tobytes()
+        else:
+            arr = array(code, values)
+            if sys.byteorder == "big":
+                arr.byteswap()
+            data = arr.tobytes()
+        self._parts.append(data)
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._parts)
+
+
+class Reader:
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._pos = 0
+
+    def unpack(self, fmt: str):
+        fmt = "<" + fmt
+        size = struct.calcsize(fmt)
+        if self._pos + size > len(self._data):
+            raise SaveError("несподіваний кінець файлу")
+        values = struct.unpack_from(fmt, self._data, self._pos)
+        self._pos += size
+        return values if len(values) > 1 else values[0]
+
+    def blob(self) -> bytes:
+        size = self.unpack("I")
+        data = self._data[self._pos:self._pos + size]
+        if len(data) != size:
+            raise SaveError("несподіваний кінець файлу")
+        self._pos += size
+        return bytes(data)
+
+    def column(self, code: str, count: int):
+        """numpy-масив (без копії) або array.array з count чисел типу code."""
+        size = array(code).itemsize * count
+        data = self._data[self._pos:self._pos + size]
+        if len(data) != size:
+            raise SaveError("несподіваний кінець файлу")
+        self._pos += size
+        if np is not None:
+            return np.frombuffer(data, dtype=_NP_DTYPES[code], count=count)
+        arr = array(code)
+        arr.frombytes(data)
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr
+
+
+# ---------- контейнер ----------
+
+def encode(payload: bytes, magic: bytes, version: int, level: int = 6) -> bytes:
+    """Заголовок + стиснений payload — готовий вміст файлу."""
+    return HEADER.pack(magic, version, len(payload), zlib.crc32(payload)) + \
+        zlib.compress(payload, level)
+
+
+def decode(data: bytes, magic: bytes, version: int, kind: str = "файл") -> bytes:
+    """Перевіряє заголовок (magic, версія не новіша за version) і повертає payload.
+
+    kind — що це за файл, для тексту помилок ("збереження", "запису").
+    """
+    if len(data) < HEADER.size:
+        raise SaveError(f"файл {kind} закороткий")
+    file_magic, file_version, size, crc = HEADER.unpack_from(data)
+    if file_magic != magic:
+        raise SaveError(f"це не файл {kind}")
+    if file_version > version:
+        raise SaveError(f"файл {kind} версії {file_version} новіший за гру ({version})")
+    try:
+        payload = zlib.decompress(data[HEADER.size:])
+    except zlib.error as e:
+        raise SaveError(f"пошкоджені дані: {e}")
+    if len(payload) != size or zlib.crc32(payload) != crc:
+        raise SaveError("контрольна сума не збігається")
+    return payload
+
+
+def write_file(path: str, data: bytes):
+    """Атомарний запис: спершу тимчасовий файл, потім заміна."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,190 @@
+# model/chunked_dungeon.py
+
+import random
+
+from .dungeon import DungeonMap
+from .generator import BSPGenerator
+
+
+class _LazyRow:
+    """Рядок y світу: row[x] генерує потрібний чанк за потреби."""
+
+    __slots__ = ("_world", "_y")
+
+    def __init__(self, world, y: int):
+        self._world = world
+        self._y = y
+
+    def __getitem__(self, x: int) -> str:
+        return self._world.get_tile(x, self._y)
+
+    def __len__(self):
+        return self._world.width
+
+
+class _LazyRows:
+    """Замінник level_data: level_data[y][x] працює, як зі списком рядків."""
+
+    __slots__ = ("_world",)
+
+    def __init__(self, world):
+        self._world = world
+
+    def __getitem__(self, y: int):
+        return _LazyRow(self._world, y)
+
+    def __len__(self):
+        return self._world.height
+
+
+class ChunkedDungeonMap(DungeonMap):
+    """Дуже великий світ, що генерується чанками chunk_size x chunk_size.
+
+    Кожен чанк — окремий BSP-рівень із seed'у (seed, cx, cy), тож його можна
+    викинути і потім згенерувати знову точно таким самим. Сусідні чанки
+    з'єднані «воротами» на спільному краї: позицію воріт обидва чанки
+    рахують з того самого seed'у краю і прорубують до них коридори.
+
+    Чанки навколо гравця (keep_radius) — активні: їхні M і предмети
+    Simulation перетворює на сутності. Решта викидається в ensure_loaded().
+    P — у чанку (0, 0), E — в останньому чанку світу.
+    Розміри світу округлюються вгору до кратних chunk_size.
+    """
+
+    def __init__(self, width: int, height: int, seed: int = 0,
+                 chunk_size: int = 64, keep_radius: int = 2, generator=None):
+        self.chunk_size = chunk_size
+        self.chunks_x = max(1, -(-width // chunk_size))
+        self.chunks_y = max(1, -(-height // chunk_size))
+        self.width = self.chunks_x * chunk_size
+        self.height = self.chunks_y * chunk_size
+        self.level_data = _LazyRows(self)
+
+        self.seed = seed
+        self.keep_radius = keep_radius
+        self.generator = generator or BSPGenerator()
+
+        self._chunks = {}          # (cx, cy) -> список рядків чанка
+        self._active = set()       # чанки, чиї сутності зараз у Simulation
+        self._center = None        # чанк гравця при останньому ensure_loaded
+        self.generated = 0         # скільки разів генерували чанки (статистика)
+
+    # ---------- чанки ----------
+
+    def chunk_of(self, x: int, y: int):
+        return x // self.chunk_size, y // self.chunk_size
+
+    def get_chunk(self, cx: int, cy: int):
+        """Рядки чанка (генеруються при першому зверненні)."""
+        rows = self._chunks.get((cx, cy))
+        if rows is None:
+            rows = self._generate_chunk(cx, cy)
+            self._chunks[(cx, cy)] = rows
+        return rows
+
+    def _edge_offset(self, kind: str, cx: int, cy: int) -> int:
+        """Позиція воріт на краю (однакова для обох чанків, що його ділять)."""
+        rng = random.Random(f"{self.seed}:{kind}:{cx}:{cy}")
+        return rng.randint(2, self.chunk_size - 3)
+
+    def _generate_chunk(self, cx: int, cy: int):
+        size = self.chunk_size
+        last = size - 1
+        gates = []
+        if cx + 1 < self.chunks_x:
+            gates.append((last, self._edge_offset("e", cx, cy)))
+        if cx > 0:
+            gates.append((0, self._edge_offset("e", cx - 1, cy)))
+        if cy + 1 < self.chunks_y:
+            gates.append((self._edge_offset("s", cx, cy), last))
+        if cy > 0:
+            gates.append((self._edge_offset("s", cx, cy - 1), 0))
+
+        self.generated += 1
+        return self.generator.generate(
+            size, size,
+            place_player=(cx, cy) == (0, 0),
+            place_exit=(cx, cy) == (self.chunks_x - 1, self.chunks_y - 1),
+            gates=gates,
+            seed=f"{self.seed}:{cx}:{cy}",
+        )
+
+    def ensure_loaded(self, x: int, y: int):
+        """Активує чанки в keep_radius навколо (x, y), решту викидає.
+
+        Повертає (нові_активні, деактивовані) — списки (cx, cy), щоб Simulation
+        додала / прибрала сутності цих чанків. Поки гравець у тому ж чанку —
+        нічого не робить.
+        """
+        center = self.chunk_of(x, y)
+        if center == self._center:
+            return [], []
+        self._center = center
+
+        r = self.keep_radius
+        wanted = {
+            (cx, cy)
+            for cy in range(max(0, center[1] - r), min(self.chunks_y, center[1] + r + 1))
+            for cx in range(max(0, center[0] - r), min(self.chunks_x, center[0] + r + 1))
+        }
+        loaded = sorted(wanted - self._active)
+        evicted = sorted(self._active - wanted)
+        self._active = wanted
+
+        # згенеровані «мимохідь» (BFS поля відстаней тощо) теж викидаємо
+        for key in [k for k in self._chunks if k not in wanted]:
+            del self._chunks[key]
+        for key in loaded:
+            self.get_chunk(*key)
+        return loaded, evicted
+
+    def loaded_chunks(self):
+        return len(self._chunks)
+
+    # ---------- API DungeonMap ----------
+
+    def get_tile(self, x: int, y: int) -> str:
+        size = self.chunk_size
+        return self.get_chunk(x // size, y // size)[y % size][x % size]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Перевіряємо, чи можна стати на клітинку (не вихід за межі і не стіна)."""
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return False
+        return self.get_tile(x, y) != "#"
+
+    def find_player_start(self):
+        """P завжди в чанку (0, 0)."""
+        for y, row in enumerate(self.get_chunk(0, 0)):
+            x = row.find("P")
+            if x >= 0:
+                return x, y
+        return 1, 1
+
+    def chunk_markers(self, cx: int, cy: int):
+        """(вороги [(x, y)], предмети [(x, y, ch)]) одного чанка у світових координатах."""
+        x0 = cx * self.chunk_size
+        y0 = cy * self.chunk_size
+        enemies = []
+        items = []
+        for dy, row in enumerate(self.get_chunk(cx, cy)):
+            for dx, ch in enumerate(row):
+                if ch == "M":
+                    enemies.append((x0 + dx, y0 + dy))
+                elif ch in ("H", "A", "W", "R"):
+                    items.append((x0 + dx, y0 + dy, ch))
+        return enemies, items
+
+    def find_enemy_positions(self):
+        """Монстри лише в активних чанках (увесь світ ніхто не генерує)."""
+        positions = []
+        for key in sorted(self._active):
+            positions.extend(self.chunk_markers(*key)[0])
+        return positions
+
+    def find_item_positions(self):
+        """Предмети лише в активних чанках."""
+        positions = []
+        for key in sorted(self._active):
+            positions.extend(self.chunk_markers(*key)[1])
+        return positions
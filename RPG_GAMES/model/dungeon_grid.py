@@ -0,0 +1,85 @@
+# model/dungeon_grid.py
+
+from .dungeon import DungeonMap
+
+try:
+    import numpy as np
+except ImportError:  # numpy — необов'язкова залежність
+    np = None
+
+
+WALL = ord("#")
+PLAYER = ord("P")
+
+
+class GridDungeonMap(DungeonMap):
+    """DungeonMap на NumPy: карта як масив uint8 (код символу) + маска прохідності.
+
+    level_data (список рядків) лишається для Renderer'а і сумісності,
+    а пошук позицій і пакетні перевірки йдуть векторно по масиву.
+    """
+
+    def __init__(self, level_data):
+        if np is None:
+            raise RuntimeError("GridDungeonMap потребує numpy")
+        super().__init__(level_data)
+
+        raw = "".join(level_data).encode("ascii")
+        self.tiles = np.frombuffer(raw, dtype=np.uint8).reshape(self.height, self.width)
+        self.walkable = self.tiles != WALL
+
+        # для поодиноких запитів bytes швидший за індексацію numpy-масиву
+        self._walkable_flat = self.walkable.tobytes()
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Перевіряємо, чи можна стати на клітинку (не вихід за межі і не стіна)."""
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return False
+        return self._walkable_flat[y * self.width + x] != 0
+
+    def is_walkable_many(self, xs, ys):
+        """Пакетна перевірка: масиви x і y -> bool-масив (поза картою — False)."""
+        xs = np.asarray(xs, dtype=np.intp)
+        ys = np.asarray(ys, dtype=np.intp)
+        inside = (xs >= 0) & (ys >= 0) & (xs < self.width) & (ys < self.height)
+        result = np.zeros(xs.shape, dtype=bool)
+        result[inside] = self.walkable[ys[inside], xs[inside]]
+        return result
+
+    def positions_of(self, chars: str):
+        """Координати всіх тайлів з chars: (xs, ys) у порядку рядків карти."""
+        codes = [ord(ch) for ch in chars]
+        if len(codes) == 1:
+            mask = self.tiles == codes[0]
+        else:
+            mask = np.isin(self.tiles, codes)
+        ys, xs = np.nonzero(mask)
+        return xs, ys
+
+    def find_player_start(self):
+        """Знаходимо позицію P у карті."""
+        flat = np.flatnonzero(self.tiles == PLAYER)
+        if flat.size == 0:
+            return 1, 1
+        y, x = divmod(int(flat[0]), self.width)
+        return x, y
+
+    def find_enemy_positions(self):
+        """Повертаємо список координат усіх монстрів (M) на мапі."""
+        xs, ys = self.positions_of("M")
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def find_item_positions(self):
+        """Повертає список (x, y, ch) для предметів (H, A, W, R)."""
+        xs, ys = self.positions_of("HAWR")
+        chars = self.tiles[ys, xs].tobytes().decode("ascii")
+        return list(zip(xs.tolist(), ys.tolist(), chars))
+
+
+def create_dungeon(level_data, backend: str = "numpy"):
+    """DungeonMap з потрібним бекендом: "numpy" (якщо numpy є) або "list"."""
+    if backend == "numpy":
+        if np is not None:
+            return GridDungeonMap(level_data)
+        print("[WARN] numpy не встановлено — використовую звичайний DungeonMap")
+    return DungeonMap(level_data)
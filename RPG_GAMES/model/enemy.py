@@ -7,14 +7,22 @@ class Enemy:
         self.hp = hp
         self.attack = attack
 
+        # де ворог з'явився (для світу чанками: убитих не відроджуємо)
+        self.spawn = (x, y)
+
         # для анімації
         self.direction = "down"     # up / down / left / right
-        self.walk_timer = 0         # скільки кадрів ще "рухаються ноги"
+        self.walk_timer = 0         # скільки тіків ще "рухаються ноги"
         self.step_phase = 0         # 0 або 1 (чергування кроків)
 
-        # для AI руху
-        self.move_cooldown = 30     # кадрів між кроками (чим більше, тим повільніші)
-        self.move_timer = 0         # скільки кадрів залишилось до наступного кроку
+        # для інтерполяції між тіками: звідки і на якому тіку був останній крок
+        self.prev_x = x
+        self.prev_y = y
+        self.moved_tick = -1
+
+        # для AI руху (таймери — у тіках симуляції, не в кадрах)
+        self.move_cooldown = 30     # тіків між кроками (чим більше, тим повільніші)
+        self.move_timer = 0         # скільки тіків залишилось до наступного кроку
 
         # нове: чи вже “загротився” на гравця
         self.aggro = False
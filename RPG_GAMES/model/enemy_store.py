@@ -0,0 +1,347 @@
+# model/enemy_store.py
+
+from .enemy import Enemy
+
+try:
+    import numpy as np
+except ImportError:  # numpy — необов'язкова залежність
+    np = None
+
+
+# напрямки як коди uint8 (порядок — як рядки sprite sheet'ів)
+DIRECTIONS = ("down", "left", "right", "up")
+_DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
+
+# стати нового ворога — ті самі, що в Enemy за замовчуванням
+_DEFAULTS = Enemy(0, 0)
+
+# поля, що описують стан живого ворога (для збереження): назва -> код array / struct
+# direction — номер у DIRECTIONS, aggro — 0/1
+STATE_COLUMNS = (
+    ("x", "i"), ("y", "i"), ("hp", "i"), ("attack", "i"),
+    ("walk_timer", "h"), ("step_phase", "B"),
+    ("move_cooldown", "h"), ("move_timer", "h"),
+    ("direction", "B"), ("aggro", "B"),
+    ("spawn_x", "i"), ("spawn_y", "i"),
+)
+
+
+def _array_field(name: str, cast=int):
+    """Властивість EnemyView, що читає / пише елемент масиву store.<name>."""
+    def get(self):
+        return cast(getattr(self._store, name)[self._i])
+
+    def set(self, value):
+        getattr(self._store, name)[self._i] = value
+
+    return property(get, set)
+
+
+class EnemyView:
+    """Ворог як «вікно» в EnemyStore: той самий інтерфейс, що в Enemy.
+
+    Сам нічого не зберігає, крім посилання на сховище і номера слота, тож
+    існуючий код (AI, Renderer, SpatialIndex) працює без змін.
+    """
+
+    __slots__ = ("_store", "_i")
+
+    def __init__(self, store, index: int):
+        self._store = store
+        self._i = index
+
+    x = _array_field("x")
+    y = _array_field("y")
+    hp = _array_field("hp")
+    attack = _array_field("attack")
+    walk_timer = _array_field("walk_timer")
+    step_phase = _array_field("step_phase")
+    move_cooldown = _array_field("move_cooldown")
+    move_timer = _array_field("move_timer")
+    aggro = _array_field("aggro", bool)
+    prev_x = _array_field("prev_x")
+    prev_y = _array_field("prev_y")
+    moved_tick = _array_field("moved_tick")
+
+    @property
+    def direction(self) -> str:
+        return DIRECTIONS[self._store.direction[self._i]]
+
+    @direction.setter
+    def direction(self, value: str):
+        self._store.direction[self._i] = _DIRECTION_CODES[value]
+
+    @property
+    def spawn(self):
+        store = self._store
+        return int(store.spawn_x[self._i]), int(store.spawn_y[self._i])
+
+    def update(self):
+        store = self._store
+        i = self._i
+        if store.walk_timer[i] > 0:
+            store.walk_timer[i] -= 1
+        if store.move_timer[i] > 0:
+            store.move_timer[i] -= 1
+
+    def start_walk(self):
+        """Викликаємо, коли ворог зробив крок."""
+        self.walk_timer = 10
+        self.step_phase = (self.step_phase + 1) % 2
+
+    def take_damage(self, amount: int):
+        self.hp = max(0, self.hp - amount)
+
+    def is_alive(self) -> bool:
+        return self._store.hp[self._i] > 0
+
+
+class EnemyStore:
+    """Вороги рівня як паралельні NumPy-масиви (struct of arrays).
+
+    Кожне поле ворога — окремий масив, ворог — номер слота в них.
+    Щотіку таймери зменшуються одною векторною операцією, AI бере лише
+    готових до кроку ворогів (маска), перевірка «всі мертві» — теж маска.
+    Назовні вороги видні як EnemyView з інтерфейсом Enemy.
+    Слоти вивантажених ворогів (світ чанками) повторно використовуються.
+
+    На ворога — близько 50 байт у масивах + маленький EnemyView із __slots__
+    замість Enemy з __dict__ на кількасот байт.
+    """
+
+    _FIELDS = (
+        ("x", "int32"), ("y", "int32"),
+        ("hp", "int32"), ("attack", "int32"),
+        ("walk_timer", "int16"), ("step_phase", "uint8"),
+        ("move_cooldown", "int16"), ("move_timer", "int16"),
+        ("direction", "uint8"), ("aggro", "bool"),
+        ("prev_x", "int32"), ("prev_y", "int32"), ("moved_tick", "int64"),
+        ("spawn_x", "int32"), ("spawn_y", "int32"),
+        ("active", "bool"),
+    )
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise RuntimeError("EnemyStore потребує numpy")
+        capacity = max(1, capacity)
+        for name, dtype in self._FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self._size = 0          # скільки слотів коли-небудь займали
+        self._free = []         # звільнені слоти для повторного використання
+        self._views = []        # слот -> EnemyView (один на слот, стабільний id)
+
+    def __len__(self):
+        return self._size - len(self._free)
+
+    # ---------- додавання / прибирання ----------
+
+    def _grow(self, needed: int):
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, _ in self._FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def spawn(self, x: int, y: int, hp: int = _DEFAULTS.hp,
+              attack: int = _DEFAULTS.attack):
+        """Новий ворог у (x, y); повертає його EnemyView."""
+        if self._free:
+            i = self._free.pop()
+        else:
+            i = self._size
+            self._grow(i + 1)
+            self._size += 1
+            self._views.append(EnemyView(self, i))
+
+        self.x[i] = self.prev_x[i] = self.spawn_x[i] = x
+        self.y[i] = self.prev_y[i] = self.spawn_y[i] = y
+        self.hp[i] = hp
+        self.attack[i] = attack
+        self.walk_timer[i] = 0
+        self.step_phase[i] = 0
+        self.move_cooldown[i] = _DEFAULTS.move_cooldown
+        self.move_timer[i] = 0
+        self.direction[i] = _DIRECTION_CODES[_DEFAULTS.direction]
+        self.aggro[i] = False
+        self.moved_tick[i] = -1
+        self.active[i] = True
+        return self._views[i]
+
+    def spawn_many(self, positions):
+        """Вороги на всіх (x, y) з positions — одним пакетом; список EnemyView."""
+        positions = list(positions)
+        if self._free:
+            return [self.spawn(x, y) for x, y in positions]
+
+        start = self._size
+        end = start + len(positions)
+        self._grow(end)
+        if positions:
+            xs, ys = np.array(positions, dtype=np.int32).T
+            for name in ("x", "prev_x", "spawn_x"):
+                getattr(self, name)[start:end] = xs
+            for name in ("y", "prev_y", "spawn_y"):
+                getattr(self, name)[start:end] = ys
+        self.hp[start:end] = _DEFAULTS.hp
+        self.attack[start:end] = _DEFAULTS.attack
+        self.walk_timer[start:end] = 0
+        self.step_phase[start:end] = 0
+        self.move_cooldown[start:end] = _DEFAULTS.move_cooldown
+        self.move_timer[start:end] = 0
+        self.direction[start:end] = _DIRECTION_CODES[_DEFAULTS.direction]
+        self.aggro[start:end] = False
+        self.moved_tick[start:end] = -1
+        self.active[start:end] = True
+
+        self._views.extend(EnemyView(self, i) for i in range(start, end))
+        self._size = end
+        return self._views[start:end]
+
+    def release(self, enemy):
+        """Звільняє слот ворога (вивантажений чанк); EnemyView більше не використовувати."""
+        i = enemy._i
+        if self.active[i]:
+            self.active[i] = False
+            self.hp[i] = 0
+            self._free.append(i)
+
+    def clear(self):
+        self._size = 0
+        self._free.clear()
+        self._views.clear()
+        for name, _ in self._FIELDS:
+            getattr(self, name)[:] = 0
+
+    # ---------- векторні операції ----------
+
+    def update(self):
+        """Тік таймерів усіх ворогів (замість enemy.update() по одному)."""
+        n = self._size
+        for timer in (self.walk_timer[:n], self.move_timer[:n]):
+            np.subtract(timer, 1, out=timer, where=timer > 0)
+
+    def alive_mask(self):
+        n = self._size
+        return self.active[:n] & (self.hp[:n] > 0)
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive_mask()))
+
+    def all_dead(self) -> bool:
+        return not self.alive_mask().any()
+
+    def take_ready(self, px: int, py: int, radius: int):
+        """Хід AI: вороги, що можуть діяти цього тіку.
+
+        Усім живим з нульовим кулдауном кулдаун стартує заново (як і раніше
+        в циклі AI), а повертаються лише ті з них, кому є що робити:
+        агро або в квадраті radius навколо (px, py) — далі гравця не помітити.
+        """
+        n = self._size
+        ready = self.alive_mask() & (self.move_timer[:n] == 0)
+        self.move_timer[:n][ready] = self.move_cooldown[:n][ready]
+
+        near = (np.abs(self.x[:n] - px) <= radius) & (np.abs(self.y[:n] - py) <= radius)
+        candidates = ready & (self.aggro[:n] | near)
+        views = self._views
+        return [views[i] for i in np.flatnonzero(candidates).tolist()]
+
+    # ---------- стан для збереження ----------
+
+    def export_columns(self):
+        """Живі вороги як колонки: dict назва -> масив (див. STATE_COLUMNS)."""
+        mask = self.alive_mask()
+        n = self._size
+        return {name: getattr(self, name)[:n][mask] for name, _ in STATE_COLUMNS}
+
+    def import_columns(self, columns, count: int):
+        """Замінює всіх ворогів на count збережених; повертає список EnemyView."""
+        self.clear()
+        views = self.spawn_many([(0, 0)] * count)
+        for name, _ in STATE_COLUMNS:
+            getattr(self, name)[:count] = columns[name]
+        self.prev_x[:count] = self.x[:count]
+        self.prev_y[:count] = self.y[:count]
+        return views
+
+
+class ListEnemyStore:
+    """Те саме API поверх звичайних Enemy — якщо numpy не встановлено."""
+
+    def __init__(self, capacity: int = 64):
+        self._enemies = []
+
+    def __len__(self):
+        return len(self._enemies)
+
+    def spawn(self, x: int, y: int, hp: int = _DEFAULTS.hp,
+              attack: int = _DEFAULTS.attack):
+        enemy = Enemy(x, y, hp, attack)
+        self._enemies.append(enemy)
+        return enemy
+
+    def spawn_many(self, positions):
+        return [self.spawn(x, y) for x, y in positions]
+
+    def release(self, enemy):
+        if enemy in self._enemies:
+            self._enemies.remove(enemy)
+
+    def clear(self):
+        self._enemies.clear()
+
+    def update(self):
+        for enemy in self._enemies:
+            enemy.update()
+
+    def alive_count(self) -> int:
+        return sum(1 for enemy in self._enemies if enemy.is_alive())
+
+    def all_dead(self) -> bool:
+        return not any(enemy.is_alive() for enemy in self._enemies)
+
+    def take_ready(self, px: int, py: int, radius: int):
+        result = []
+        for enemy in self._enemies:
+            if not enemy.is_alive() or enemy.move_timer > 0:
+                continue
+            enemy.move_timer = enemy.move_cooldown
+            if enemy.aggro or (abs(enemy.x - px) <= radius and abs(enemy.y - py) <= radius):
+                result.append(enemy)
+        return result
+
+    def export_columns(self):
+        alive = [e for e in self._enemies if e.is_alive()]
+        columns = {name: [getattr(e, name) for e in alive] for name, _ in STATE_COLUMNS
+                   if name not in ("direction", "aggro", "spawn_x", "spawn_y")}
+        columns["direction"] = [DIRECTIONS.index(e.direction) for e in alive]
+        columns["aggro"] = [int(e.aggro) for e in alive]
+        columns["spawn_x"] = [e.spawn[0] for e in alive]
+        columns["spawn_y"] = [e.spawn[1] for e in alive]
+        return columns
+
+    def import_columns(self, columns, count: int):
+        self.clear()
+        for i in range(count):
+            enemy = self.spawn(int(columns["spawn_x"][i]), int(columns["spawn_y"][i]))
+            for name, _ in STATE_COLUMNS:
+                if name not in ("direction", "aggro", "spawn_x", "spawn_y"):
+                    setattr(enemy, name, int(columns[name][i]))
+            enemy.direction = DIRECTIONS[columns["direction"][i]]
+            enemy.aggro = bool(columns["aggro"][i])
+            enemy.prev_x, enemy.prev_y = enemy.x, enemy.y
+        return list(self._enemies)
+
+
+def create_enemy_store(backend: str = "numpy", capacity: int = 64):
+    """EnemyStore на NumPy (якщо є) або ListEnemyStore."""
+    if backend == "numpy":
+        if np is not None:
+            return EnemyStore(capacity)
+        print("[WARN] numpy не встановлено — вороги зберігаються як звичайні об'єкти")
+    return ListEnemyStore(capacity)
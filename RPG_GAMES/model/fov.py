@@ -0,0 +1,132 @@
+# model/fov.py
+
+from collections import OrderedDict
+
+
+# множники для 8 октантів (рекурсивний shadowcasting)
+_OCTANTS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+
+
+class FieldOfView:
+    """Поле зору і лінія видимості поверх DungeonMap.
+
+    compute() — рекурсивний shadowcasting: множина клітинок, видимих з точки
+    в радіусі. Результати кешуються за (x, y, radius), тож сотні ворогів
+    можуть щотіку перевіряти, чи бачить їх гравець, за ціною одного пошуку
+    в множині. Тайли карти не змінюються, а нова карта отримує новий
+    FieldOfView, тому кеш ніколи не треба скидати.
+    Непрозоре — усе, по чому не можна ходити (стіни і межі карти).
+    """
+
+    def __init__(self, dungeon, cache_size: int = 256):
+        self.dungeon = dungeon
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- поле зору ----------
+
+    def compute(self, x: int, y: int, radius: int):
+        """frozenset клітинок (x, y), видимих з (x, y) у радіусі radius."""
+        key = (x, y, radius)
+        visible = self._cache.get(key)
+        if visible is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return visible
+
+        self.misses += 1
+        cells = {(x, y)}
+        for xx, xy, yx, yy in _OCTANTS:
+            self._cast(x, y, 1, 1.0, 0.0, radius, xx, xy, yx, yy, cells)
+        visible = frozenset(cells)
+
+        self._cache[key] = visible
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return visible
+
+    def can_see(self, from_x: int, from_y: int, to_x: int, to_y: int, radius: int) -> bool:
+        """Чи видно (to_x, to_y) з (from_x, from_y) — через кешоване поле зору."""
+        return (to_x, to_y) in self.compute(from_x, from_y, radius)
+
+    def _cast(self, cx, cy, row, start, end, radius, xx, xy, yx, yy, cells):
+        """Один октант: сканує рядки від row, ділячи промінь на тіні від стін."""
+        if start < end:
+            return
+        is_walkable = self.dungeon.is_walkable
+        width = self.dungeon.width
+        height = self.dungeon.height
+        radius_sq = radius * radius
+        new_start = 0.0
+
+        for j in range(row, radius + 1):
+            dx = -j - 1
+            dy = -j
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                map_x = cx + dx * xx + dy * xy
+                map_y = cy + dx * yx + dy * yy
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start < right_slope:
+                    continue
+                if end > left_slope:
+                    break
+
+                if dx * dx + dy * dy <= radius_sq and 0 <= map_x < width and 0 <= map_y < height:
+                    cells.add((map_x, map_y))
+
+                opaque = not is_walkable(map_x, map_y)
+                if blocked:
+                    if opaque:
+                        new_start = right_slope
+                        continue
+                    blocked = False
+                    start = new_start
+                elif opaque and j < radius:
+                    # стіна: скануємо світлу частину далі рекурсивно, решта — в тіні
+                    blocked = True
+                    self._cast(cx, cy, j + 1, start, left_slope, radius,
+                               xx, xy, yx, yy, cells)
+                    new_start = right_slope
+            if blocked:
+                break
+
+    # ---------- лінія видимості ----------
+
+    def line_of_sight(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        """Чи не перекрита пряма (Брезенгем) між двома клітинками стінами."""
+        is_walkable = self.dungeon.is_walkable
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        x, y = x0, y0
+
+        while (x, y) != (x1, y1):
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x += sx
+            if e2 <= dx:
+                err += dx
+                y += sy
+            if (x, y) != (x1, y1) and not is_walkable(x, y):
+                return False
+        return True
+
+    def clear_cache(self):
+        self._cache.clear()
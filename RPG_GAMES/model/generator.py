@@ -0,0 +1,179 @@
+# model/generator.py
+
+import random
+
+
+FLOOR = ord(".")
+WALL_ROW_BYTE = b"#"
+ITEM_CHARS = "HAWR"
+ITEM_WEIGHTS = (4, 2, 1, 1)   # зілля частіше, ніж спорядження
+
+
+class BSPGenerator:
+    """Процедурні рівні: кімнати і коридори через BSP-поділ.
+
+    Прямокутник карти рекурсивно ділиться на листки, у кожному листку —
+    кімната, сусідні піддерева з'єднуються L-подібним коридором, тож
+    усі кімнати досяжні. Результат — список рядків, як settings.LEVEL_MAP
+    (#, ., P, M, H, A, W, R, E), і його можна віддати будь-якому DungeonMap.
+
+    Карта будується в bytearray-рядках, кімнати вирізаються зрізами —
+    1000x1000 генерується за десятки мілісекунд.
+    Той самий seed — та сама карта.
+    """
+
+    def __init__(self, seed=None, min_leaf: int = 10, max_leaf: int = 24,
+                 min_room: int = 4, enemies_per_room: int = 2,
+                 item_chance: float = 0.5):
+        self.seed = seed
+        self.min_leaf = min_leaf
+        self.max_leaf = max_leaf
+        self.min_room = min_room
+        self.enemies_per_room = enemies_per_room
+        self.item_chance = item_chance
+
+    def generate(self, width: int, height: int, place_player: bool = True,
+                 place_exit: bool = True, gates=(), seed=None):
+        """Рівень width x height як список рядків.
+
+        gates — клітинки на краю карти (x, y), до яких треба прорубати
+        коридор від найближчої кімнати (стики між чанками світу).
+        seed — перекрити self.seed для цього виклику.
+        """
+        rng = random.Random(self.seed if seed is None else seed)
+        grid = [bytearray(WALL_ROW_BYTE * width) for _ in range(height)]
+
+        rooms = []
+        self._split(rng, grid, rooms, 0, 0, width, height)
+        if not rooms:
+            # карта замала для BSP — одна кімната на все, що всередині стін
+            rooms.append((1, 1, max(1, width - 2), max(1, height - 2)))
+            self._carve_room(grid, rooms[0])
+
+        for gx, gy in gates:
+            grid[gy][gx] = FLOOR
+            self._carve_corridor(grid, (gx, gy), self._nearest_center(rooms, gx, gy))
+
+        self._place_markers(rng, grid, rooms, place_player, place_exit)
+        return [row.decode("ascii") for row in grid]
+
+    # ---------- BSP ----------
+
+    def _split(self, rng, grid, rooms, x, y, w, h):
+        """Ділить листок; повертає центр однієї з кімнат піддерева (для коридорів)."""
+        min_leaf = self.min_leaf
+        can_h = h >= 2 * min_leaf
+        can_v = w >= 2 * min_leaf
+        big = w > self.max_leaf or h > self.max_leaf
+
+        if (can_h or can_v) and (big or rng.random() < 0.25):
+            # ріжемо поперек довшої сторони (інакше — випадково)
+            if can_h and can_v:
+                vertical = w > h if w != h else rng.random() < 0.5
+            else:
+                vertical = can_v
+
+            if vertical:
+                cut = rng.randint(min_leaf, w - min_leaf)
+                a = self._split(rng, grid, rooms, x, y, cut, h)
+                b = self._split(rng, grid, rooms, x + cut, y, w - cut, h)
+            else:
+                cut = rng.randint(min_leaf, h - min_leaf)
+                a = self._split(rng, grid, rooms, x, y, w, cut)
+                b = self._split(rng, grid, rooms, x, y + cut, w, h - cut)
+
+            if a is not None and b is not None:
+                self._carve_corridor(grid, a, b)
+            return a if b is None or (a is not None and rng.random() < 0.5) else b
+
+        # листок: кімната з відступом 1 від країв листка
+        if w - 2 < self.min_room or h - 2 < self.min_room:
+            return None
+        rw = rng.randint(self.min_room, w - 2)
+        rh = rng.randint(self.min_room, h - 2)
+        rx = x + rng.randint(1, w - rw - 1)
+        ry = y + rng.randint(1, h - rh - 1)
+        room = (rx, ry, rw, rh)
+        rooms.append(room)
+        self._carve_room(grid, room)
+        return rx + rw // 2, ry + rh // 2
+
+    @staticmethod
+    def _carve_room(grid, room):
+        rx, ry, rw, rh = room
+        floor = b"." * rw
+        for row in range(ry, ry + rh):
+            grid[row][rx:rx + rw] = floor
+
+    @staticmethod
+    def _carve_corridor(grid, a, b):
+        """L-подібний коридор: по горизонталі з a, потім по вертикалі до b."""
+        (x0, y0), (x1, y1) = a, b
+        lo, hi = min(x0, x1), max(x0, x1)
+        grid[y0][lo:hi + 1] = b"." * (hi - lo + 1)
+        step = 1 if y1 >= y0 else -1
+        for row in range(y0, y1 + step, step):
+            grid[row][x1] = FLOOR
+
+    @staticmethod
+    def _nearest_center(rooms, x, y):
+        best = None
+        best_dist = None
+        for rx, ry, rw, rh in rooms:
+            cx, cy = rx + rw // 2, ry + rh // 2
+            dist = abs(cx - x) + abs(cy - y)
+            if best_dist is None or dist < best_dist:
+                best, best_dist = (cx, cy), dist
+        return best
+
+    # ---------- маркери ----------
+
+    def _place_markers(self, rng, grid, rooms, place_player, place_exit):
+        """P у першій кімнаті, E — у найдальшій від неї, M і предмети по решті."""
+        start = rooms[0]
+        sx, sy = start[0] + start[2] // 2, start[1] + start[3] // 2
+        if place_player:
+            grid[sy][sx] = ord("P")
+
+        if place_exit:
+            # якщо кімната одна — вихід у стартовій
+            far = max(rooms[1:] or rooms, key=lambda r: abs(r[0] - sx) + abs(r[1] - sy))
+            if not self._put(rng, grid, far, "E"):
+                # у кімнаті нема вільної підлоги — будь-яка інша, аби рівень мав вихід
+                for room in rooms:
+                    if self._put(rng, grid, room, "E"):
+                        break
+
+        for room in rooms:
+            if place_player and room is start:
+                continue   # у стартовій кімнаті гравця не чекають
+            for _ in range(rng.randint(0, self.enemies_per_room)):
+                self._put(rng, grid, room, "M")
+            if rng.random() < self.item_chance:
+                ch = rng.choices(ITEM_CHARS, ITEM_WEIGHTS)[0]
+                self._put(rng, grid, room, ch)
+
+    @staticmethod
+    def _put(rng, grid, room, ch: str):
+        """Маркер на випадкову вільну підлогу кімнати; False — вільної підлоги нема.
+
+        Кілька випадкових спроб, а якщо не влучили — перша вільна клітинка по порядку.
+        """
+        rx, ry, rw, rh = room
+        for _ in range(8):
+            x = rx + rng.randrange(rw)
+            y = ry + rng.randrange(rh)
+            if grid[y][x] == FLOOR:
+                grid[y][x] = ord(ch)
+                return True
+        for y in range(ry, ry + rh):
+            for x in range(rx, rx + rw):
+                if grid[y][x] == FLOOR:
+                    grid[y][x] = ord(ch)
+                    return True
+        return False
+
+
+def generate_level(width: int, height: int, seed=None, **options):
+    """Скорочення: BSPGenerator(seed, **options).generate(width, height)."""
+    return BSPGenerator(seed, **options).generate(width, height)
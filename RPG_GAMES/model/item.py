@@ -1,6 +1,7 @@
 # model/item.py
 
 from enum import Enum, auto
+from typing import NamedTuple
 
 
 class ItemType(Enum):
@@ -17,12 +18,117 @@ class ItemRarity(Enum):
     LEGENDARY = auto()   # золото
 
 
+# стати предметів: тип -> рідкість -> (value, durability)
+# value для HEAL/ATTACK — скільки дає; для WEAPON/ARMOR — бонус ATK / DEF
+# durability 0 — одноразовий предмет
+ITEM_STATS = {
+    ItemType.HEAL: {
+        ItemRarity.COMMON: (5, 0),
+        ItemRarity.UNCOMMON: (10, 0),
+        ItemRarity.RARE: (15, 0),
+        ItemRarity.LEGENDARY: (20, 0),
+    },
+    ItemType.ATTACK: {
+        ItemRarity.COMMON: (1, 0),
+        ItemRarity.UNCOMMON: (2, 0),
+        ItemRarity.RARE: (3, 0),
+        ItemRarity.LEGENDARY: (5, 0),
+    },
+    ItemType.WEAPON: {
+        ItemRarity.COMMON: (1, 10),
+        ItemRarity.UNCOMMON: (2, 15),
+        ItemRarity.RARE: (3, 20),
+        ItemRarity.LEGENDARY: (5, 30),
+    },
+    ItemType.ARMOR: {
+        ItemRarity.COMMON: (1, 12),
+        ItemRarity.UNCOMMON: (2, 18),
+        ItemRarity.RARE: (3, 24),
+        ItemRarity.LEGENDARY: (5, 35),
+    },
+}
+
+# символ карти -> тип предмета
+ITEM_CHARS = {
+    "H": ItemType.HEAL,
+    "A": ItemType.ATTACK,
+    "W": ItemType.WEAPON,
+    "R": ItemType.ARMOR,
+}
+
+
+class ItemDef(NamedTuple):
+    """Незмінний опис предмета — один на (тип, рідкість), спільний для всіх копій."""
+    type: ItemType
+    rarity: ItemRarity
+    value: int
+    durability: int     # початкова міцність (0 — одноразовий)
+
+
 class Item:
-    def __init__(self, x: int, y: int, item_type: ItemType, value: int,
-                 rarity: ItemRarity, durability: int = 0):
+    """Конкретний предмет: лише позиція, поточна міцність і посилання на ItemDef."""
+
+    __slots__ = ("x", "y", "durability", "definition")
+
+    def __init__(self, x: int, y: int, definition: ItemDef, durability: int = None):
         self.x = x
         self.y = y
-        self.type = item_type
-        self.value = value          # для HEAL/ATTACK: скільки дає; для WEAPON/ARMOR: бонус
-        self.rarity = rarity
-        self.durability = durability  # 0 для одноразових (HEAL/ATTACK), >0 для зброї/броні
+        self.definition = definition
+        # 0 для одноразових (HEAL/ATTACK), >0 для зброї/броні — зношується
+        self.durability = definition.durability if durability is None else durability
+
+    @property
+    def type(self) -> ItemType:
+        return self.definition.type
+
+    @property
+    def rarity(self) -> ItemRarity:
+        return self.definition.rarity
+
+    @property
+    def value(self) -> int:
+        return self.definition.value
+
+
+class ItemFactory:
+    """Єдине місце, де створюються предмети.
+
+    ItemDef для кожної пари (тип, рідкість) будується один раз із таблиці
+    stats, а Item лише посилається на нього — десятки тисяч предметів
+    на рівні не тримають власних копій типу / рідкості / бонусу.
+    """
+
+    def __init__(self, stats=ITEM_STATS):
+        self._defs = {
+            (item_type, rarity): ItemDef(item_type, rarity, value, durability)
+            for item_type, by_rarity in stats.items()
+            for rarity, (value, durability) in by_rarity.items()
+        }
+
+    def get_def(self, item_type: ItemType, rarity: ItemRarity) -> ItemDef:
+        return self._defs[(item_type, rarity)]
+
+    def create(self, x: int, y: int, item_type, rarity: ItemRarity):
+        """Предмет типу item_type (ItemType або символ карти H/A/W/R); None — невідомий символ."""
+        if isinstance(item_type, str):
+            item_type = ITEM_CHARS.get(item_type)
+            if item_type is None:
+                return None
+        return Item(x, y, self._defs[(item_type, rarity)])
+
+    def create_many(self, positions, rarities):
+        """Пакетне створення: positions — [(x, y, символ)], rarities — рідкість на кожен.
+
+        Позиції з невідомими символами пропускаються.
+        """
+        defs = self._defs
+        result = []
+        for (x, y, ch), rarity in zip(positions, rarities):
+            item_type = ITEM_CHARS.get(ch)
+            if item_type is not None:
+                result.append(Item(x, y, defs[(item_type, rarity)]))
+        return result
+
+
+# спільна фабрика для всієї гри
+item_factory = ItemFactory()
@@ -0,0 +1,118 @@
+# model/loot.py
+
+from .item import ItemType, ItemRarity, ITEM_CHARS, item_factory
+
+
+# ваги рідкостей — як часто випадає кожна (відносні, не обов'язково в сумі 100)
+DEFAULT_RARITY_WEIGHTS = {
+    ItemRarity.COMMON: 60,
+    ItemRarity.UNCOMMON: 25,
+    ItemRarity.RARE: 10,
+    ItemRarity.LEGENDARY: 5,
+}
+
+# таблиці луту: тип предмета -> ваги рідкостей
+# (стати кожної рідкості — в model.item.ITEM_STATS)
+LOOT_TABLES = {item_type: DEFAULT_RARITY_WEIGHTS for item_type in ItemType}
+
+
+class AliasTable:
+    """Вибірка з дискретного розподілу за O(1) (alias-метод Vose).
+
+    Таблиця будується один раз за O(n); кожна вибірка — одне rng.random():
+    ціла частина обирає стовпчик, дробова — сам стовпчик чи його alias.
+    """
+
+    def __init__(self, outcomes, weights):
+        outcomes = list(outcomes)
+        weights = [float(w) for w in weights]
+        if not outcomes or len(outcomes) != len(weights):
+            raise ValueError("AliasTable: потрібні непорожні outcomes і weights однакової довжини")
+        if any(w < 0 for w in weights) or sum(weights) <= 0:
+            raise ValueError("AliasTable: ваги мають бути невід'ємні з додатною сумою")
+
+        n = len(outcomes)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [0.0] * n
+        alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = scaled[g] + scaled[s] - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+        for i in small + large:
+            prob[i] = 1.0   # залишки через похибку округлення
+
+        self.outcomes = outcomes
+        self._prob = prob
+        self._alias = [outcomes[i] for i in alias]
+        self._n = n
+
+    def sample(self, rng):
+        u = rng.random() * self._n
+        i = int(u)
+        return self.outcomes[i] if u - i < self._prob[i] else self._alias[i]
+
+    def sample_many(self, rng, count: int):
+        """count вибірок одним викликом (та сама послідовність, що й count разів sample)."""
+        n = self._n
+        prob = self._prob
+        outcomes = self.outcomes
+        alias = self._alias
+        rand = rng.random
+        result = []
+        append = result.append
+        for _ in range(count):
+            u = rand() * n
+            i = int(u)
+            append(outcomes[i] if u - i < prob[i] else alias[i])
+        return result
+
+
+class LootRoller:
+    """Кидки луту: таблиці LOOT_TABLES, скомпільовані в AliasTable, і явний RNG.
+
+    rng — екземпляр random.Random прогону (не глобальний random), тож
+    той самий seed дає ті самі предмети на тих самих місцях.
+    """
+
+    def __init__(self, rng, tables=LOOT_TABLES, factory=item_factory):
+        self.rng = rng
+        self.factory = factory
+        self._tables = {
+            item_type: AliasTable(weights.keys(), weights.values())
+            for item_type, weights in tables.items()
+        }
+
+    def roll_rarity(self, item_type: ItemType) -> ItemRarity:
+        return self._tables[item_type].sample(self.rng)
+
+    def roll_rarities(self, item_type: ItemType, count: int):
+        """count рідкостей для одного типу предмета."""
+        return self._tables[item_type].sample_many(self.rng, count)
+
+    def create_item(self, x: int, y: int, ch: str):
+        """Предмет за символом карти (H, A, W, R) з випадковою рідкістю; None — невідомий символ."""
+        item_type = ITEM_CHARS.get(ch)
+        if item_type is None:
+            return None
+        return self.factory.create(x, y, item_type, self.roll_rarity(item_type))
+
+    def create_items(self, positions):
+        """Предмети для всіх (x, y, символ) — пакетом: рідкості sample_many на тип, потім фабрика."""
+        positions = [p for p in positions if p[2] in ITEM_CHARS]
+        by_type = {}     # тип -> індекси в positions (у порядку першої появи типу)
+        for i, (_, _, ch) in enumerate(positions):
+            by_type.setdefault(ITEM_CHARS[ch], []).append(i)
+
+        rarities = [None] * len(positions)
+        for item_type, indices in by_type.items():
+            for i, rarity in zip(indices, self.roll_rarities(item_type, len(indices))):
+                rarities[i] = rarity
+        return self.factory.create_many(positions, rarities)
@@ -0,0 +1,62 @@
+# model/message_log.py
+
+
+class MessageLog:
+    """Лог повідомлень фіксованої місткості (кільцевий буфер).
+
+    Старі повідомлення перезаписуються новими, тож пам'ять не росте,
+    скільки б не тривала сесія. Кожне повідомлення має порядковий номер
+    seq (0, 1, 2, ...) — за ним HUD кешує відрендерені рядки.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buffer = [None] * capacity
+        self._start = 0        # індекс найстарішого повідомлення в буфері
+        self._count = 0
+        self.total = 0         # скільки повідомлень додано за весь час (наступний seq)
+        self.version = 0       # змінюється при кожному append / clear
+
+    def __len__(self):
+        return self._count
+
+    def append(self, text: str):
+        """Додає повідомлення; якщо буфер повний — витісняє найстаріше."""
+        end = (self._start + self._count) % self.capacity
+        self._buffer[end] = text
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+        self.total += 1
+        self.version += 1
+
+    def clear(self):
+        self._buffer = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.version += 1
+
+    def get(self, index: int):
+        """Повідомлення за індексом: 0 — найстаріше з тих, що збереглись."""
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("message index out of range")
+        return self._buffer[(self._start + index) % self.capacity]
+
+    def window(self, count: int, offset: int = 0):
+        """Видиме вікно: до count повідомлень, що закінчуються за offset від найновішого.
+
+        Повертає список (seq, text) від старших до новіших.
+        """
+        end = self._count - offset
+        begin = max(0, end - count)
+        first_seq = self.total - self._count
+        return [(first_seq + i, self.get(i)) for i in range(begin, max(begin, end))]
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self.get(i)
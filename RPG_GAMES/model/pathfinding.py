@@ -0,0 +1,80 @@
+# model/pathfinding.py
+
+from collections import deque
+
+
+# 4 напрямки руху, як у гравця і ворогів
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class FlowField:
+    """Поле відстаней (Dijkstra) від однієї точки — зазвичай від гравця.
+
+    Рахується один раз, коли гравець зробив крок, і ділиться між усіма
+    ворогами: кожен ворог просто йде на сусідню клітинку з меншою
+    відстанню. Ціна кроку однакова, тож Dijkstra тут — це BFS.
+    Пошук обмежений max_distance, щоб на великих картах не обходити все.
+    """
+
+    def __init__(self, dungeon, max_distance: int = 32):
+        self.dungeon = dungeon
+        self.max_distance = max_distance
+        self.origin = None
+        self._dist = {}   # y * width + x -> кроків до origin
+
+    def compute(self, x: int, y: int):
+        """Перераховує поле від (x, y)."""
+        width = self.dungeon.width
+        is_walkable = self.dungeon.is_walkable
+        limit = self.max_distance
+
+        start = y * width + x
+        dist = {start: 0}
+        queue = deque(((x, y, 0),))
+
+        while queue:
+            cx, cy, d = queue.popleft()
+            if d >= limit:
+                continue
+            nd = d + 1
+            for dx, dy in NEIGHBOURS:
+                nx = cx + dx
+                ny = cy + dy
+                key = ny * width + nx
+                if key in dist or not is_walkable(nx, ny):
+                    continue
+                dist[key] = nd
+                queue.append((nx, ny, nd))
+
+        self._dist = dist
+        self.origin = (x, y)
+
+    def distance(self, x: int, y: int):
+        """Справжня відстань ходьбою до origin, або None (стіна / дуже далеко)."""
+        if x < 0 or y < 0 or x >= self.dungeon.width or y >= self.dungeon.height:
+            return None
+        return self._dist.get(y * self.dungeon.width + x)
+
+    def next_step(self, x: int, y: int, is_blocked=None):
+        """Сусідня клітинка, ближча до origin, або None.
+
+        is_blocked(x, y) — необов'язкова перевірка (напр. інший ворог);
+        заблоковані клітинки пропускаємо, якщо є інший шлях униз по полю.
+        """
+        current = self.distance(x, y)
+        if current is None or current == 0:
+            return None
+
+        best = None
+        best_dist = current
+        for dx, dy in NEIGHBOURS:
+            nx = x + dx
+            ny = y + dy
+            d = self.distance(nx, ny)
+            if d is None or d >= best_dist:
+                continue
+            if is_blocked is not None and d > 0 and is_blocked(nx, ny):
+                continue
+            best = (nx, ny)
+            best_dist = d
+        return best
@@ -5,6 +5,10 @@ from .dungeon import DungeonMap
 
 class Player:
     def __init__(self, x: int, y: int):
+        # лічильник змін статів / екіпу / інвентарю (для кешу HUD):
+        # методи, що їх змінюють, збільшують його; рух і анімація — ні
+        self.version = 0
+
         # координати в тайлах
         self.x = x
         self.y = y
@@ -25,9 +29,18 @@ class Player:
 
         # для анімації / напряму
         self.direction = "down"   # "up", "down", "left", "right"
-        self.walk_timer = 0
+        self.walk_timer = 0       # у тіках симуляції
         self.step_phase = 0
 
+        # для інтерполяції між тіками: звідки і на якому тіку був останній крок
+        self.prev_x = x
+        self.prev_y = y
+        self.moved_tick = -1
+
+    def mark_changed(self):
+        """Позначити, що стати / екіп змінили напряму (напр. завантаження гри)."""
+        self.version += 1
+
     def move(self, dx: int, dy: int, dungeon: DungeonMap):
         """Рух гравця з перевіркою стін + підготовка до анімації."""
         new_x = self.x + dx
@@ -59,6 +72,21 @@ class Player:
             return 0, -2
         return 0, 0
 
+    # ----- ІНВЕНТАР -----
+    def add_item(self, item) -> bool:
+        """Кладе предмет в інвентар. False, якщо місця немає."""
+        if len(self.inventory) >= self.inventory_capacity:
+            return False
+        self.inventory.append(item)
+        self.version += 1
+        return True
+
+    def remove_item(self, index: int):
+        """Виймає предмет з інвентарю за індексом і повертає його."""
+        item = self.inventory.pop(index)
+        self.version += 1
+        return item
+
     # ----- ЕКІП -----
     def equip_weapon(self, item):
         """Екіпувати зброю: зняти стару, додати бонус нової."""
@@ -67,6 +95,7 @@ class Player:
             self.attack -= self.weapon.value
         self.weapon = item
         self.attack += item.value
+        self.version += 1
 
     def equip_armor(self, item):
         """Екіпувати броню."""
@@ -74,6 +103,46 @@ class Player:
             self.defense -= self.armor.value
         self.armor = item
         self.defense += item.value
+        self.version += 1
+
+    def wear_weapon(self):
+        """Знос зброї на 1 удар. Повертає зламану зброю або None."""
+        if self.weapon is None:
+            return None
+        self.weapon.durability -= 1
+        self.version += 1
+        if self.weapon.durability > 0:
+            return None
+        broken = self.weapon
+        self.attack -= broken.value
+        self.weapon = None
+        return broken
+
+    def wear_armor(self):
+        """Знос броні на 1 отриманий удар. Повертає зламану броню або None."""
+        if self.armor is None:
+            return None
+        self.armor.durability -= 1
+        self.version += 1
+        if self.armor.durability > 0:
+            return None
+        broken = self.armor
+        self.defense -= broken.value
+        self.armor = None
+        return broken
+
+    # ----- Стати -----
+    def heal(self, amount: int) -> int:
+        """Лікування не вище max_hp. Повертає, скільки HP реально додалось."""
+        old_hp = self.hp
+        self.hp = min(self.max_hp, self.hp + amount)
+        self.version += 1
+        return self.hp - old_hp
+
+    def add_attack(self, amount: int):
+        """Постійний бонус до attack (зілля сили)."""
+        self.attack += amount
+        self.version += 1
 
     # ----- Бій -----
     def take_damage(self, amount: int):
@@ -84,6 +153,7 @@ class Player:
         self.hp -= effective
         if self.hp < 0:
             self.hp = 0
+        self.version += 1
 
     def is_alive(self) -> bool:
         return self.hp > 0
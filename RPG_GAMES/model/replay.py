@@ -0,0 +1,259 @@
+# model/replay.py
+
+import hashlib
+import time
+
+from . import binfile
+from .binfile import Reader, Writer, write_file
+from .enemy_store import DIRECTIONS, STATE_COLUMNS
+from .savegame import apply, capture, load_simulation
+
+
+# Запис сесії = знімок стану на старті (payload savegame: seed, стан RNG, карта)
+# + дії гравця з номером тіку + хеш стану після кожного тіку.
+# Симуляція детермінована (RNG прогону, таймери в тіках), тож ті самі дії
+# на тих самих тіках дають той самий прогін — і хеші це перевіряють.
+#
+# Файл — контейнер binfile, як і збереження, лише зі своїм MAGIC.
+MAGIC = b"RPGREPL\0"
+REPLAY_VERSION = 1
+
+# дії гравця (те, що InputHandler передає в симуляцію): код -> назва
+ACTION_MOVE = 0        # a, b = dx, dy
+ACTION_USE_ITEM = 1    # a = індекс у інвентарі
+ACTION_NAMES = {ACTION_MOVE: "move", ACTION_USE_ITEM: "use_item"}
+
+
+def state_hash(sim) -> int:
+    """64-бітний хеш стану симуляції після тіку (однаковий для numpy і list бекендів).
+
+    Карта не хешується (вона статична): лише стан дверей.
+    """
+    w = Writer()
+    w.pack("QBB", sim.tick_count, sim.doors_open, sim.game_over)
+    w.column(sim.rng.getstate()[1], "I")
+
+    p = sim.player
+    w.pack("iiiiiiBIII", p.x, p.y, p.hp, p.max_hp, p.attack, p.defense,
+           DIRECTIONS.index(p.direction), len(p.inventory),
+           len(sim.items), len(sim.cleared_spawns))
+
+    columns = sim.enemy_store.export_columns()
+    w.pack("I", len(columns["x"]))
+    for name, code in STATE_COLUMNS:
+        w.column(columns[name], code)
+
+    digest = hashlib.blake2b(w.getvalue(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Recording:
+    """Записана сесія: стартовий знімок, дії (tick, код, a, b) і хеші по тіках.
+
+    hashes[i] — хеш стану після тіку start_tick + i + 1;
+    final_hash — після всіх дій (разом з тими, що після останнього тіку).
+    """
+
+    def __init__(self, snapshot: bytes, start_tick: int, chase_radius: int,
+                 tracking_radius: int, tick_rate: int = 60):
+        self.snapshot = snapshot
+        self.start_tick = start_tick
+        self.chase_radius = chase_radius
+        self.tracking_radius = tracking_radius
+        self.tick_rate = tick_rate
+        self.actions = []
+        self.hashes = []
+        self.final_hash = 0
+
+    @property
+    def end_tick(self) -> int:
+        return self.start_tick + len(self.hashes)
+
+    def encode(self) -> bytes:
+        w = Writer()
+        w.pack("QIIH", self.start_tick, self.chase_radius,
+               self.tracking_radius, self.tick_rate)
+        w.blob(self.snapshot)
+
+        actions = self.actions
+        w.pack("I", len(actions))
+        w.column([a[0] for a in actions], "I")
+        w.column([a[1] for a in actions], "B")
+        w.column([a[2] for a in actions], "i")
+        w.column([a[3] for a in actions], "i")
+
+        hashes = self.hashes
+        w.pack("IQ", len(hashes), self.final_hash)
+        w.column([h & 0xFFFFFFFF for h in hashes], "I")
+        w.column([h >> 32 for h in hashes], "I")
+
+        return binfile.encode(w.getvalue(), MAGIC, REPLAY_VERSION)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "Recording":
+        payload = binfile.decode(data, MAGIC, REPLAY_VERSION, "запису")
+
+        r = Reader(payload)
+        start_tick, chase_radius, tracking_radius, tick_rate = r.unpack("QIIH")
+        recording = cls(r.blob(), start_tick, chase_radius, tracking_radius, tick_rate)
+
+        count = r.unpack("I")
+        columns = [r.column(code, count).tolist() for code in ("I", "B", "i", "i")]
+        recording.actions = list(zip(*columns))
+
+        count, recording.final_hash = r.unpack("IQ")
+        low = r.column("I", count).tolist()
+        high = r.column("I", count).tolist()
+        recording.hashes = [lo | (hi << 32) for lo, hi in zip(low, high)]
+        return recording
+
+    def save(self, path: str):
+        write_file(path, self.encode())
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+class Recorder:
+    """Пише сесію: start() на початку гри, record_*() на кожну дію, on_tick() після тіку."""
+
+    def __init__(self, tick_rate: int = 60):
+        self.tick_rate = tick_rate
+        self.recording = None
+
+    @property
+    def active(self) -> bool:
+        return self.recording is not None
+
+    def start(self, sim):
+        """Почати новий запис з поточного стану sim (попередній відкидається)."""
+        self.recording = Recording(
+            capture(sim), sim.tick_count, sim.chase_radius,
+            sim.flow_field.max_distance, self.tick_rate,
+        )
+
+    def record_move(self, sim, dx: int, dy: int):
+        self._record(sim, ACTION_MOVE, dx, dy)
+
+    def record_use_item(self, sim, index: int):
+        self._record(sim, ACTION_USE_ITEM, index, 0)
+
+    def _record(self, sim, code: int, a: int, b: int):
+        if self.recording is not None:
+            self.recording.actions.append((sim.tick_count, code, a, b))
+
+    def on_tick(self, sim):
+        """Після sim.tick(): хеш нового стану (тік, що не відбувся — напр. game over, — пропускаємо)."""
+        recording = self.recording
+        if recording is not None and sim.tick_count > recording.end_tick:
+            recording.hashes.append(state_hash(sim))
+
+    def save(self, sim, path: str):
+        """Записати сесію на диск, не зупиняючи запис (final_hash — поточний стан)."""
+        recording = self.recording
+        if recording is None:
+            return
+        recording.final_hash = state_hash(sim)
+        recording.save(path)
+
+    def stop(self, sim):
+        """Завершити запис; повертає Recording (None — запису не було)."""
+        recording = self.recording
+        if recording is not None:
+            recording.final_hash = state_hash(sim)
+        self.recording = None
+        return recording
+
+
+class Replayer:
+    """Програє Recording: ті самі дії на тих самих тіках, з перевіркою хешів.
+
+    sim — симуляція, в яку програвати (напр. Game.sim для перегляду на екрані);
+    None — створити окрему headless-симуляцію з параметрами запису.
+    """
+
+    def __init__(self, recording: Recording, sim=None, dungeon_backend: str = "numpy",
+                 verify: bool = True):
+        self.recording = recording
+        self.verify = verify
+        if sim is None:
+            sim = load_simulation(
+                recording.snapshot, dungeon_backend=dungeon_backend,
+                chase_radius=recording.chase_radius,
+                tracking_radius=recording.tracking_radius,
+            )
+        else:
+            apply(sim, recording.snapshot)
+            if (sim.chase_radius, sim.flow_field.max_distance) != \
+                    (recording.chase_radius, recording.tracking_radius):
+                print("[WARN] Радіуси AI не збігаються з записом — прогін може розійтися")
+        self.sim = sim
+
+        self._next_action = 0
+        self.diverged_at = None   # перший тік, де хеш не збігся
+
+    @property
+    def finished(self) -> bool:
+        return self.sim.tick_count >= self.recording.end_tick
+
+    def _apply_actions(self):
+        actions = self.recording.actions
+        sim = self.sim
+        tick = sim.tick_count
+        i = self._next_action
+        while i < len(actions) and actions[i][0] <= tick:
+            _, code, a, b = actions[i]
+            if code == ACTION_MOVE:
+                sim.try_move_or_attack(a, b)
+            elif code == ACTION_USE_ITEM:
+                sim.use_item(a)
+            i += 1
+        self._next_action = i
+
+    def step(self) -> bool:
+        """Дії поточного тіку + один тік. False — запис закінчився."""
+        if self.finished:
+            self._apply_actions()    # дії після останнього тіку
+            return False
+
+        sim = self.sim
+        self._apply_actions()
+        before = sim.tick_count
+        sim.tick()
+        if sim.tick_count == before:
+            # симуляція зупинилась (game over), а запис ще ні — це вже розбіжність
+            if self.diverged_at is None:
+                self.diverged_at = before + 1
+            return False
+
+        if self.verify and self.diverged_at is None:
+            expected = self.recording.hashes[sim.tick_count - self.recording.start_tick - 1]
+            if state_hash(sim) != expected:
+                self.diverged_at = sim.tick_count
+        return True
+
+    def run(self, stop_on_divergence: bool = True):
+        """Прогнати весь запис без рендеру і без пауз — так швидко, як дозволяє CPU.
+
+        Повертає dict: ticks, seconds, ticks_per_sec, diverged_at, final_match.
+        """
+        start = time.perf_counter()
+        ticks = 0
+        while self.step():
+            ticks += 1
+            if stop_on_divergence and self.diverged_at is not None:
+                break
+        seconds = time.perf_counter() - start
+
+        final_match = None
+        if self.verify and self.diverged_at is None:
+            final_match = state_hash(self.sim) == self.recording.final_hash
+        return {
+            "ticks": ticks,
+            "seconds": seconds,
+            "ticks_per_sec": ticks / seconds if seconds > 0 else float("inf"),
+            "diverged_at": self.diverged_at,
+            "final_match": final_match,
+        }
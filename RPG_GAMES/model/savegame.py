@@ -0,0 +1,361 @@
+# model/savegame.py
+
+import gc
+import threading
+import time
+
+from . import binfile
+from .binfile import Reader, SaveError, Writer, write_file
+from .chunked_dungeon import ChunkedDungeonMap
+from .dungeon_grid import create_dungeon
+from .enemy_store import DIRECTIONS, STATE_COLUMNS
+from .item import Item, ItemType, ItemRarity, item_factory
+
+
+# Файл — контейнер binfile (заголовок з MAGIC і версією + zlib(payload)).
+# payload — секції в фіксованому порядку (див. capture), усе little-endian.
+# Колонки ворогів і предметів пишуться суцільними масивами, тож великі
+# рівні читаються за мілісекунди (numpy.frombuffer / array.frombytes).
+MAGIC = b"RPGSAVE\0"
+SAVE_VERSION = 1
+
+SEED_NONE = 0      # seed: None
+SEED_INT = 1       # ціле будь-якої довжини — десятковим текстом
+SEED_STR = 2       # рядок (або будь-що інше — через str)
+
+MAP_ROWS = 0       # звичайна карта: усі тайли
+MAP_CHUNKED = 1    # світ чанками: лише параметри генератора
+
+_ITEM_COLUMNS = (("x", "i"), ("y", "i"), ("type", "B"), ("rarity", "B"), ("durability", "i"))
+
+
+# ---------- знімок стану ----------
+
+def _write_seed(w: Writer, seed):
+    if seed is None:
+        w.pack("B", SEED_NONE)
+    elif isinstance(seed, int):
+        w.pack("B", SEED_INT)
+        w.blob(str(int(seed)).encode("ascii"))
+    else:
+        w.pack("B", SEED_STR)
+        w.blob(str(seed).encode("utf-8"))
+
+
+def _read_seed(r: Reader):
+    tag = r.unpack("B")
+    if tag == SEED_NONE:
+        return None
+    if tag == SEED_INT:
+        return int(r.blob().decode("ascii"))
+    if tag == SEED_STR:
+        return r.blob().decode("utf-8")
+    raise SaveError(f"невідомий тип seed {tag}")
+
+
+def _write_item(w: Writer, item):
+    if item is None:
+        w.pack("B", 0)
+        return
+    w.pack("BBBiii", 1, item.type.value, item.rarity.value,
+           item.durability, item.x, item.y)
+
+
+def _read_item(r: Reader):
+    if r.unpack("B") == 0:
+        return None
+    type_value, rarity_value, durability, x, y = r.unpack("BBiii")
+    definition = item_factory.get_def(ItemType(type_value), ItemRarity(rarity_value))
+    return Item(x, y, definition, durability)
+
+
+def capture(sim) -> bytes:
+    """Увесь стан Simulation як payload (без стиснення).
+
+    Швидка частина збереження — її можна робити в головному потоці між тіками,
+    а стиснення і запис на диск віддати фоновому потоку (AutoSaver).
+    """
+    w = Writer()
+
+    # -- прогін --
+    _write_seed(w, sim.seed)
+    w.pack("QBB", sim.tick_count, sim.doors_open, sim.game_over)
+
+    # стан RNG прогону, щоб після завантаження лут кидався так само
+    version, internal, gauss = sim.rng.getstate()
+    w.pack("BI", version, len(internal))
+    w.column(internal, "I")
+    w.pack("Bd", gauss is not None, gauss or 0.0)
+
+    # -- карта --
+    dungeon = sim.dungeon
+    if isinstance(dungeon, ChunkedDungeonMap):
+        w.pack("BII", MAP_CHUNKED, dungeon.width, dungeon.height)
+        _write_seed(w, dungeon.seed)
+        w.pack("II", dungeon.chunk_size, dungeon.keep_radius)
+    else:
+        tiles = getattr(dungeon, "tiles", None)
+        data = tiles.tobytes() if tiles is not None else "".join(dungeon.level_data).encode("ascii")
+        w.pack("BII", MAP_ROWS, dungeon.width, dungeon.height)
+        w.blob(data)
+
+    cleared = sorted(sim.cleared_spawns)
+    w.pack("I", len(cleared))
+    w.column([x for x, _ in cleared], "i")
+    w.column([y for _, y in cleared], "i")
+
+    # -- гравець --
+    p = sim.player
+    w.pack("iiiiiiBH", p.x, p.y, p.hp, p.max_hp, p.attack, p.defense,
+           DIRECTIONS.index(p.direction), p.inventory_capacity)
+    _write_item(w, p.weapon)
+    _write_item(w, p.armor)
+    w.pack("H", len(p.inventory))
+    for item in p.inventory:
+        _write_item(w, item)
+
+    # -- предмети на підлозі --
+    items = sim.items
+    w.pack("I", len(items))
+    w.column([i.x for i in items], "i")
+    w.column([i.y for i in items], "i")
+    w.column([i.type.value for i in items], "B")
+    w.column([i.rarity.value for i in items], "B")
+    w.column([i.durability for i in items], "i")
+
+    # -- вороги (лише живі) --
+    columns = sim.enemy_store.export_columns()
+    count = len(columns["x"])
+    w.pack("I", count)
+    for name, code in STATE_COLUMNS:
+        w.column(columns[name], code)
+
+    return w.getvalue()
+
+
+def encode(payload: bytes, level: int = 6) -> bytes:
+    """Заголовок + стиснений payload — готовий вміст файлу."""
+    return binfile.encode(payload, MAGIC, SAVE_VERSION, level)
+
+
+def decode(data: bytes) -> bytes:
+    """Перевіряє заголовок і повертає розпакований payload."""
+    return binfile.decode(data, MAGIC, SAVE_VERSION, "збереження")
+
+
+# ---------- відновлення ----------
+
+def apply(sim, payload: bytes):
+    """Відновлює стан Simulation з payload (на місці: той самий Player, ті самі індекси)."""
+    # тисячі нових Item / bucket'ів індексу інакше запускають повні проходи GC
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        _apply(sim, payload)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _apply(sim, payload: bytes):
+    r = Reader(payload)
+
+    # -- прогін --
+    seed = _read_seed(r)
+    tick_count, doors_open, game_over = r.unpack("QBB")
+    rng_version, rng_len = r.unpack("BI")
+    internal = tuple(int(v) for v in r.column("I", rng_len))
+    has_gauss, gauss = r.unpack("Bd")
+
+    # -- карта --
+    kind = r.unpack("B")
+    if kind == MAP_CHUNKED:
+        width, height = r.unpack("II")
+        world_seed = _read_seed(r)
+        chunk_size, keep_radius = r.unpack("II")
+        dungeon = ChunkedDungeonMap(width, height, seed=world_seed,
+                                    chunk_size=chunk_size, keep_radius=keep_radius)
+    elif kind == MAP_ROWS:
+        width, height = r.unpack("II")
+        data = r.blob().decode("ascii")
+        rows = [data[y * width:(y + 1) * width] for y in range(height)]
+        dungeon = create_dungeon(rows, sim.dungeon_backend)
+    else:
+        raise SaveError(f"невідомий тип карти {kind}")
+
+    count = r.unpack("I")
+    xs = r.column("i", count)
+    ys = r.column("i", count)
+    cleared = set(zip((int(x) for x in xs), (int(y) for y in ys)))
+
+    # -- гравець --
+    (px, py, hp, max_hp, attack, defense,
+     direction, capacity) = r.unpack("iiiiiiBH")
+    weapon = _read_item(r)
+    armor = _read_item(r)
+    inventory = [_read_item(r) for _ in range(r.unpack("H"))]
+
+    # -- предмети --
+    count = r.unpack("I")
+    columns = {name: r.column(code, count) for name, code in _ITEM_COLUMNS}
+    defs = {
+        (item_type.value, rarity.value): item_factory.get_def(item_type, rarity)
+        for item_type in ItemType for rarity in ItemRarity
+    }
+    try:
+        items = [
+            Item(x, y, defs[(t, rr)], d)
+            for x, y, t, rr, d in zip(*(columns[name].tolist() for name, _ in _ITEM_COLUMNS))
+        ]
+    except KeyError as e:
+        raise SaveError(f"невідомий предмет {e}")
+
+    # -- вороги --
+    count = r.unpack("I")
+    enemy_columns = {name: r.column(code, count) for name, code in STATE_COLUMNS}
+
+    # ---- усе прочитали без помилок — тепер міняємо стан ----
+    sim.seed = seed
+    sim.rng.setstate((rng_version, internal, gauss if has_gauss else None))
+    sim.replace_dungeon(dungeon)
+    sim.tick_count = tick_count
+    sim.doors_open = bool(doors_open)
+    sim.game_over = bool(game_over)
+    sim.cleared_spawns = cleared
+
+    player = sim.player
+    player.x, player.y = px, py
+    player.prev_x, player.prev_y = px, py
+    player.moved_tick = -1
+    player.max_hp = max_hp
+    player.hp = hp
+    player.attack = attack        # уже з бонусом зброї — тому без equip_*
+    player.defense = defense
+    player.weapon = weapon
+    player.armor = armor
+    player.inventory = inventory
+    player.inventory_capacity = capacity
+    player.direction = DIRECTIONS[direction]
+    player.walk_timer = 0
+    player.mark_changed()
+
+    if sim.streaming:
+        # активуємо чанки навколо гравця, не спавнячи їхніх сутностей удруге
+        dungeon.ensure_loaded(px, py)
+
+    sim.items = items
+    sim.item_index.rebuild(items)
+    sim.enemies = sim.enemy_store.import_columns(enemy_columns, count)
+    sim.enemy_index.rebuild(sim.enemies)
+
+
+def load_simulation(payload: bytes, **sim_kwargs):
+    """Нова Simulation одразу зі стану payload (реплеї, бенчмарки)."""
+    from .simulation import Simulation
+    sim = Simulation(["@"], **sim_kwargs)    # карта-заглушка: apply замінить
+    apply(sim, payload)
+    return sim
+
+
+# ---------- файли ----------
+
+def save_game(sim, path: str):
+    """Зберегти гру синхронно."""
+    write_file(path, encode(capture(sim)))
+
+
+def load_game(sim, path: str) -> bool:
+    """Завантажити гру в sim. False (з [WARN]), якщо файлу нема або він пошкоджений."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        apply(sim, decode(data))
+    except FileNotFoundError:
+        print(f"[WARN] Збереження не знайдено: {path}")
+        return False
+    except (OSError, SaveError, ValueError) as e:
+        print(f"[WARN] Не вдалося завантажити {path}: {e}")
+        return False
+    return True
+
+
+class AutoSaver:
+    """Автозбереження у фоновому потоці.
+
+    request() знімає стан (capture — швидко, в головному потоці), а стиснення
+    і запис на диск робить робочий потік, тож кадр не чекає на диск.
+    Якщо попередній запис ще триває, береться лише найновіший знімок.
+    """
+
+    def __init__(self, path: str, interval_ticks: int = 0):
+        self.path = path
+        self.interval_ticks = interval_ticks   # 0 — лише явні request()
+        self.saves = 0
+        self.last_error = None
+        self.last_duration = 0.0
+
+        self._last_tick = None
+        self._pending = None
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def maybe_save(self, sim):
+        """Викликати щотіку: зберігає раз на interval_ticks тіків."""
+        if self.interval_ticks <= 0 or sim.game_over:
+            return
+        if self._last_tick is None:
+            self._last_tick = sim.tick_count
+        elif sim.tick_count - self._last_tick >= self.interval_ticks:
+            self.request(sim)
+
+    def reset(self, sim):
+        """Відлік інтервалу — від поточного тіку (нова гра, завантаження, реплей)."""
+        self._last_tick = sim.tick_count
+
+    def request(self, sim):
+        """Зберегти поточний стан у фоні."""
+        self._last_tick = sim.tick_count
+        payload = capture(sim)
+        with self._cond:
+            self._pending = payload
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="autosave", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Дочекатися, поки все заплановане буде записано (напр. перед виходом)."""
+        deadline = time.perf_counter() + timeout
+        with self._cond:
+            while self._pending is not None or self._busy:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                payload = self._pending
+                self._pending = None
+                self._busy = True
+
+            start = time.perf_counter()
+            try:
+                write_file(self.path, encode(payload))
+                self.saves += 1
+                self.last_error = None
+            except OSError as e:
+                self.last_error = e
+                print(f"[WARN] Автозбереження не вдалося: {e}")
+            self.last_duration = time.perf_counter() - start
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
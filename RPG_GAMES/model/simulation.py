@@ -0,0 +1,470 @@
+# model/simulation.py
+
+import random
+
+from .dungeon import DungeonMap
+from .dungeon_grid import create_dungeon
+from .player import Player
+from .enemy import Enemy
+from .enemy_store import create_enemy_store
+from .item import ItemType, item_factory
+from .loot import LootRoller
+from .spatial import SpatialIndex
+from .pathfinding import FlowField
+from .fov import FieldOfView
+
+
+class Simulation:
+    """Ігрові правила без pygame: карта, гравець, вороги, предмети, двері.
+
+    Світ рухається дискретно: дії гравця (try_move_or_attack, use_item)
+    і тіки (tick). Нічого не малює і не чекає кадрів — Game лише
+    передає сюди ввід і показує стан, а тести/бенчмарки ганяють
+    тіки без екрана.
+
+    level_data — список рядків карти або вже готовий DungeonMap
+    (напр. ChunkedDungeonMap для світу, що генерується чанками).
+
+    Про події Simulation повідомляє через колбеки (None — ігнорувати):
+      on_message(text)   — рядок для логу
+      on_player_death()  — гравець загинув
+      on_level_exit()    — гравець пройшов у відчинені двері
+    """
+
+    def __init__(self, level_data, dungeon_backend: str = "numpy",
+                 chase_radius: int = 4, tracking_radius: int = 32, seed=None):
+        # власний RNG прогону: той самий seed — ті самі кидки луту
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.dungeon_backend = dungeon_backend
+        if isinstance(level_data, DungeonMap):
+            self.dungeon = level_data
+        else:
+            self.dungeon = create_dungeon(level_data, dungeon_backend)
+
+        # світ чанками: сутності додаються / прибираються разом із чанками
+        self.streaming = hasattr(self.dungeon, "ensure_loaded")
+        # спавни вбитих ворогів і піднятих предметів — щоб не з'являлись знову
+        self.cleared_spawns = set()
+
+        start_x, start_y = self.dungeon.find_player_start()
+        self.player = Player(start_x, start_y)
+
+        # радіус, з якого вороги ВПЕРШЕ помічають гравця (кроків ходьбою)
+        self.chase_radius = chase_radius
+
+        # спільне поле відстаней від гравця для AI ворогів
+        self.flow_field = FlowField(self.dungeon, tracking_radius)
+
+        # поле зору / лінія видимості (сприйняття ворогів)
+        self.fov = FieldOfView(self.dungeon)
+
+        # індекси зайнятості (в enemy_index — лише живі вороги)
+        self.enemy_index = SpatialIndex()
+        self.item_index = SpatialIndex()
+
+        # вороги — паралельні масиви (NumPy) з Enemy-подібними view
+        self.enemy_store = create_enemy_store(dungeon_backend)
+
+        # предмети створюються лише фабрикою (спільні ItemDef на тип і рідкість),
+        # рідкість кидається з таблиць луту на RNG прогону
+        self.item_factory = item_factory
+        self.loot = LootRoller(self.rng, factory=item_factory)
+
+        self.enemies = []
+        self.items = []
+        self.doors_open = False
+        self.game_over = False
+        self.tick_count = 0
+
+        self.on_message = None
+        self.on_player_death = None
+        self.on_level_exit = None
+
+        self.spawn_level()
+
+    # ---------- події ----------
+
+    def _message(self, text: str):
+        if self.on_message is not None:
+            self.on_message(text)
+
+    def _player_died(self):
+        self.game_over = True
+        if self.on_player_death is not None:
+            self.on_player_death()
+
+    # ---------- рівень ----------
+
+    def spawn_level(self):
+        """Розставляє монстрів і предмети з карти, зачиняє двері."""
+        self.doors_open = False
+        self.game_over = False
+        self.cleared_spawns.clear()
+
+        if self.streaming:
+            self.dungeon.ensure_loaded(self.player.x, self.player.y)
+
+        self.enemy_store.clear()
+        self.enemies = self.enemy_store.spawn_many(self.dungeon.find_enemy_positions())
+        self.enemy_index.rebuild(self.enemies)
+
+        # усі предмети рівня — одним пакетом зі спільних ItemDef
+        self.items = self.loot.create_items(self.dungeon.find_item_positions())
+        self.item_index.rebuild(self.items)
+
+    def _stream_world(self):
+        """Світ чанками: сутності нових чанків біля гравця — в гру, далеких — геть."""
+        loaded, evicted = self.dungeon.ensure_loaded(self.player.x, self.player.y)
+        if not loaded and not evicted:
+            return
+
+        if evicted:
+            gone = set(evicted)
+            chunk_of = self.dungeon.chunk_of
+            evicted_enemies = [e for e in self.enemies if chunk_of(*e.spawn) in gone]
+            for enemy in evicted_enemies:
+                self.enemy_index.remove(enemy)
+                self.enemy_store.release(enemy)
+            if evicted_enemies:
+                dropped = set(map(id, evicted_enemies))
+                self.enemies[:] = [e for e in self.enemies if id(e) not in dropped]
+            for item in [i for i in self.items if chunk_of(i.x, i.y) in gone]:
+                self.items.remove(item)
+                self.item_index.remove(item)
+
+        cleared = self.cleared_spawns
+        for key in loaded:
+            enemy_positions, item_positions = self.dungeon.chunk_markers(*key)
+            for x, y in enemy_positions:
+                if (x, y) not in cleared:
+                    enemy = self.enemy_store.spawn(x, y)
+                    self.enemies.append(enemy)
+                    self.enemy_index.insert(enemy)
+            for x, y, ch in item_positions:
+                if (x, y) in cleared:
+                    continue
+                item = self.create_item(x, y, ch)
+                if item is not None:
+                    self.items.append(item)
+                    self.item_index.insert(item)
+
+    def replace_dungeon(self, dungeon):
+        """Інша карта (напр. із збереження): поле відстаней і поле зору — на неї."""
+        self.dungeon = dungeon
+        self.streaming = hasattr(dungeon, "ensure_loaded")
+        self.flow_field = FlowField(dungeon, self.flow_field.max_distance)
+        self.fov = FieldOfView(dungeon, self.fov.cache_size)
+
+    def reset(self, seed=None):
+        """Нова гра: гравець на старт з повним HP, рівень заново.
+
+        seed — почати RNG прогону заново (інакше продовжуємо поточний).
+        """
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+        start_x, start_y = self.dungeon.find_player_start()
+        self.player.x = start_x
+        self.player.y = start_y
+        self.player.heal(self.player.max_hp)
+        self.player.moved_tick = -1
+        self.spawn_level()
+
+    # ---------- предмети ----------
+
+    def create_item(self, x: int, y: int, ch: str):
+        """Предмет за символом карти (H, A, W, R) з випадковою рідкістю."""
+        return self.loot.create_item(x, y, ch)
+
+    # ---------- дії гравця ----------
+
+    def try_move_or_attack(self, dx: int, dy: int):
+        """Рух або атака по ворогу в напрямку."""
+        if self.game_over:
+            return
+
+        new_x = self.player.x + dx
+        new_y = self.player.y + dy
+
+        if not self.dungeon.is_walkable(new_x, new_y):
+            return
+
+        # в індексі лише живі вороги — мертвих прибираємо в handle_combat
+        target_enemy = self.enemy_index.first_at(new_x, new_y)
+
+        if target_enemy:
+            self.handle_combat(target_enemy)
+        else:
+            # рух
+            old_x, old_y = self.player.x, self.player.y
+            self.player.move(dx, dy, self.dungeon)
+            if (self.player.x, self.player.y) != (old_x, old_y):
+                self._mark_moved(self.player, old_x, old_y)
+            # перевірка, чи наступив на предмет
+            self.check_item_pickup()
+            #перевірка, чи наступив на двері
+            self.check_exit_tile()
+
+    def handle_combat(self, enemy: Enemy):
+        """Гравець атакує ворога, ворог (якщо живий) б'є у відповідь."""
+        enemy.take_damage(self.player.attack)
+        self._message("Ти вдарив монстра!")
+
+        # 🔹 знос зброї
+        if self.player.wear_weapon() is not None:
+            self._message("Твоя зброя зламалася!")
+
+        if not enemy.is_alive():
+            self.enemy_index.remove(enemy)
+            self.cleared_spawns.add(enemy.spawn)
+            self._message("Монстр переможений!")
+            return
+
+        self.player.take_damage(enemy.attack)
+        self._message("Монстр вдарив у відповідь!")
+
+        # 🔹 знос броні
+        if self.player.wear_armor() is not None:
+            self._message("Твоя броня зламалася!")
+
+        if not self.player.is_alive():
+            self._message("Ви загинули...")
+            self._player_died()
+
+    def check_item_pickup(self):
+        """Перевіряє, чи на клітинці гравця є предмет, і кладе його в інвентар."""
+        for item in self.item_index.at(self.player.x, self.player.y):
+            if not self.player.add_item(item):
+                self._message("Інвентар повний! Не можу підняти предмет.")
+                continue
+
+            self.items.remove(item)
+            self.item_index.remove(item)
+            self.cleared_spawns.add((item.x, item.y))
+
+            if item.type == ItemType.HEAL:
+                self._message("Підібрано зілля лікування.")
+            elif item.type == ItemType.ATTACK:
+                self._message("Підібрано зілля сили.")
+            elif item.type == ItemType.WEAPON:
+                self._message("Підібрано зброю.")
+            elif item.type == ItemType.ARMOR:
+                self._message("Підібрано броню.")
+            else:
+                self._message("Підібрано предмет.")
+
+    def check_exit_tile(self):
+        """Якщо гравець стоїть на 'E' і двері відкриті — перехід до наступної локації."""
+        x = self.player.x
+        y = self.player.y
+
+        # перевірка меж
+        if y < 0 or y >= self.dungeon.height:
+            return
+        if x < 0 or x >= self.dungeon.width:
+            return
+
+        ch = self.dungeon.level_data[y][x]
+
+        if ch != "E":
+            return
+
+        if not self.doors_open:
+            self._message("Двері зачинені. Спочатку переможи всіх монстрів.")
+            return
+
+        # 🔹 Тут поки що просто рівень завершено
+        self._message("Ти проходиш крізь двері в наступну локацію!")
+        self.game_over = True
+        if self.on_level_exit is not None:
+            self.on_level_exit()
+
+    def use_item(self, idx: int):
+        """Використати предмет з інвентарю за індексом."""
+        inv = self.player.inventory
+        if not inv:
+            self._message("Інвентар порожній.")
+            return
+
+        if idx < 0 or idx >= len(inv):
+            return
+
+        item = inv[idx]
+
+        if item.type == ItemType.HEAL:
+            gained = self.player.heal(item.value)
+            if gained > 0:
+                self._message(f"Використано зілля: +{gained} HP")
+            else:
+                self._message("HP вже повне.")
+            self.player.remove_item(idx)
+
+        elif item.type == ItemType.ATTACK:
+            self.player.add_attack(item.value)
+            self._message(f"Використано зілля сили: +{item.value} ATK")
+            self.player.remove_item(idx)
+
+        elif item.type == ItemType.WEAPON:
+            self.player.equip_weapon(item)
+            self._message(
+                f"Екіповано зброю (+{item.value} ATK, durability {item.durability})."
+            )
+            # зброю прибираємо з інвентарю, тепер вона в слоті weapon
+            self.player.remove_item(idx)
+
+        elif item.type == ItemType.ARMOR:
+            self.player.equip_armor(item)
+            self._message(
+                f"Екіповано броню (+{item.value} DEF, durability {item.durability})."
+            )
+            self.player.remove_item(idx)
+
+        else:
+            self._message("Нічого не сталося...")
+
+    # ---------- тік світу ----------
+
+    def tick(self):
+        """Один крок симуляції: таймери, AI ворогів, двері."""
+        if self.game_over:
+            return
+
+        if self.streaming:
+            self._stream_world()
+
+        self.player.update()
+
+        # таймери всіх ворогів — одна векторна операція
+        self.enemy_store.update()
+
+        self.update_enemies_ai()
+        # 🔹 Якщо всі вороги мертві — відкриваємо двері (маска живих у сховищі)
+        if not self.doors_open and self.enemy_store.all_dead():
+            self.doors_open = True
+            self._message("Десь у підземеллі відчинилися двері...")
+
+        self.tick_count += 1
+
+    def _mark_moved(self, entity, old_x: int, old_y: int):
+        """Запам'ятати крок для інтерполяції: з (old_x, old_y) на тіку tick_count.
+
+        Крок гравця між тіками теж отримує номер наступного тіку —
+        показується він разом з рештою світу цього тіку.
+        """
+        entity.prev_x = old_x
+        entity.prev_y = old_y
+        entity.moved_tick = self.tick_count
+
+    def run_ticks(self, count: int):
+        """Прогнати count тіків без жодного очікування (для тестів / бенчмарків)."""
+        for _ in range(count):
+            if self.game_over:
+                break
+            self.tick()
+
+    def update_enemies_ai(self):
+        """AI: скелети йдуть до гравця по спільному полю відстаней (в обхід стін).
+        Помічають гравця лише в радіусі і в прямій видимості (не крізь стіни).
+        Якщо хоч раз тебе побачили — переслідують завжди.
+        """
+        # поле рахуємо раз на крок гравця і ділимо між усіма ворогами
+        if self.flow_field.origin != (self.player.x, self.player.y):
+            self.flow_field.compute(self.player.x, self.player.y)
+
+        chase_radius = self.chase_radius
+
+        # хто в зоні видимості гравця — той бачить і гравця (поле зору кешоване)
+        seen = self.fov.compute(self.player.x, self.player.y, chase_radius)
+
+        # кулдаун стартує в усіх готових; решта циклу — лише для тих,
+        # хто агро або досить близько, щоб помітити гравця
+        ready = self.enemy_store.take_ready(self.player.x, self.player.y, chase_radius)
+        for enemy in ready:
+            # справжня відстань ходьбою (None — недосяжно або далі за поле)
+            dist = self.flow_field.distance(enemy.x, enemy.y)
+
+            # бачить гравця: близько ходьбою і не крізь стіну
+            notices = (
+                dist is not None and dist <= chase_radius
+                and (enemy.x, enemy.y) in seen
+            )
+
+            # 🔹 якщо ще не агро і гравця не видно — ігноримо
+            if not enemy.aggro and not notices:
+                continue
+
+            # 🔹 якщо гравця хоч раз побачили в радіусі — запам’ятали
+            if notices:
+                enemy.aggro = True
+
+            # якщо раптом опинились на тій самій клітинці
+            if dist == 0:
+                self.enemy_attack(enemy)
+                continue
+
+            step = None
+            if dist is not None:
+                # крок униз по полю; зайняті іншими ворогами клітинки обходимо
+                step = self.flow_field.next_step(
+                    enemy.x, enemy.y, self.enemy_index.is_occupied
+                )
+            else:
+                # агро-ворог поза полем — старий жадібний крок до гравця
+                dx = self.player.x - enemy.x
+                dy = self.player.y - enemy.y
+                if abs(dx) >= abs(dy) and dx != 0:
+                    step = (enemy.x + (1 if dx > 0 else -1), enemy.y)
+                elif dy != 0:
+                    step = (enemy.x, enemy.y + (1 if dy > 0 else -1))
+
+            if step is None:
+                continue
+
+            target_x, target_y = step
+            step_x = target_x - enemy.x
+            step_y = target_y - enemy.y
+
+            # атака, якщо впритул заходить на клітинку гравця
+            if target_x == self.player.x and target_y == self.player.y:
+                self.enemy_attack(enemy)
+                continue
+
+            # не проходимо крізь стіни
+            if not self.dungeon.is_walkable(target_x, target_y):
+                continue
+
+            # не ліземо в іншого ворога
+            if self.enemy_index.is_occupied(target_x, target_y):
+                continue
+
+            # рухаємо ворога
+            old_x, old_y = enemy.x, enemy.y
+            enemy.x = target_x
+            enemy.y = target_y
+            self.enemy_index.move(enemy, old_x, old_y)
+            self._mark_moved(enemy, old_x, old_y)
+
+            # напрямок для анімації
+            if step_x > 0:
+                enemy.direction = "right"
+            elif step_x < 0:
+                enemy.direction = "left"
+            elif step_y > 0:
+                enemy.direction = "down"
+            elif step_y < 0:
+                enemy.direction = "up"
+
+            enemy.start_walk()
+
+    def enemy_attack(self, enemy: Enemy):
+        """Скелет б'є гравця, без зустрічного удару."""
+        self.player.take_damage(enemy.attack)
+        self._message("Скелет вдарив тебе!")
+
+        if not self.player.is_alive():
+            self._message("Ти загинув...")
+            self._player_died()
@@ -0,0 +1,103 @@
+# model/spatial.py
+
+
+class SpatialIndex:
+    """Індекс зайнятості для сутностей (вороги, предмети).
+
+    Два рівні: сітка клітинок — хто стоїть на (x, y) за O(1), і чанки —
+    усі сутності в прямокутнику тайлів без перебору решти.
+    Координати сутностей змінюються ззовні, тому після руху
+    треба викликати move(entity, old_x, old_y).
+    """
+
+    def __init__(self, chunk_size: int = 16, entities=()):
+        self.chunk_size = chunk_size
+        self._buckets = {}   # (cx, cy) -> dict id(entity) -> entity (порядок вставки)
+        self._cells = {}     # (x, y) -> dict id(entity) -> entity
+        self._count = 0
+        for entity in entities:
+            self.insert(entity)
+
+    def __len__(self):
+        return self._count
+
+    def _chunk_of(self, x: int, y: int):
+        return x // self.chunk_size, y // self.chunk_size
+
+    def insert(self, entity):
+        # координати читаємо один раз (у EnemyView це звернення до масивів)
+        x = entity.x
+        y = entity.y
+        key = (x // self.chunk_size, y // self.chunk_size)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+        if id(entity) not in bucket:
+            bucket[id(entity)] = entity
+            self._count += 1
+
+            cell_key = (x, y)
+            cell = self._cells.get(cell_key)
+            if cell is None:
+                cell = self._cells[cell_key] = {}
+            cell[id(entity)] = entity
+
+    def remove(self, entity, x: int = None, y: int = None):
+        """Прибирає сутність (x, y — де вона була, якщо вже зсунута)."""
+        if x is None:
+            x, y = entity.x, entity.y
+        key = self._chunk_of(x, y)
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.pop(id(entity), None) is None:
+            return
+        self._count -= 1
+        if not bucket:
+            del self._buckets[key]
+
+        cell = self._cells.get((x, y))
+        if cell is not None:
+            cell.pop(id(entity), None)
+            if not cell:
+                del self._cells[(x, y)]
+
+    def move(self, entity, old_x: int, old_y: int):
+        """Оновлює індекс після того, як сутність перейшла з (old_x, old_y)."""
+        self.remove(entity, old_x, old_y)
+        self.insert(entity)
+
+    def rebuild(self, entities):
+        self._buckets.clear()
+        self._cells.clear()
+        self._count = 0
+        for entity in entities:
+            self.insert(entity)
+
+    def at(self, x: int, y: int):
+        """Сутності на клітинці (x, y) — список, можливо порожній."""
+        cell = self._cells.get((x, y))
+        if not cell:
+            return []
+        return list(cell.values())
+
+    def first_at(self, x: int, y: int):
+        """Перша сутність на клітинці (x, y) або None."""
+        cell = self._cells.get((x, y))
+        if not cell:
+            return None
+        return next(iter(cell.values()))
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        return (x, y) in self._cells
+
+    def query(self, x0: int, y0: int, x1: int, y1: int):
+        """Сутності з x0 <= x < x1 і y0 <= y < y1 (перебираються лише потрібні чанки)."""
+        cx0, cy0 = self._chunk_of(x0, y0)
+        cx1, cy1 = self._chunk_of(x1 - 1, y1 - 1)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = self._buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity in bucket.values():
+                    if x0 <= entity.x < x1 and y0 <= entity.y < y1:
+                        yield entity
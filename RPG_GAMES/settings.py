@@ -1,5 +1,60 @@
 TILE_SIZE = 32      # перезапишемо під розмір екрану в Game
+
+# якщо карта вміщується на екран з тайлом не менше MIN_TILE_SIZE — показуємо її цілком,
+# інакше беремо фіксований CAMERA_TILE_SIZE і камера їде за гравцем
+MIN_TILE_SIZE = 24
+CAMERA_TILE_SIZE = 48
+
+# бекенд карти: "numpy" — масив uint8 з векторними запитами (якщо numpy встановлено),
+# "list" — звичайний список рядків
+DUNGEON_BACKEND = "numpy"
+
+# AI ворогів: з якої відстані (кроків ходьбою) вперше помічають гравця
+# і наскільки далеко рахується поле відстаней для переслідування
+ENEMY_CHASE_RADIUS = 4
+ENEMY_TRACKING_RADIUS = 32
+
+# фіксований крок симуляції: TICK_RATE тіків за секунду незалежно від FPS
+# (кулдауни ворогів і таймери анімації рахуються в тіках);
+# FPS — лише ліміт кадрів малювання (0 — без ліміту)
+TICK_RATE = 60
 FPS = 60
+# скільки тіків максимум доганяємо за один кадр; решту відставання відкидаємо,
+# щоб на дуже повільній машині гра сповільнилась, а не зависла
+MAX_CATCHUP_TICKS = 5
+
+# меню і вступ статичні: кадр показуємо лише при зміні, а між подіями
+# цикл спить у pygame.event.wait (мс; таймаут — щоб періодично прокидатись)
+IDLE_WAIT_MS = 500
+
+# збереження гри: F5 — зберегти, F9 — завантажити, «Продовжити» в меню;
+# автозбереження у фоні кожні AUTOSAVE_INTERVAL_TICKS тіків (0 — лише при виході в меню)
+SAVE_PATH = "saves/savegame.bin"
+AUTOSAVE_INTERVAL_TICKS = 60 * 60
+
+# запис сесії для відтворення (seed + дії по тіках + хеші стану); None — не писати.
+# Програти: python main.py --replay <файл> [--fast]
+RECORD_PATH = None
+
+# оверлей продуктивності (F3): час фаз кадру, графік, FPS, лічильники;
+# F4 — писати таймінги кожного кадру в PERF_CSV_PATH
+PERF_OVERLAY = False
+PERF_HISTORY = 240          # скільки останніх кадрів тримати для FPS / середніх
+PERF_CSV_PATH = "perf/frames.csv"
+
+# запечений атлас спрайтів (python -m view.atlas) і кеш масштабованих під
+# TILE_SIZE спрайтів на диску; якщо атласу нема або він застарів — окремі PNG
+ATLAS_MANIFEST = "assets/atlas.json"
+ASSET_CACHE_DIR = "assets/cache"
+
+# спрайти й рівень готуються у фоновому пулі, поки показане меню;
+# False — усе синхронно при старті (як раніше)
+BACKGROUND_LOADING = True
+LOADER_WORKERS = 2
+
+# Dirty-rect режим: у грі показуємо лише змінені прямокутники
+# (pygame.display.update(rects)) замість повного flip. Корисно на слабких машинах.
+DIRTY_RECTS = False
 
 GAME_TITLE = "Dungeon of Lost Memories"
 
@@ -18,6 +73,15 @@ LEVEL_MAP = [
     "########################",
 ]
 
+# процедурні рівні замість LEVEL_MAP:
+# None — ручна карта, "bsp" — один згенерований рівень GENERATED_LEVEL_SIZE,
+# "chunked" — великий світ WORLD_SIZE, що генерується чанками біля гравця
+LEVEL_GENERATOR = None
+LEVEL_SEED = None             # None — щоразу новий світ
+GENERATED_LEVEL_SIZE = (120, 80)
+WORLD_SIZE = (4096, 4096)
+WORLD_CHUNK_SIZE = 64
+
 
 
 # Текст вступу (історія гри)
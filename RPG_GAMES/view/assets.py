@@ -0,0 +1,170 @@
+# view/assets.py
+
+import os
+import time
+
+import pygame
+
+
+# порядок рядків у sprite sheet'ах персонажів: 0-down, 1-left, 2-right, 3-up
+SHEET_ROW_DIRECTIONS = ("down", "left", "right", "up")
+
+
+class AssetManager:
+    """Спільний кеш спрайтів.
+
+    Кожен PNG декодується один раз, а готові (масштабовані / нарізані) Surface
+    зберігаються за ключем (шлях, розмір, нарізка). Один екземпляр ділять
+    усі Renderer'и і всі рівні.
+
+    Якщо підключено запечений атлас (use_atlas), квадратні спрайти і кадри
+    sheet'ів беруться з нього — вже масштабовані під тайл, без декодування PNG.
+    """
+
+    def __init__(self):
+        self._images = {}   # path -> декодований Surface (або None, якщо не вийшло)
+        self._cache = {}    # (path, size, slicing) -> Surface / dict кадрів / None
+        self._preloaded = {}  # path -> декодований, але ще не convert'нутий Surface (з preload)
+
+        # статистика
+        self.hits = 0
+        self.misses = 0
+        self.load_times = {}  # path -> секунди на декодування
+        self.atlas = None     # view.atlas.SpriteAtlas або None
+        self.atlas_hits = 0
+
+    # ---------- публічне API ----------
+
+    def get_sprite(self, path: str, size):
+        """Картинка, масштабована до size=(w, h). None, якщо файлу нема."""
+        key = (path, tuple(size), None)
+        if key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+
+        self.misses += 1
+        if self._atlas_fits(size) and self.atlas.has_sprite(path):
+            image = self.atlas.get_sprite(path, size[0])
+            self.atlas_hits += 1
+        else:
+            image = self._decode(path)
+            if image is not None:
+                image = pygame.transform.smoothscale(image, tuple(size))
+        self._cache[key] = image
+        return image
+
+    def get_sheet(self, path: str, cols: int, rows: int, size,
+                  row_names=SHEET_ROW_DIRECTIONS):
+        """Ріже sprite sheet на кадри: dict[(row_name, col)] = Surface розміру size.
+
+        Рядки без назви в row_names отримують назву першого рядка.
+        """
+        key = (path, tuple(size), (cols, rows, tuple(row_names)))
+        if key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+
+        self.misses += 1
+        if self._atlas_fits(size) and self.atlas.has_sheet(path, cols, rows):
+            frames = {}
+            for row in range(rows):
+                name = row_names[row] if row < len(row_names) else row_names[0]
+                for col in range(cols):
+                    frames[(name, col)] = self.atlas.get_frame(path, row, col, size[0])
+            self.atlas_hits += 1
+            self._cache[key] = frames
+            return frames
+
+        sheet = self._decode(path)
+        frames = None
+        if sheet is not None:
+            frames = self._slice_sheet(sheet, cols, rows, tuple(size), row_names)
+            print(f"[INFO] Loaded sheet {path} with {len(frames)} frames")
+        self._cache[key] = frames
+        return frames
+
+    def get_stats(self) -> dict:
+        """Лічильники кешу і сумарний час декодування."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "decoded_files": sum(1 for img in self._images.values() if img is not None),
+            "cached_entries": len(self._cache),
+            "load_time_total": sum(self.load_times.values()),
+            "atlas_hits": self.atlas_hits,
+        }
+
+    def use_atlas(self, atlas):
+        """Брати спрайти з запеченого атласу (None — знову з окремих PNG)."""
+        self.atlas = atlas
+        self._cache.clear()
+
+    def preload(self, path: str):
+        """Декодувати файл заздалегідь — можна з фонового потоку.
+
+        convert_alpha (потрібен display) зробить головний потік при першому get_*.
+        """
+        if path in self._images or path in self._preloaded:
+            return
+        if not os.path.exists(path):
+            return           # попередження буде при звичайному завантаженні
+        start = time.perf_counter()
+        try:
+            image = pygame.image.load(path)
+        except Exception as e:
+            print(f"[ERROR] Failed to load sprite {path}: {e}")
+            return
+        self.load_times[path] = time.perf_counter() - start
+        self._preloaded[path] = image
+
+    def clear(self):
+        """Скидає кеш (наприклад, після зміни режиму екрана)."""
+        self._images.clear()
+        self._cache.clear()
+        self._preloaded.clear()
+
+    # ---------- внутрішнє ----------
+
+    def _atlas_fits(self, size) -> bool:
+        """Атлас зберігає лише квадратні тайли tile×tile."""
+        return self.atlas is not None and size[0] == size[1]
+
+    def _decode(self, path: str):
+        """Декодує файл один раз на весь час роботи гри."""
+        if path in self._images:
+            return self._images[path]
+
+        image = self._preloaded.pop(path, None)
+        if image is not None:
+            image = image.convert_alpha()
+        elif not os.path.exists(path):
+            print(f"[WARN] Sprite not found: {path}")
+        else:
+            start = time.perf_counter()
+            try:
+                image = pygame.image.load(path).convert_alpha()
+            except Exception as e:
+                print(f"[ERROR] Failed to load sprite {path}: {e}")
+            self.load_times[path] = time.perf_counter() - start
+
+        self._images[path] = image
+        return image
+
+    def _slice_sheet(self, sheet, cols: int, rows: int, size, row_names):
+        frame_w = sheet.get_width() // cols
+        frame_h = sheet.get_height() // rows
+
+        frames = {}
+        for row in range(rows):
+            name = row_names[row] if row < len(row_names) else row_names[0]
+            for col in range(cols):
+                rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
+                # subsurface без copy — smoothscale і так створює новий Surface
+                frames[(name, col)] = pygame.transform.smoothscale(
+                    sheet.subsurface(rect), size
+                )
+        return frames
+
+
+# спільний екземпляр для всієї гри
+assets = AssetManager()
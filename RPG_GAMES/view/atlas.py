@@ -0,0 +1,370 @@
+# view/atlas.py
+#
+# Офлайн-атлас спрайтів:
+#   python -m view.atlas            — запекти assets/*.png в assets/atlas.png + atlas.json
+#   python -m view.atlas --tiles 32,48  — ще й одразу підготувати кеш під ці розміри тайла
+#
+# Під час гри AssetManager бере спрайти з атласу: для кожного TILE_SIZE усі
+# спрайти і кадри sheet'ів один раз масштабуються і кладуться на диск
+# сирими RGBA-байтами (assets/cache/atlas_<tile>.raw) — наступні старти
+# просто читають один файл замість декодування і smoothscale кожного PNG.
+
+import argparse
+import glob
+import json
+import math
+import os
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+
+
+ATLAS_VERSION = 1
+
+# sprite sheet'и: файл -> (стовпчики, рядки); решта PNG — одиночні спрайти
+SHEET_LAYOUTS = {
+    "hero_sheet.png": (3, 4),
+    "enemy_sheet.png": (3, 4),
+}
+
+# великі джерела (hero.png, enemy.png — 1024px) в атласі зменшуються до цього розміру:
+# тайли все одно не бувають більші
+MAX_SPRITE_SIZE = 128
+ATLAS_WIDTH = 512
+PADDING = 1
+
+# заголовок кешу під розмір тайла: magic | version | tile | кількість | crc маніфесту
+_RAW_MAGIC = b"RPGATLS\0"
+_RAW_HEADER = struct.Struct("<8sHHII")
+
+
+def _file_crc(path: str) -> int:
+    with open(path, "rb") as f:
+        return zlib.crc32(f.read())
+
+
+def _source_info(path: str) -> dict:
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime": st.st_mtime, "crc32": _file_crc(path)}
+
+
+def _to_rgba(image):
+    """32-бітна копія з альфою (smoothscale не працює з палітровими PNG, а display може не бути)."""
+    rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    if image.get_flags() & pygame.SRCALPHA:
+        # MAX на прозорий фон — точна копія пікселів (звичайний blit змішав би альфу)
+        rgba.fill((0, 0, 0, 0))
+        rgba.blit(image, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    else:
+        # палітра / RGB з colorkey: прозорі пікселі — колір ключа з альфою 0, як у convert_alpha
+        colorkey = image.get_colorkey()
+        rgba.fill((*colorkey[:3], 0) if colorkey else (0, 0, 0, 0))
+        rgba.blit(image, (0, 0))
+    return rgba
+
+
+def _frame_key(path: str, row: int, col: int) -> str:
+    return f"{path}#{row},{col}"
+
+
+# ---------- запікання ----------
+
+def _pack_shelves(sizes, width: int):
+    """Проста полична упаковка: (w, h) -> (x, y); повертає позиції і висоту атласу."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x = 0
+            y += shelf_h + PADDING
+            shelf_h = 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+
+def bake_atlas(asset_dir: str = "assets", manifest_path: str = None,
+               sheet_layouts=SHEET_LAYOUTS) -> dict:
+    """Пакує всі PNG з asset_dir (спрайти і кадри sheet'ів) в один атлас + маніфест.
+
+    Ключі в маніфесті — ті самі шляхи, якими спрайти просить Renderer
+    ("assets/floor.png"), кадри sheet'ів — "шлях#рядок,стовпчик".
+    """
+    if manifest_path is None:
+        manifest_path = os.path.join(asset_dir, "atlas.json")
+    atlas_name = os.path.splitext(os.path.basename(manifest_path))[0] + ".png"
+    out_dir = os.path.dirname(manifest_path)
+
+    images = []        # (ключ, Surface)
+    sources = {}
+    sheets = {}
+    for path in sorted(glob.glob(os.path.join(asset_dir, "*.png"))):
+        path = path.replace(os.sep, "/")
+        if os.path.basename(path) == atlas_name:
+            continue
+        image = pygame.image.load(path)
+        sources[path] = _source_info(path)
+
+        layout = sheet_layouts.get(os.path.basename(path))
+        if layout is None:
+            images.append((path, image))
+            continue
+
+        cols, rows = layout
+        frame_w = image.get_width() // cols
+        frame_h = image.get_height() // rows
+        sheets[path] = {"cols": cols, "rows": rows}
+        for row in range(rows):
+            for col in range(cols):
+                rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
+                images.append((_frame_key(path, row, col), image.subsurface(rect)))
+
+    # завеликі джерела зменшуємо (зі збереженням пропорцій)
+    prepared = []
+    for key, image in images:
+        image = _to_rgba(image)
+        w, h = image.get_size()
+        scale = min(1.0, MAX_SPRITE_SIZE / max(w, h))
+        if scale < 1.0:
+            size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            image = pygame.transform.smoothscale(image, size)
+        prepared.append((key, image))
+
+    positions, height = _pack_shelves([img.get_size() for _, img in prepared], ATLAS_WIDTH)
+    atlas = pygame.Surface((ATLAS_WIDTH, max(1, height)), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    entries = {}
+    for (key, image), (x, y) in zip(prepared, positions):
+        atlas.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        entries[key] = [x, y, image.get_width(), image.get_height()]
+
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    pygame.image.save(atlas, os.path.join(out_dir, atlas_name))
+
+    manifest = {
+        "version": ATLAS_VERSION,
+        "atlas": atlas_name,
+        "sources": sources,
+        "sheets": sheets,
+        "entries": entries,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+# ---------- атлас під час гри ----------
+
+class SpriteAtlas:
+    """Запечений атлас + кеш масштабованих під тайл спрайтів на диску."""
+
+    def __init__(self, manifest: dict, manifest_path: str, cache_dir: str):
+        self.manifest = manifest
+        self.manifest_path = manifest_path
+        self.cache_dir = cache_dir
+        self.entries = manifest["entries"]
+        self.sheets = manifest["sheets"]
+        self.keys = sorted(self.entries)
+        # crc вмісту атласу — кеш, зроблений з іншого атласу, не підхопиться
+        # (mtime джерел не входить: він змінюється від простого git checkout)
+        content = {
+            "entries": self.entries, "sheets": self.sheets,
+            "sources": {p: info["crc32"] for p, info in manifest["sources"].items()},
+        }
+        self.crc = zlib.crc32(json.dumps(content, sort_keys=True).encode("utf-8"))
+
+        self._atlas_image = None
+        self._tile_sets = {}      # tile -> {ключ: Surface}
+        self._prefetched = {}     # tile -> (сітка без convert, секунди, джерело) з prefetch
+        self.load_times = {}      # tile -> (секунди, "cache" | "built")
+
+    @classmethod
+    def load(cls, manifest_path: str, cache_dir: str):
+        """Атлас з маніфесту; None — атласу нема, він пошкоджений або застарів."""
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != ATLAS_VERSION:
+                print(f"[WARN] Атлас {manifest_path} іншої версії — спрайти з PNG")
+                return None
+            atlas = cls(manifest, manifest_path, cache_dir)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] Не вдалося прочитати атлас {manifest_path}: {e}")
+            return None
+        if not atlas.is_fresh():
+            print("[WARN] Атлас застарів (PNG змінились) — спрайти з PNG; "
+                  "перезапечи: python -m view.atlas")
+            return None
+        return atlas
+
+    def is_fresh(self) -> bool:
+        """Чи збігаються джерела з тими, з яких запечено (stat; crc — лише якщо змінився mtime)."""
+        touched = False
+        for path, info in self.manifest["sources"].items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            if st.st_size != info["size"]:
+                return False
+            if st.st_mtime != info["mtime"]:
+                if _file_crc(path) != info["crc32"]:
+                    return False
+                # вміст той самий (напр. після checkout) — запам'ятовуємо новий mtime
+                info["mtime"] = st.st_mtime
+                touched = True
+        if touched:
+            try:
+                with open(self.manifest_path, "w", encoding="utf-8") as f:
+                    json.dump(self.manifest, f, indent=1, sort_keys=True)
+            except OSError:
+                pass     # тека лише для читання — перевірятимемо crc і далі
+        return True
+
+    def has_sprite(self, path: str) -> bool:
+        return path in self.entries
+
+    def has_sheet(self, path: str, cols: int, rows: int) -> bool:
+        layout = self.sheets.get(path)
+        return layout is not None and (layout["cols"], layout["rows"]) == (cols, rows)
+
+    def get_sprite(self, path: str, tile: int):
+        return self.get_tile_set(tile)[path]
+
+    def get_frame(self, path: str, row: int, col: int, tile: int):
+        return self.get_tile_set(tile)[_frame_key(path, row, col)]
+
+    # ---------- кеш під розмір тайла ----------
+
+    def _raw_path(self, tile: int) -> str:
+        return os.path.join(self.cache_dir, f"atlas_{tile}.raw")
+
+    def _grid(self, tile: int):
+        cols = max(1, math.ceil(math.sqrt(len(self.keys))))
+        rows = max(1, math.ceil(len(self.keys) / cols))
+        return cols, (cols * tile, rows * tile)
+
+    def prefetch(self, tile: int):
+        """Прочитати (або побудувати й записати) сітку під tile — можна з фонового потоку."""
+        if tile in self._tile_sets or tile in self._prefetched:
+            return
+        self._prefetched[tile] = self._load_tile_sheet(tile)
+
+    def _load_tile_sheet(self, tile: int):
+        start = time.perf_counter()
+        sheet = self._read_raw(tile)
+        source = "cache"
+        if sheet is None:
+            sheet = self.build_tile_sheet(tile)
+            source = "built"
+            try:
+                self._write_raw(tile, sheet)
+            except OSError as e:
+                print(f"[WARN] Не вдалося записати кеш спрайтів: {e}")
+        return sheet, time.perf_counter() - start, source
+
+    def get_tile_set(self, tile: int) -> dict:
+        """Усі спрайти розміру tile×tile: з кешу на диску або (вперше) масштабуванням атласу."""
+        tile_set = self._tile_sets.get(tile)
+        if tile_set is not None:
+            return tile_set
+
+        prefetched = self._prefetched.pop(tile, None)
+        if prefetched is None:
+            prefetched = self._load_tile_sheet(tile)
+        sheet, load_seconds, source = prefetched
+
+        start = time.perf_counter()
+
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        cols, _ = self._grid(tile)
+        tile_set = {
+            key: sheet.subsurface(((i % cols) * tile, (i // cols) * tile, tile, tile))
+            for i, key in enumerate(self.keys)
+        }
+        self._tile_sets[tile] = tile_set
+        self.load_times[tile] = (load_seconds + time.perf_counter() - start, source)
+        return tile_set
+
+    def build_tile_sheet(self, tile: int):
+        """Сітка зі всіх спрайтів атласу, кожен smoothscale до tile×tile."""
+        if self._atlas_image is None:
+            folder = os.path.dirname(self.manifest_path)
+            self._atlas_image = pygame.image.load(os.path.join(folder, self.manifest["atlas"]))
+        cols, size = self._grid(tile)
+        sheet = pygame.Surface(size, pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+        for i, key in enumerate(self.keys):
+            x, y, w, h = self.entries[key]
+            # copy: smoothscale на краях читає сусідні пікселі батьківського Surface
+            image = self._atlas_image.subsurface((x, y, w, h)).copy()
+            sheet.blit(pygame.transform.smoothscale(image, (tile, tile)),
+                       ((i % cols) * tile, (i // cols) * tile),
+                       special_flags=pygame.BLEND_RGBA_MAX)
+        return sheet
+
+    def _read_raw(self, tile: int):
+        path = self._raw_path(tile)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        _, size = self._grid(tile)
+        expected = _RAW_HEADER.size + size[0] * size[1] * 4
+        if len(data) != expected:
+            return None
+        magic, version, raw_tile, count, crc = _RAW_HEADER.unpack_from(data)
+        if (magic, version, raw_tile, count, crc) != \
+                (_RAW_MAGIC, ATLAS_VERSION, tile, len(self.keys), self.crc):
+            return None
+        return pygame.image.frombytes(data[_RAW_HEADER.size:], size, "RGBA")
+
+    def _write_raw(self, tile: int, sheet):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        header = _RAW_HEADER.pack(_RAW_MAGIC, ATLAS_VERSION, tile, len(self.keys), self.crc)
+        path = self._raw_path(tile)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(pygame.image.tobytes(sheet, "RGBA"))
+        os.replace(tmp_path, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Запекти спрайти в атлас")
+    parser.add_argument("--assets", default="assets", help="тека з PNG")
+    parser.add_argument("--manifest", default=None, help="куди писати маніфест (типово <assets>/atlas.json)")
+    parser.add_argument("--cache-dir", default=None, help="кеш під розміри тайла (типово <assets>/cache)")
+    parser.add_argument("--tiles", default="", help="розміри тайла для кешу одразу, напр. 32,48")
+    args = parser.parse_args(argv)
+
+    manifest_path = args.manifest or os.path.join(args.assets, "atlas.json")
+    cache_dir = args.cache_dir or os.path.join(args.assets, "cache")
+
+    start = time.perf_counter()
+    manifest = bake_atlas(args.assets, manifest_path)
+    print(f"[INFO] Атлас: {len(manifest['entries'])} спрайтів з {len(manifest['sources'])} файлів "
+          f"за {time.perf_counter() - start:.2f} с → {manifest_path}")
+
+    atlas = SpriteAtlas.load(manifest_path, cache_dir)
+    if atlas is None:
+        return 1
+    for tile in (int(t) for t in args.tiles.split(",") if t.strip()):
+        atlas.get_tile_set(tile)
+        print(f"[INFO] Кеш {tile}px → {atlas._raw_path(tile)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# view/camera.py
+
+import math
+
+
+class Camera:
+    """Камера, що плавно слідує за гравцем по карті з фіксованим розміром тайла.
+
+    x, y — зсув камери у пікселях світу (що віднімаємо при малюванні).
+    Якщо карта менша за екран по якійсь осі — карта центрується, а
+    камера по цій осі стоїть на місці.
+    """
+
+    def __init__(self, view_w: int, view_h: int, map_w: int, map_h: int,
+                 tile_size: int, smoothing: float = 0.2):
+        self.view_w = view_w
+        self.view_h = view_h
+        self.map_w = map_w          # у тайлах
+        self.map_h = map_h
+        self.tile_size = tile_size
+        self.smoothing = smoothing  # 1.0 — без згладжування
+
+        self.x = 0.0
+        self.y = 0.0
+
+    def _target(self, tile_x: int, tile_y: int):
+        tile = self.tile_size
+        map_px_w = self.map_w * tile
+        map_px_h = self.map_h * tile
+
+        if map_px_w <= self.view_w:
+            tx = -(self.view_w - map_px_w) / 2
+        else:
+            tx = tile_x * tile + tile / 2 - self.view_w / 2
+            tx = max(0, min(map_px_w - self.view_w, tx))
+
+        if map_px_h <= self.view_h:
+            ty = -(self.view_h - map_px_h) / 2
+        else:
+            ty = tile_y * tile + tile / 2 - self.view_h / 2
+            ty = max(0, min(map_px_h - self.view_h, ty))
+
+        return tx, ty
+
+    def snap_to(self, tile_x: int, tile_y: int):
+        """Миттєво поставити камеру на тайл (новий рівень / нова гра)."""
+        self.x, self.y = self._target(tile_x, tile_y)
+
+    def follow(self, tile_x: float, tile_y: float, steps: float = 1.0):
+        """Плавно підтягуємо камеру до тайла; викликається раз за кадр.
+
+        smoothing — частка шляху за один тік симуляції; steps — скільки тіків
+        тривав кадр, тож швидкість камери не залежить від FPS.
+        """
+        tx, ty = self._target(tile_x, tile_y)
+        factor = self.smoothing if steps == 1.0 else 1.0 - (1.0 - self.smoothing) ** steps
+        self.x += (tx - self.x) * factor
+        self.y += (ty - self.y) * factor
+        # щоб не "доїжджати" по пів пікселя нескінченно
+        if abs(tx - self.x) < 0.5:
+            self.x = tx
+        if abs(ty - self.y) < 0.5:
+            self.y = ty
+
+    def get_offset(self):
+        """Зсув (offset_x, offset_y) для переводу тайлових координат у екранні."""
+        return -int(round(self.x)), -int(round(self.y))
+
+    def get_visible_tiles(self):
+        """(x0, y0, x1, y1) — видимі тайли, x1/y1 не включно, обрізано по карті."""
+        tile = self.tile_size
+        x0 = max(0, int(math.floor(self.x / tile)))
+        y0 = max(0, int(math.floor(self.y / tile)))
+        x1 = min(self.map_w, int(math.ceil((self.x + self.view_w) / tile)))
+        y1 = min(self.map_h, int(math.ceil((self.y + self.view_h) / tile)))
+        return x0, y0, x1, y1
@@ -1,7 +1,10 @@
 # view/hud.py
 
+from collections import OrderedDict
+
 import pygame
 from model.item import ItemType, ItemRarity
+from model.message_log import MessageLog
 
 
 class HUD:
@@ -25,20 +28,41 @@ class HUD:
         # шрифт
         self.font = pygame.font.SysFont(None, 24)
 
-        # лог повідомлень
-        self.messages = []
+        # лог повідомлень: довга історія в кільцевому буфері,
+        # на екрані — лише вікно з max_messages рядків
+        self.messages = MessageLog(capacity=10000)
         self.max_messages = 3
+        self.messages_scroll = 0       # 0 — найновіші; більше — далі в минуле
+        self._line_cache = OrderedDict()   # seq -> Surface рядка
+        self._line_cache_size = 64
 
         # інвентар
         self.show_inventory = False
         self.inventory_selected_index = 0
 
+        # ---- кеш пререндерених шарів: (ключ, Surface) ----
+        # перемальовуються лише тоді, коли змінився ключ (версії Player / лога)
+        self._stats_cache = (None, None)
+        self._messages_cache = (None, None)
+        self._inventory_cache = (None, None)
+
     # ---- ЛОГ ПОВІДОМЛЕНЬ ----
     def add_message(self, text: str):
-        """Додає нове повідомлення в лог (зберігаємо тільки останні N)."""
+        """Додає нове повідомлення в лог."""
         self.messages.append(text)
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
+        if self.messages_scroll > 0:
+            # гравець гортає історію — не зсуваємо в нього вікно
+            self.scroll_messages(1)
+
+    def clear_messages(self):
+        self.messages.clear()
+        self.messages_scroll = 0
+        self._line_cache.clear()
+
+    def scroll_messages(self, delta: int):
+        """Гортає лог: delta > 0 — до старіших повідомлень, < 0 — до новіших."""
+        max_scroll = max(0, len(self.messages) - self.max_messages)
+        self.messages_scroll = max(0, min(max_scroll, self.messages_scroll + delta))
 
     # ---- МАЛЮВАННЯ ----
     def draw(self, surface: pygame.Surface):
@@ -48,79 +72,154 @@ class HUD:
         if self.show_inventory:
             self._draw_inventory(surface)
 
+    # ---- ДЛЯ DIRTY-RECT РЕЖИМУ ----
+    def get_state_key(self):
+        """Усе, від чого залежить вигляд HUD. Змінився ключ — HUD треба перемалювати."""
+        return (
+            self.player.version, self.messages.version, self.messages_scroll,
+            self.show_inventory, self.inventory_selected_index,
+        )
+
+    def get_rects(self, surface: pygame.Surface):
+        """Прямокутники екрана, які займає HUD (без малювання)."""
+        rects = [self._get_stats_surface().get_rect(topleft=(self.margin, self.margin))]
+
+        if self.messages:
+            rects.append(self._get_messages_rect(surface))
+
+        if self.show_inventory:
+            rects.append(self._get_inventory_rect(surface))
+
+        return rects
+
+    def _get_messages_rect(self, surface: pygame.Surface):
+        screen_w = surface.get_width()
+        screen_h = surface.get_height()
+
+        line_height = self.font.get_height() + 4
+        total_height = line_height * min(len(self.messages), self.max_messages) + 10
+
+        x = 20
+        y = screen_h - total_height - 20
+        return pygame.Rect(x, y, screen_w - 40, total_height)
+
+    def _get_inventory_rect(self, surface: pygame.Surface):
+        screen_w = surface.get_width()
+        screen_h = surface.get_height()
+
+        panel_width = min(420, screen_w - 40)
+        panel_height = min(320, screen_h - 40)
+        x = (screen_w - panel_width) // 2
+        y = (screen_h - panel_height) // 2
+        return pygame.Rect(x, y, panel_width, panel_height)
+
+    # ---- HP + СТАТИ ----
     def _draw_hp_bar(self, surface: pygame.Surface):
+        surface.blit(self._get_stats_surface(), (self.margin, self.margin))
+
+    def _get_stats_surface(self):
+        key = self.player.version
+        if self._stats_cache[0] != key:
+            self._stats_cache = (key, self._render_stats())
+        return self._stats_cache[1]
+
+    def _render_stats(self):
+        """Полоска HP + рядок статів на прозорому Surface."""
         if self.player.max_hp <= 0:
             hp_ratio = 0
         else:
             hp_ratio = max(0, self.player.hp / self.player.max_hp)
 
-        x = self.margin
-        y = self.margin
+        # текст HP + ATK
+        text = f"HP: {self.player.hp}/{self.player.max_hp}  |  ATK: {self.player.attack}  |  DEF: {self.player.defense}"
+        text_surf = self.font.render(text, True, self.color_text)
+
+        width = max(self.bar_width, text_surf.get_width())
+        height = self.bar_height + 5 + text_surf.get_height()
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
 
         # фон полоски
-        bg_rect = pygame.Rect(x, y, self.bar_width, self.bar_height)
-        pygame.draw.rect(surface, self.color_bg, bg_rect)
+        bg_rect = pygame.Rect(0, 0, self.bar_width, self.bar_height)
+        pygame.draw.rect(layer, self.color_bg, bg_rect)
 
         # заливка HP
         fill_width = int(self.bar_width * hp_ratio)
-        fill_rect = pygame.Rect(x, y, fill_width, self.bar_height)
-        pygame.draw.rect(surface, self.color_hp, fill_rect)
+        fill_rect = pygame.Rect(0, 0, fill_width, self.bar_height)
+        pygame.draw.rect(layer, self.color_hp, fill_rect)
 
         # рамка
-        pygame.draw.rect(surface, self.color_border, bg_rect, 2)
+        pygame.draw.rect(layer, self.color_border, bg_rect, 2)
 
-        # текст HP + ATK
-        text = f"HP: {self.player.hp}/{self.player.max_hp}  |  ATK: {self.player.attack}  |  DEF: {self.player.defense}"
-        text_surf = self.font.render(text, True, self.color_text)
-        surface.blit(text_surf, (x, y + self.bar_height + 5))
+        layer.blit(text_surf, (0, self.bar_height + 5))
+        return layer
 
+    # ---- ЛОГ ----
     def _draw_messages(self, surface: pygame.Surface):
         """Малює останні повідомлення внизу екрана."""
         if not self.messages:
             return
 
-        screen_w = surface.get_width()
-        screen_h = surface.get_height()
-
-        line_height = self.font.get_height() + 4
-        total_height = line_height * len(self.messages) + 10
+        bg_rect = self._get_messages_rect(surface)
+        key = (self.messages.version, self.messages_scroll, bg_rect.size)
+        if self._messages_cache[0] != key:
+            self._messages_cache = (key, self._render_messages(bg_rect.size))
+        surface.blit(self._messages_cache[1], bg_rect.topleft)
 
-        # прямокутник фону для лога
-        x = 20
-        y = screen_h - total_height - 20
-        bg_rect = pygame.Rect(x, y, screen_w - 40, total_height)
-        pygame.draw.rect(surface, self.color_log_bg, bg_rect)
-        pygame.draw.rect(surface, self.color_border, bg_rect, 1)
+    def _render_messages(self, size):
+        """Рендерить лише видиме вікно лога з кешу рядків."""
+        panel = pygame.Surface(size).convert()
+        panel.fill(self.color_log_bg)
+        pygame.draw.rect(panel, self.color_border, panel.get_rect(), 1)
 
         # малюємо рядки зверху вниз
-        cur_y = y + 5
-        for msg in self.messages:
-            text_surf = self.font.render(msg, True, self.color_text)
-            surface.blit(text_surf, (x + 8, cur_y))
+        line_height = self.font.get_height() + 4
+        cur_y = 5
+        for seq, msg in self.messages.window(self.max_messages, self.messages_scroll):
+            panel.blit(self._get_line_surface(seq, msg), (8, cur_y))
             cur_y += line_height
 
+        # позначка, що лог прокручено вгору
+        if self.messages_scroll > 0:
+            mark_surf = self.font.render(f"↑ {self.messages_scroll}", True, self.color_text)
+            panel.blit(mark_surf, (size[0] - mark_surf.get_width() - 8, 5))
+        return panel
+
+    def _get_line_surface(self, seq: int, text: str):
+        """Відрендерений рядок лога; кеш обмежений, тож пам'ять не росте."""
+        surf = self._line_cache.get(seq)
+        if surf is not None:
+            self._line_cache.move_to_end(seq)
+            return surf
+
+        surf = self.font.render(text, True, self.color_text)
+        self._line_cache[seq] = surf
+        if len(self._line_cache) > self._line_cache_size:
+            self._line_cache.popitem(last=False)
+        return surf
+
+    # ---- ІНВЕНТАР ----
     def _draw_inventory(self, surface: pygame.Surface):
         """Малює вікно інвентарю по центру екрана."""
-        screen_w = surface.get_width()
-        screen_h = surface.get_height()
-
-        panel_width = min(420, screen_w - 40)
-        panel_height = min(320, screen_h - 40)
-        x = (screen_w - panel_width) // 2
-        y = (screen_h - panel_height) // 2
-
-        panel_rect = pygame.Rect(x, y, panel_width, panel_height)
-        pygame.draw.rect(surface, (15, 15, 25), panel_rect)
-        pygame.draw.rect(surface, self.color_border, panel_rect, 2)
+        panel_rect = self._get_inventory_rect(surface)
+        key = (self.player.version, self.inventory_selected_index, panel_rect.size)
+        if self._inventory_cache[0] != key:
+            self._inventory_cache = (key, self._render_inventory(panel_rect.size))
+        surface.blit(self._inventory_cache[1], panel_rect.topleft)
+
+    def _render_inventory(self, size):
+        panel_width, panel_height = size
+        panel = pygame.Surface(size).convert()
+        panel.fill((15, 15, 25))
+        pygame.draw.rect(panel, self.color_border, panel.get_rect(), 2)
 
         # заголовок
         title_surf = self.font.render("Інвентар", True, self.color_text)
-        surface.blit(title_surf, (x + 10, y + 10))
+        panel.blit(title_surf, (10, 10))
 
         # інформація про стати
         stats_text = f"HP: {self.player.hp}/{self.player.max_hp}  |  ATK: {self.player.attack}"
         stats_surf = self.font.render(stats_text, True, self.color_text)
-        surface.blit(stats_surf, (x + 10, y + 35))
+        panel.blit(stats_surf, (10, 35))
 
         equip_text = "Зброя: "
         if self.player.weapon is not None:
@@ -136,12 +235,11 @@ class HUD:
 
         equip_surf = self.font.render(equip_text, True, self.color_text)
         armor_surf = self.font.render(armor_text, True, self.color_text)
-        surface.blit(equip_surf, (x + 10, y + 55))
-        surface.blit(armor_surf, (x + 10, y + 75))
-
+        panel.blit(equip_surf, (10, 55))
+        panel.blit(armor_surf, (10, 75))
 
         # список предметів
-        start_y = y + 100
+        start_y = 100
         line_height = self.font.get_height() + 6
 
         inventory = self.player.inventory
@@ -149,13 +247,13 @@ class HUD:
 
         for i in range(capacity):
             slot_y = start_y + i * line_height
-            if slot_y + line_height > y + panel_height - 50:
+            if slot_y + line_height > panel_height - 50:
                 break  # не влазить більше рядків
 
             # фон для виділеного
             if i == self.inventory_selected_index:
-                slot_rect = pygame.Rect(x + 8, slot_y - 2, panel_width - 16, line_height)
-                pygame.draw.rect(surface, (50, 70, 110), slot_rect)
+                slot_rect = pygame.Rect(8, slot_y - 2, panel_width - 16, line_height)
+                pygame.draw.rect(panel, (50, 70, 110), slot_rect)
 
             if i < len(inventory):
                 item = inventory[i]
@@ -166,7 +264,7 @@ class HUD:
                 color = self.color_text
 
             text_surf = self.font.render(f"{i + 1}. {name}", True, color)
-            surface.blit(text_surf, (x + 14, slot_y))
+            panel.blit(text_surf, (14, slot_y))
 
         # підказки
         hint_text1 = "↑/↓ — вибір, Enter — використати"
@@ -174,9 +272,9 @@ class HUD:
         hint1_surf = self.font.render(hint_text1, True, self.color_text)
         hint2_surf = self.font.render(hint_text2, True, self.color_text)
 
-        surface.blit(hint1_surf, (x + 10, y + panel_height - 45))
-        surface.blit(hint2_surf, (x + 10, y + panel_height - 25))
-
+        panel.blit(hint1_surf, (10, panel_height - 45))
+        panel.blit(hint2_surf, (10, panel_height - 25))
+        return panel
 
     def _get_item_name(self, item):
         """Текст назви з урахуванням типу і рідкості."""
@@ -16,15 +16,34 @@ class IntroScreen:
         self.box_color = (20, 20, 40)
         self.border_color = (120, 120, 180)
 
+        # шрифти створюємо один раз, а не щокадру
         self.font = pygame.font.SysFont(None, 32)
+        self.title_font = pygame.font.SysFont(None, 56)
+        self.hint_font = pygame.font.SysFont(None, 24)
         self.lines = settings.INTRO_LINES
 
+        # екран статичний — малюємо його один раз на розмір поверхні
+        self._frame_cache = (None, None)
+
+    def get_state_key(self):
+        """Вступ не змінюється, поки на ньому стоїмо."""
+        return None
+
     def draw(self, surface: pygame.Surface):
+        """Показує вступ з кешованого кадру."""
+        key = surface.get_size()
+        cached_key, frame = self._frame_cache
+        if cached_key != key:
+            frame = pygame.Surface(key).convert()
+            self._render(frame)
+            self._frame_cache = (key, frame)
+        surface.blit(frame, (0, 0))
+
+    def _render(self, surface: pygame.Surface):
         surface.fill(self.bg_color)
 
         # заголовок
-        title_font = pygame.font.SysFont(None, 56)
-        title_surf = title_font.render("Вступ", True, (240, 240, 255))
+        title_surf = self.title_font.render("Вступ", True, (240, 240, 255))
         title_rect = title_surf.get_rect(center=(self.screen_w // 2, self.screen_h // 5))
         surface.blit(title_surf, title_rect)
 
@@ -49,7 +68,6 @@ class IntroScreen:
             cur_y += line_height
 
         # хінт унизу
-        hint_font = pygame.font.SysFont(None, 24)
-        hint_surf = hint_font.render("Натисни будь-яку клавішу, щоб продовжити...", True, (200, 200, 220))
+        hint_surf = self.hint_font.render("Натисни будь-яку клавішу, щоб продовжити...", True, (200, 200, 220))
         hint_rect = hint_surf.get_rect(center=(self.screen_w // 2, self.screen_h - 40))
         surface.blit(hint_surf, hint_rect)
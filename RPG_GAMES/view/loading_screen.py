@@ -0,0 +1,56 @@
+# view/loading_screen.py
+
+import pygame
+
+
+class LoadingScreen:
+    """Екран «Завантаження...» зі смужкою прогресу — поки фонові задачі не готові."""
+
+    def __init__(self, screen_w: int, screen_h: int):
+        self.screen_w = screen_w
+        self.screen_h = screen_h
+
+        self.bg_color = (5, 5, 15)
+        self.text_color = (230, 230, 230)
+        self.bar_bg_color = (30, 30, 50)
+        self.bar_color = (255, 220, 120)
+
+        self.font = pygame.font.SysFont(None, 40)
+        self.hint_font = pygame.font.SysFont(None, 24)
+
+        self.percent = 0
+        self.label = ""
+
+        self._frame_cache = (None, None)
+
+    def set_progress(self, fraction: float, label: str = ""):
+        self.percent = int(fraction * 100)
+        self.label = label
+
+    def get_state_key(self):
+        """Кадр змінюється лише з відсотком або підписом."""
+        return self.percent, self.label
+
+    def draw(self, surface: pygame.Surface):
+        key = (self.get_state_key(), surface.get_size())
+        cached_key, frame = self._frame_cache
+        if cached_key != key:
+            frame = pygame.Surface(surface.get_size()).convert()
+            self._render(frame)
+            self._frame_cache = (key, frame)
+        surface.blit(frame, (0, 0))
+
+    def _render(self, surface: pygame.Surface):
+        surface.fill(self.bg_color)
+
+        title_surf = self.font.render("Завантаження...", True, self.text_color)
+        surface.blit(title_surf, title_surf.get_rect(center=(self.screen_w // 2, self.screen_h // 2 - 40)))
+
+        bar = pygame.Rect(0, 0, self.screen_w // 2, 16)
+        bar.center = (self.screen_w // 2, self.screen_h // 2)
+        pygame.draw.rect(surface, self.bar_bg_color, bar)
+        pygame.draw.rect(surface, self.bar_color, (bar.x, bar.y, bar.width * self.percent // 100, bar.height))
+        pygame.draw.rect(surface, self.text_color, bar, 1)
+
+        label_surf = self.hint_font.render(f"{self.label} — {self.percent}%", True, (180, 180, 200))
+        surface.blit(label_surf, label_surf.get_rect(center=(self.screen_w // 2, self.screen_h // 2 + 30)))
@@ -17,8 +17,30 @@ class MainMenu:
         self.option_color = (200, 200, 200)
         self.option_selected_color = (255, 220, 120)
 
+        # шрифти створюємо один раз, а не щокадру
         self.title_font = pygame.font.SysFont(None, 80)
         self.option_font = pygame.font.SysFont(None, 40)
+        self.hint_font = pygame.font.SysFont(None, 24)
+
+        # фонове завантаження: (відсоток, підпис) або None — смужку не показуємо
+        self.progress = None
+
+        # готовий кадр меню: (ключ, Surface) — перемальовується лише при зміні вибору
+        self._frame_cache = (None, None)
+
+    def set_continue_available(self, available: bool):
+        """Показати / сховати пункт «Продовжити» (є збереження або перервана гра)."""
+        options = ["Нова гра", "Вихід"]
+        if available:
+            options.insert(0, "Продовжити")
+        if options != self.options:
+            selected = self.get_selected_option()
+            self.options = options
+            self.selected_index = options.index(selected) if selected in options else 0
+
+    def set_progress(self, fraction, label: str = ""):
+        """Смужка фонового завантаження внизу меню (fraction=None — сховати)."""
+        self.progress = None if fraction is None else (int(fraction * 100), label)
 
     def move_selection(self, direction: int):
         """direction = -1 (вгору) або +1 (вниз)."""
@@ -27,7 +49,21 @@ class MainMenu:
     def get_selected_option(self) -> str:
         return self.options[self.selected_index]
 
+    def get_state_key(self):
+        """Від чого залежить вигляд меню (змінився — кадр треба показати знову)."""
+        return self.selected_index, tuple(self.options), self.progress
+
     def draw(self, surface: pygame.Surface):
+        """Показує меню з кешованого кадру."""
+        key = (self.get_state_key(), surface.get_size())
+        cached_key, frame = self._frame_cache
+        if cached_key != key:
+            frame = pygame.Surface(surface.get_size()).convert()
+            self._render(frame)
+            self._frame_cache = (key, frame)
+        surface.blit(frame, (0, 0))
+
+    def _render(self, surface: pygame.Surface):
         surface.fill(self.bg_color)
 
         # назва гри
@@ -48,7 +84,16 @@ class MainMenu:
             surface.blit(surf, rect)
 
         # невеликий хінт унизу
-        hint_font = pygame.font.SysFont(None, 24)
-        hint_surf = hint_font.render("Стрілки ↑↓ / W,S — вибір, Enter — підтвердити", True, (180, 180, 200))
+        hint_surf = self.hint_font.render("Стрілки ↑↓ / W,S — вибір, Enter — підтвердити", True, (180, 180, 200))
         hint_rect = hint_surf.get_rect(center=(self.screen_w // 2, self.screen_h - 40))
         surface.blit(hint_surf, hint_rect)
+
+        if self.progress is not None:
+            percent, label = self.progress
+            bar = pygame.Rect(0, 0, self.screen_w // 3, 6)
+            bar.center = (self.screen_w // 2, self.screen_h - 80)
+            pygame.draw.rect(surface, (40, 40, 60), bar)
+            pygame.draw.rect(surface, self.option_color,
+                             (bar.x, bar.y, bar.width * percent // 100, bar.height))
+            label_surf = self.hint_font.render(f"{label}... {percent}%", True, (140, 140, 160))
+            surface.blit(label_surf, label_surf.get_rect(midbottom=(bar.centerx, bar.y - 4)))
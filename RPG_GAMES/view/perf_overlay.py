@@ -0,0 +1,133 @@
+# view/perf_overlay.py
+
+import time
+
+import pygame
+
+
+# кольори фаз на графіку (стовпчик кадру — фази одна над одною, без вкладених подвійно)
+PHASE_COLORS = {
+    "handle_events": (120, 120, 255),
+    "update": (90, 200, 90),
+    "update_enemies_ai": (200, 240, 80),
+    "renderer_draw": (240, 150, 60),
+    "hud_draw": (240, 90, 200),
+    "overlay": (110, 110, 110),
+    "flip": (80, 220, 230),
+}
+COLOR_OTHER = (60, 60, 70)     # решта кадру: очікування clock.tick, GC, ОС
+
+
+class PerfOverlay:
+    """Оверлей продуктивності: FPS, час фаз кадру, графік, лічильники сутностей і кешу спрайтів.
+
+    Текст перемальовується кілька разів на секунду (рендер шрифтів недешевий),
+    а графік — прокручується на 1 піксель за кадр з дорисовуванням одного стовпчика.
+    """
+
+    def __init__(self, width: int = 340, graph_height: int = 90,
+                 budget_ms: float = 1000.0 / 60, text_interval: float = 0.25):
+        self.width = width
+        self.graph_height = graph_height
+        self.budget_ms = budget_ms
+        self.max_ms = budget_ms * 2          # верх графіка
+        self.text_interval = text_interval
+        self.margin = 10
+
+        self.font = pygame.font.SysFont(None, 20)
+        self.color_bg = (10, 10, 16)
+        self.color_text = (230, 230, 230)
+        self.color_budget = (220, 60, 60)
+
+        self._phases = ()
+        self._nested_in = {}
+        self._graph = pygame.Surface((width, graph_height)).convert()
+        self._graph.fill(self.color_bg)
+        self._last_frame = -1
+
+        self._text_surf = None
+        self._text_time = 0.0
+
+    def reset(self):
+        self._graph.fill(self.color_bg)
+        self._last_frame = -1
+        self._text_surf = None
+
+    def get_rect(self, surface: pygame.Surface):
+        height = self.graph_height + (self._text_surf.get_height() if self._text_surf else 0)
+        return pygame.Rect(surface.get_width() - self.width - self.margin,
+                           self.margin, self.width, height)
+
+    # ---------- малювання ----------
+
+    def draw(self, surface: pygame.Surface, profiler, stats: dict):
+        """stats — лічильники для тексту (сутності, кеш спрайтів). Повертає Rect оверлею."""
+        history = profiler.history
+        self._phases = profiler.phases
+        self._nested_in = profiler.nested_in
+        if history and history[-1]["frame"] != self._last_frame:
+            self._push_column(history[-1])
+            self._last_frame = history[-1]["frame"]
+
+        now = time.perf_counter()
+        if self._text_surf is None or now - self._text_time >= self.text_interval:
+            self._text_surf = self._render_text(profiler, stats)
+            self._text_time = now
+
+        rect = self.get_rect(surface)
+        surface.blit(self._text_surf, rect.topleft)
+        surface.blit(self._graph, (rect.x, rect.y + self._text_surf.get_height()))
+        return rect
+
+    def _push_column(self, sample):
+        """Зсуваємо графік вліво на піксель і малюємо стовпчик нового кадру справа."""
+        graph = self._graph
+        h = self.graph_height
+        x = self.width - 1
+        graph.scroll(-1, 0)
+        graph.fill(self.color_bg, (x, 0, 1, h))
+
+        scale = h / self.max_ms
+        y = h
+        used = 0.0
+        for name in self._phases:
+            value = sample[name]
+            if name not in self._nested_in:
+                # вкладені фази — окремими шматками, тож з батьківської їх віднімаємо
+                used += value
+                value -= sum(sample[c] for c, parent in self._nested_in.items() if parent == name)
+            y = self._draw_segment(x, y, value * scale, PHASE_COLORS[name])
+        self._draw_segment(x, y, (sample["frame_ms"] - used) * scale, COLOR_OTHER)
+
+        budget_y = h - int(self.budget_ms * scale)
+        graph.set_at((x, budget_y), self.color_budget)
+
+    def _draw_segment(self, x: int, y: float, height: float, color):
+        if height <= 0 or y <= 0:
+            return y
+        top = max(0.0, y - height)
+        self._graph.fill(color, (x, int(top), 1, max(1, int(y) - int(top))))
+        return top
+
+    def _render_text(self, profiler, stats: dict):
+        avg = profiler.get_averages()
+        worst = profiler.get_worst()
+        lines = [(f"FPS {profiler.get_fps():5.1f}   кадр {avg.get('frame_ms', 0.0):5.2f} мс"
+                  f"   гірший {worst['frame_ms'] if worst else 0.0:5.1f} мс", self.color_text)]
+        for name in profiler.phases:
+            indent = "    " if name in profiler.nested_in else ""
+            lines.append((f"{indent}{name:<18} {avg.get(name, 0.0):6.2f} мс"
+                          f"   max {worst[name] if worst else 0.0:6.2f}", PHASE_COLORS[name]))
+        lines.append((f"вороги {stats.get('enemies', 0)}   предмети {stats.get('items', 0)}"
+                      f"   на екрані {stats.get('sprites', 0)}", self.color_text))
+        lines.append((f"спрайти: hits {stats.get('hits', 0)}  misses {stats.get('misses', 0)}"
+                      f"  у кеші {stats.get('cached_entries', 0)}", self.color_text))
+        if profiler.csv_active:
+            lines.append((f"CSV → {profiler.csv_path}", self.color_budget))
+
+        line_height = self.font.get_height() + 2
+        panel = pygame.Surface((self.width, line_height * len(lines) + 8)).convert()
+        panel.fill(self.color_bg)
+        for i, (text, color) in enumerate(lines):
+            panel.blit(self.font.render(text, True, color), (6, 4 + i * line_height))
+        return panel
@@ -1,13 +1,69 @@
+import os
+
 import pygame
 import settings
-import os
 from model.item import ItemType, ItemRarity
+from view.assets import assets
 
 
 class Renderer:
     """Малювання карти, гравця (зі спрайт-листом), ворогів, предметів і HUD."""
 
-    def __init__(self, screen, dungeon, player, enemies, items, hud, offset_x=0, offset_y=0):
+    # розмір чанка запеченої карти (у тайлах)
+    MAP_CHUNK_TILES = 16
+
+    # ---- таблиця спрайтів: з неї завантажує __init__ і бере список sprite_files() ----
+    # порядок — за потребою першого кадру (карта → герой → вороги → предмети)
+
+    # атрибут -> PNG під TILE_SIZE
+    TILE_SPRITES = (
+        ("floor_image", "assets/floor.png"),
+        ("wall_image", "assets/wall.png"),
+        ("door_closed_image", "assets/door_closed.png"),
+        ("door_open_image", "assets/door_open.png"),
+    )
+
+    # атрибут кадрів, sprite sheet, cols (idle, walk1, walk2), rows (down, left, right, up),
+    # запасний одиночний спрайт (атрибут, PNG) — лише якщо sheet'а немає
+    SHEETS = (
+        ("hero_frames", "assets/hero_sheet.png", 3, 4, ("hero_image", "assets/hero.png")),
+        ("enemy_frames", "assets/enemy_sheet.png", 3, 4, ("enemy_image", "assets/enemy.png")),
+    )
+
+    ITEM_SPRITES = (
+        ("heal_image", "assets/heal_potion.png"),
+        ("attack_image", "assets/damage_potion.png"),
+    )
+
+    # атрибут -> {рідкість: PNG} (окремі спрайти зброї / броні по рідкості)
+    RARITY_SPRITES = (
+        ("weapon_images", {
+            ItemRarity.COMMON: "assets/sword_common_32x32.png",
+            ItemRarity.UNCOMMON: "assets/sword_uncommon_32x32.png",
+            ItemRarity.RARE: "assets/sword_rare_32x32.png",
+            ItemRarity.LEGENDARY: "assets/sword_legendary_32x32.png",
+        }),
+        ("armor_images", {
+            ItemRarity.COMMON: "assets/armor_common_32x32.png",
+            ItemRarity.UNCOMMON: "assets/armor_uncommon_32x32.png",
+            ItemRarity.RARE: "assets/armor_rare_32x32.png",
+            ItemRarity.LEGENDARY: "assets/armor_legendary_32x32.png",
+        }),
+    )
+
+    @classmethod
+    def sprite_files(cls):
+        """Усі PNG, які завантажить __init__, у порядку таблиць (для фонового preload)."""
+        paths = [path for _, path in cls.TILE_SPRITES]
+        for _, path, _, _, (_, fallback) in cls.SHEETS:
+            paths.append(path if os.path.exists(path) else fallback)
+        paths.extend(path for _, path in cls.ITEM_SPRITES)
+        for _, by_rarity in cls.RARITY_SPRITES:
+            paths.extend(by_rarity.values())
+        return paths
+
+    def __init__(self, screen, dungeon, player, enemies, items, hud, camera,
+                 enemy_index=None, item_index=None, asset_manager=None):
         self.screen = screen
         self.dungeon = dungeon
         self.player = player
@@ -15,8 +71,13 @@ class Renderer:
         self.items = items       # список Item
         self.hud = hud
 
-        self.offset_x = offset_x
-        self.offset_y = offset_y
+        # камера і просторові індекси (щоб не перебирати невидимі сутності)
+        self.camera = camera
+        self.enemy_index = enemy_index
+        self.item_index = item_index
+
+        # зсув карти на екрані — оновлюється з камери кожного кадру
+        self.offset_x, self.offset_y = camera.get_offset()
 
         # Кольори (RGB)
         self.COLOR_FLOOR = (30, 30, 30)
@@ -24,247 +85,387 @@ class Renderer:
         self.COLOR_BG = (0, 0, 0)
 
         # ---- СПРАЙТИ ----
-        # запасний одиночний спрайт героя (якщо sheet не знайдеться)
-        self.hero_image = self.load_sprite("assets/hero.png")
-        self.enemy_image = self.load_sprite("assets/enemy.png")
-        self.heal_image = self.load_sprite("assets/heal_potion.png")
-        self.attack_image = self.load_sprite("assets/damage_potion.png")
-
-        # sprite sheet героя
-        self.hero_frames = self.load_hero_sheet(
-            "assets/hero_sheet.png",
-            cols=3,  # кадри: idle, walk1, walk2
-            rows=4   # напрями: down, left, right, up
-        )
+        # усі картинки беремо зі спільного кешу — кожен PNG декодується один раз
+        self.assets = assets if asset_manager is None else asset_manager
+        self.load_sprites()
 
-        # sprite sheet ворога (1 рядок, 3 кадри)
-        self.enemy_frames = self.load_enemy_sheet(
-            "assets/enemy_sheet.png",
-            cols=3,
-            rows=4
-        )
         self.enemy_anim_timer = 0
         self.enemy_anim_index = 0
         self.enemy_anim_speed = 10  # чим менше, тим швидше анімація
 
-        # окремі спрайти для зброї по рідкості
-        self.weapon_images = {
-            ItemRarity.COMMON: self.load_sprite("assets/sword_common_32x32.png"),
-            ItemRarity.UNCOMMON: self.load_sprite("assets/sword_uncommon_32x32.png"),
-            ItemRarity.RARE: self.load_sprite("assets/sword_rare_32x32.png"),
-            ItemRarity.LEGENDARY: self.load_sprite("assets/sword_legendary_32x32.png"),
-        }
-
-        # окремі спрайти для броні по рідкості
-        self.armor_images = {
-            ItemRarity.COMMON: self.load_sprite("assets/armor_common_32x32.png"),
-            ItemRarity.UNCOMMON: self.load_sprite("assets/armor_uncommon_32x32.png"),
-            ItemRarity.RARE: self.load_sprite("assets/armor_rare_32x32.png"),
-            ItemRarity.LEGENDARY: self.load_sprite("assets/armor_legendary_32x32.png"),
-        }
-
-        # тайлові спрайти
-        self.floor_image = self.load_sprite("assets/floor.png")
-        self.wall_image = self.load_sprite("assets/wall.png")
-        self.door_closed_image = self.load_sprite("assets/door_closed.png")
-        self.door_open_image = self.load_sprite("assets/door_open.png")
-
         # стан дверей (оновлюється з Game)
         self.doors_open = False
 
+        # інтерполяція між тіками фіксованого кроку (задає Game перед draw)
+        self.alpha = 1.0           # частка шляху від попереднього тіку до поточного
+        self.tick_count = None     # None — без інтерполяції
+        self.frame_ticks = 1.0     # тривалість кадру в тіках (для камери)
 
+        # запечений шар карти (підлога + стіни + двері): чанки, що будуються ліниво
+        self._map_chunks = {}        # (cx, cy) -> Surface
+        self._chunk_doors = {}       # (cx, cy) -> [(x, y), ...] тайли дверей у чанку
+        self._map_cache_key = None
 
-    # ---------- завантаження спрайтів ----------
+        self.sprites_drawn = 0       # команд спрайтів у минулому кадрі (для оверлею)
+        self._extra_dirty = []       # області, які треба відновити наступного кадру
 
-    def load_sprite(self, path: str):
-        """Завантажує картинку і масштабує під TILE_SIZE. Якщо не вийшло — повертає None."""
-        if not os.path.exists(path):
-            print(f"[WARN] Sprite not found: {path}")
-            return None
-
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.smoothscale(
-                img,
-                (settings.TILE_SIZE, settings.TILE_SIZE)
-            )
-            return img
-        except Exception as e:
-            print(f"[ERROR] Failed to load sprite {path}: {e}")
-            return None
-
-    def load_hero_sheet(self, path: str, cols: int, rows: int):
-        """Ріже sprite sheet героя на кадри: dict[(direction, frame)] = Surface."""
-        if not os.path.exists(path):
-            print(f"[WARN] Hero sheet not found: {path}")
-            return None
+        # dirty-rect режим: показуємо лише змінені прямокутники замість flip
+        self.dirty_rects_enabled = settings.DIRTY_RECTS
+        self._full_redraw = True
+        self._prev_signatures = set()
+        self._prev_hud_key = None
+        self._prev_hud_rects = []
+        self._prev_view_key = None
 
-        try:
-            sheet = pygame.image.load(path).convert_alpha()
-        except Exception as e:
-            print(f"[ERROR] Failed to load hero sheet {path}: {e}")
-            return None
+    # ---------- завантаження спрайтів ----------
 
-        sheet_w, sheet_h = sheet.get_width(), sheet.get_height()
-        frame_w = sheet_w // cols
-        frame_h = sheet_h // rows
-
-        frames = {}
-
-        # порядок рядків: 0-down, 1-left, 2-right, 3-up
-        row_dir = {
-            0: "down",
-            1: "left",
-            2: "right",
-            3: "up",
-        }
-
-        for row in range(rows):
-            direction = row_dir.get(row, "down")
-            for col in range(cols):
-                rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
-                frame_surf = sheet.subsurface(rect).copy()
-                # масштабуємо до TILE_SIZE
-                frame_surf = pygame.transform.smoothscale(
-                    frame_surf,
-                    (settings.TILE_SIZE, settings.TILE_SIZE)
-                )
-                frames[(direction, col)] = frame_surf
+    def load_sprites(self):
+        """Усі спрайти з таблиць під поточний TILE_SIZE (знову — після зміни тайла)."""
+        for attr, path in self.TILE_SPRITES + self.ITEM_SPRITES:
+            setattr(self, attr, self.load_sprite(path))
 
-        print(f"[INFO] Loaded hero sheet with {len(frames)} frames")
-        return frames
+        # запасні одиночні спрайти — лише якщо sheet'а немає (великі PNG, не декодуємо зайве)
+        for attr, path, cols, rows, (fallback_attr, fallback) in self.SHEETS:
+            frames = self.load_sheet(path, cols=cols, rows=rows)
+            setattr(self, attr, frames)
+            setattr(self, fallback_attr, None if frames else self.load_sprite(fallback))
 
+        for attr, by_rarity in self.RARITY_SPRITES:
+            setattr(self, attr, {rarity: self.load_sprite(path)
+                                 for rarity, path in by_rarity.items()})
 
-    def load_enemy_sheet(self, path: str, cols: int, rows: int):
-        """Ріже sprite sheet ворогів: dict[(direction, frame)] = Surface."""
-        if not os.path.exists(path):
-            print(f"[WARN] Enemy sheet not found: {path}")
-            return None
-
-        try:
-            sheet = pygame.image.load(path).convert_alpha()
-        except Exception as e:
-            print(f"[ERROR] Failed to load enemy sheet {path}: {e}")
-            return None
+    def load_sprite(self, path: str):
+        """Картинка, масштабована під TILE_SIZE. Якщо не вийшло — None."""
+        return self.assets.get_sprite(path, (settings.TILE_SIZE, settings.TILE_SIZE))
 
-        sheet_w, sheet_h = sheet.get_width(), sheet.get_height()
-        frame_w = sheet_w // cols
-        frame_h = sheet_h // rows
-
-        frames = {}
-
-        # 0-down, 1-left, 2-right, 3-up
-        row_dir = {
-            0: "down",
-            1: "left",
-            2: "right",
-            3: "up",
-        }
-
-        for row in range(rows):
-            direction = row_dir.get(row, "down")
-            for col in range(cols):
-                rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
-                frame_surf = sheet.subsurface(rect).copy()
-                frame_surf = pygame.transform.smoothscale(
-                    frame_surf,
-                    (settings.TILE_SIZE, settings.TILE_SIZE)
-                )
-                frames[(direction, col)] = frame_surf
+    def load_sheet(self, path: str, cols: int, rows: int):
+        """Ріже sprite sheet на кадри: dict[(direction, frame)] = Surface."""
+        return self.assets.get_sheet(
+            path, cols, rows, (settings.TILE_SIZE, settings.TILE_SIZE)
+        )
 
-        print(f"[INFO] Loaded enemy sheet with {len(frames)} frames")
-        return frames
+    # ---------- статичний шар карти ----------
 
+    def invalidate_map_cache(self):
+        """Примусово перебудувати шар карти на наступному кадрі (напр. нова карта)."""
+        self._map_chunks.clear()
+        self._chunk_doors.clear()
+        self._map_cache_key = None
 
-    # ---------- малювання ----------
+    def _get_map_cache_key(self):
+        return (
+            id(self.dungeon),
+            id(self.dungeon.level_data),
+            settings.TILE_SIZE,
+            self.doors_open,
+        )
 
-    def draw(self):
-        self.screen.fill(self.COLOR_BG)
+    def _sync_map_cache(self):
+        """Скидає запечені чанки, якщо змінилась карта, розмір тайла чи двері."""
+        key = self._get_map_cache_key()
+        if key != self._map_cache_key:
+            self._map_chunks.clear()
+            self._chunk_doors.clear()
+            self._map_cache_key = key
+
+    def _get_visible_chunks(self):
+        """Координати чанків, що перетинають видиму область камери."""
+        x0, y0, x1, y1 = self.camera.get_visible_tiles()
+        if x1 <= x0 or y1 <= y0:
+            return []
+        size = self.MAP_CHUNK_TILES
+        return [
+            (cx, cy)
+            for cy in range(y0 // size, (y1 - 1) // size + 1)
+            for cx in range(x0 // size, (x1 - 1) // size + 1)
+        ]
+
+    def _get_map_chunk(self, cx: int, cy: int):
+        chunk = self._map_chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._build_map_chunk(cx, cy)
+            self._map_chunks[(cx, cy)] = chunk
+        return chunk
+
+    def _build_map_chunk(self, cx: int, cy: int):
+        """Запікає підлогу, стіни і двері одного чанка в Surface."""
         tile = settings.TILE_SIZE
-
-        # ---- Малюємо карту тайлами ----
-        for y, row in enumerate(self.dungeon.level_data):
-            for x, ch in enumerate(row):
-                draw_x = self.offset_x + x * tile
-                draw_y = self.offset_y + y * tile
+        size = self.MAP_CHUNK_TILES
+        x_start = cx * size
+        y_start = cy * size
+        x_end = min(self.dungeon.width, x_start + size)
+        y_end = min(self.dungeon.height, y_start + size)
+
+        layer = pygame.Surface(
+            ((x_end - x_start) * tile, (y_end - y_start) * tile)
+        ).convert()
+        layer.fill(self.COLOR_BG)
+        doors = []
+
+        for y in range(y_start, y_end):
+            row = self.dungeon.level_data[y]
+            draw_y = (y - y_start) * tile
+            for x in range(x_start, x_end):
+                ch = row[x]
+                draw_x = (x - x_start) * tile
 
                 # 1) Спочатку — ПІДЛОГА майже всюди
                 if self.floor_image:
-                    self.screen.blit(self.floor_image, (draw_x, draw_y))
+                    layer.blit(self.floor_image, (draw_x, draw_y))
                 else:
                     floor_rect = pygame.Rect(draw_x, draw_y, tile, tile)
-                    pygame.draw.rect(self.screen, self.COLOR_FLOOR, floor_rect)
+                    pygame.draw.rect(layer, self.COLOR_FLOOR, floor_rect)
 
                 # 2) Поверх — стіни / двері / інші особливі тайли
                 if ch == "#":
                     # стіна
                     if self.wall_image:
-                        self.screen.blit(self.wall_image, (draw_x, draw_y))
+                        layer.blit(self.wall_image, (draw_x, draw_y))
                     else:
                         wall_rect = pygame.Rect(draw_x, draw_y, tile, tile)
-                        pygame.draw.rect(self.screen, self.COLOR_WALL, wall_rect)
+                        pygame.draw.rect(layer, self.COLOR_WALL, wall_rect)
 
                 elif ch == "E":
-                    # двері (вихід)
+                    # двері (вихід) — тому шар перебудовується, коли doors_open змінюється
+                    doors.append((x, y))
                     img = self.door_open_image if self.doors_open else self.door_closed_image
                     if img:
-                        self.screen.blit(img, (draw_x, draw_y))
+                        layer.blit(img, (draw_x, draw_y))
                     else:
                         door_rect = pygame.Rect(draw_x, draw_y, tile, tile)
                         color = (200, 150, 40) if self.doors_open else (100, 80, 30)
-                        pygame.draw.rect(self.screen, color, door_rect)
+                        pygame.draw.rect(layer, color, door_rect)
 
                 # інші символи (., P, M, H, A, W, R...) — підлога вже намальована, нічого не робимо
 
+        self._chunk_doors[(cx, cy)] = doors
+        return layer
 
+    def _blit_map(self, visible_chunks, clip_rect=None):
+        """Малює видимі чанки карти (лише ті, що перетинають clip_rect, якщо він є)."""
+        tile = settings.TILE_SIZE
+        chunk_px = self.MAP_CHUNK_TILES * tile
+        for cx, cy in visible_chunks:
+            pos = (self.offset_x + cx * chunk_px, self.offset_y + cy * chunk_px)
+            if clip_rect is not None:
+                chunk_rect = pygame.Rect(pos, (chunk_px, chunk_px))
+                if not chunk_rect.colliderect(clip_rect):
+                    continue
+            self.screen.blit(self._get_map_chunk(cx, cy), pos)
+
+    def _evict_map_chunks(self, visible_chunks):
+        """Викидає запечені чанки далеко від камери, щоб пам'ять не росла на великих картах."""
+        if len(self._map_chunks) <= len(visible_chunks) * 4:
+            return
+        keep = set()
+        for cx, cy in visible_chunks:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    keep.add((cx + dx, cy + dy))
+        for key in [k for k in self._map_chunks if k not in keep]:
+            del self._map_chunks[key]
+            self._chunk_doors.pop(key, None)
+
+    def _get_door_rects(self, visible_chunks):
+        tile = settings.TILE_SIZE
+        rects = []
+        for key in visible_chunks:
+            for x, y in self._chunk_doors.get(key, ()):
+                rects.append(pygame.Rect(
+                    self.offset_x + x * tile, self.offset_y + y * tile, tile, tile
+                ))
+        return rects
+
+    # ---------- малювання ----------
+
+    def set_interpolation(self, alpha: float, tick_count: int, frame_ticks: float = 1.0):
+        """Де між двома тіками симуляції показуємо світ цього кадру."""
+        self.alpha = alpha
+        self.tick_count = tick_count
+        self.frame_ticks = frame_ticks
+
+    def _lerp_pos(self, entity):
+        """Дробова позиція сутності в тайлах: між prev і поточною клітинкою.
+
+        Крок, зроблений на останньому тіку, показуємо на alpha шляху;
+        крок, що ще чекає свого тіку (гравець походив між тіками), — на старті.
+        """
+        tick = self.tick_count
+        if tick is None or entity.moved_tick < tick - 1:
+            return entity.x, entity.y
+        t = self.alpha if entity.moved_tick == tick - 1 else 0.0
+        return (
+            entity.prev_x + (entity.x - entity.prev_x) * t,
+            entity.prev_y + (entity.y - entity.prev_y) * t,
+        )
+
+    def invalidate_rect(self, rect):
+        """Dirty-режим: наступного кадру відновити фон і спрайти під rect (напр. під оверлеєм)."""
+        self._extra_dirty.append(pygame.Rect(rect))
+
+    def request_full_redraw(self):
+        """Наступний кадр у dirty-режимі буде намальований і показаний повністю."""
+        self._full_redraw = True
+
+    def draw(self):
+        """Малює кадр.
+
+        У звичайному режимі повертає None — Game робить display.flip().
+        У dirty-режимі повертає список Rect, які змінились з минулого кадру
+        (порожній список — показувати нічого не треба).
+        """
+        # ---- Камера: слідуємо за гравцем, рахуємо зсув і видимі чанки ----
+        player_x, player_y = self._lerp_pos(self.player)
+        self.camera.follow(player_x, player_y, self.frame_ticks)
+        self.offset_x, self.offset_y = self.camera.get_offset()
+
+        prev_map_key = self._map_cache_key
+        self._sync_map_cache()
+        visible_chunks = self._get_visible_chunks()
+        commands = self._collect_sprite_commands()
+        self.sprites_drawn = len(commands)
+
+        if not self.dirty_rects_enabled:
+            self._draw_full(commands, visible_chunks)
+            return None
+
+        view_key = (self._map_cache_key[:3], self.offset_x, self.offset_y)
+        if self._full_redraw or prev_map_key is None or view_key != self._prev_view_key:
+            # перший кадр / нова карта / новий розмір тайла / камера зсунулась — малюємо все
+            self._draw_full(commands, visible_chunks)
+            self._prev_view_key = view_key
+            self._full_redraw = False
+            self._extra_dirty.clear()
+            return [self.screen.get_rect()]
+
+        dirty = self._extra_dirty
+        self._extra_dirty = []
+
+        # ---- Двері: чанки перебудуються, але показуємо лише клітинки дверей ----
+        if self._map_cache_key != prev_map_key:
+            for key in visible_chunks:
+                self._get_map_chunk(*key)
+            dirty.extend(self._get_door_rects(visible_chunks))
+
+        # ---- Спрайти: що зникло з минулого кадру і що з'явилось ----
+        signatures = [self._command_signature(cmd) for cmd in commands]
+        current = set(signatures)
+        previous = self._prev_signatures
+        for sig in previous - current:
+            dirty.append(pygame.Rect(sig[1]))
+        for sig in current - previous:
+            dirty.append(pygame.Rect(sig[1]))
+        self._prev_signatures = current
+
+        # ---- HUD: якщо змінився стан — старі й нові області HUD ----
+        hud_rects = self.hud.get_rects(self.screen)
+        hud_key = self.hud.get_state_key()
+        if hud_key != self._prev_hud_key:
+            dirty.extend(self._prev_hud_rects)
+            dirty.extend(hud_rects)
+            self._prev_hud_key = hud_key
+        self._prev_hud_rects = hud_rects
+
+        if not dirty:
+            return []
+
+        self._redraw_regions(dirty, commands, hud_rects, visible_chunks)
+        return dirty
+
+    def _draw_full(self, commands, visible_chunks):
+        """Повне перемальовування екрана."""
+        self.screen.fill(self.COLOR_BG)
+
+        # ---- Карта: по одному blit'у на видимий запечений чанк ----
+        self._blit_map(visible_chunks)
+        self._evict_map_chunks(visible_chunks)
 
-        # ---- Малюємо предмети ----
-        for item in self.items:
+        # ---- Предмети, вороги, гравець ----
+        for cmd in commands:
+            self._execute_command(cmd)
+
+        # ---- HUD поверх ----
+        self.hud.draw(self.screen)
+        # flip / update робиться в Game.draw()
+
+        if self.dirty_rects_enabled:
+            self._prev_signatures = {self._command_signature(cmd) for cmd in commands}
+            self._prev_hud_key = self.hud.get_state_key()
+            self._prev_hud_rects = self.hud.get_rects(self.screen)
+
+    def _redraw_regions(self, dirty, commands, hud_rects, visible_chunks):
+        """Відновлює фон під кожним брудним прямокутником і домальовує все, що його перетинає."""
+        cmd_rects = [cmd[1] for cmd in commands]
+        old_clip = self.screen.get_clip()
+
+        for rect in dirty:
+            self.screen.set_clip(rect)
+
+            # фон: чорне тло + відповідні шматки запечених чанків
+            self.screen.fill(self.COLOR_BG, rect)
+            self._blit_map(visible_chunks, rect)
+
+            for idx in rect.collidelistall(cmd_rects):
+                self._execute_command(commands[idx])
+
+            if rect.collidelist(hud_rects) != -1:
+                self.hud.draw(self.screen)
+
+        self.screen.set_clip(old_clip)
+
+    # ---- команди малювання: (вид, Rect, значення) ----
+    # "img"   — blit Surface у Rect.topleft
+    # "fill"  — заливка Rect кольором
+    # "frame" — рамка товщиною 2 пікселі
+
+    def _command_signature(self, cmd):
+        kind, rect, value = cmd
+        if kind == "img":
+            value = id(value)
+        return kind, tuple(rect), value
+
+    def _execute_command(self, cmd):
+        kind, rect, value = cmd
+        if kind == "img":
+            self.screen.blit(value, rect.topleft)
+        elif kind == "fill":
+            pygame.draw.rect(self.screen, value, rect)
+        elif kind == "frame":
+            pygame.draw.rect(self.screen, value, rect, 2)
+
+    def _collect_sprite_commands(self):
+        """Збирає команди малювання предметів, ворогів і гравця в порядку шарів."""
+        tile = settings.TILE_SIZE
+        commands = []
+        visible = self.camera.get_visible_tiles()
+
+        # ---- Предмети (лише видимі) ----
+        for item in self._get_visible(self.items, self.item_index, visible):
             draw_x = self.offset_x + item.x * tile
             draw_y = self.offset_y + item.y * tile
 
             # рамка по рідкості
             border_color = self._get_item_rarity_color(item)
             border_rect = pygame.Rect(draw_x + 2, draw_y + 2, tile - 4, tile - 4)
-            pygame.draw.rect(self.screen, border_color, border_rect, 2)
+            commands.append(("frame", border_rect, border_color))
 
             # сам спрайт
-            if item.type == ItemType.HEAL and self.heal_image:
-                self.screen.blit(self.heal_image, (draw_x, draw_y))
-
-            elif item.type == ItemType.ATTACK and self.attack_image:
-                self.screen.blit(self.attack_image, (draw_x, draw_y))
-
+            img = None
+            fallback_color = (220, 200, 80)  # на всякий випадок — невідомий тип
+            if item.type == ItemType.HEAL:
+                img = self.heal_image
+            elif item.type == ItemType.ATTACK:
+                img = self.attack_image
             elif item.type == ItemType.WEAPON:
                 img = self.weapon_images.get(item.rarity)
-                if img is not None:
-                    self.screen.blit(img, (draw_x, draw_y))
-                else:
-                    size = int(tile * 0.5)
-                    item_rect = pygame.Rect(
-                        draw_x + (tile - size) // 2,
-                        draw_y + (tile - size) // 2,
-                        size,
-                        size
-                    )
-                    pygame.draw.rect(self.screen, (200, 200, 200), item_rect)
-
+                fallback_color = (200, 200, 200)
             elif item.type == ItemType.ARMOR:
                 img = self.armor_images.get(item.rarity)
-                if img is not None:
-                    self.screen.blit(img, (draw_x, draw_y))
-                else:
-                    size = int(tile * 0.5)
-                    item_rect = pygame.Rect(
-                        draw_x + (tile - size) // 2,
-                        draw_y + (tile - size) // 2,
-                        size,
-                        size
-                    )
-                    pygame.draw.rect(self.screen, (180, 180, 200), item_rect)
+                fallback_color = (180, 180, 200)
 
+            if img is not None:
+                commands.append(("img", pygame.Rect(draw_x, draw_y, tile, tile), img))
             else:
-                # на всякий випадок — невідомий тип
                 size = int(tile * 0.5)
                 item_rect = pygame.Rect(
                     draw_x + (tile - size) // 2,
@@ -272,7 +473,7 @@ class Renderer:
                     size,
                     size
                 )
-                pygame.draw.rect(self.screen, (220, 200, 80), item_rect)
+                commands.append(("fill", item_rect, fallback_color))
 
         # ---- Анімація ворогів (оновлюємо кадр) ----
         if self.enemy_frames:
@@ -281,13 +482,17 @@ class Renderer:
                 self.enemy_anim_timer = 0
                 self.enemy_anim_index = (self.enemy_anim_index + 1) % len(self.enemy_frames)
 
-        # ---- Малюємо ворогів ----
-        for enemy in self.enemies:
+        # ---- Вороги (лише видимі) ----
+        for enemy in self._get_visible(self.enemies, self.enemy_index, visible):
             if not enemy.is_alive():
                 continue
 
-            draw_x = self.offset_x + enemy.x * tile
-            draw_y = self.offset_y + enemy.y * tile
+            enemy_x, enemy_y = self._lerp_pos(enemy)
+            rect = pygame.Rect(
+                self.offset_x + int(round(enemy_x * tile)),
+                self.offset_y + int(round(enemy_y * tile)),
+                tile, tile
+            )
 
             frame = None
             if self.enemy_frames:
@@ -300,36 +505,39 @@ class Renderer:
                 frame = self.enemy_frames.get((enemy.direction, frame_idx))
 
             if frame is not None:
-                self.screen.blit(frame, (draw_x, draw_y))
+                commands.append(("img", rect, frame))
             elif self.enemy_image:
-                self.screen.blit(self.enemy_image, (draw_x, draw_y))
+                commands.append(("img", rect, self.enemy_image))
             else:
-                rect = pygame.Rect(draw_x, draw_y, tile, tile)
-                pygame.draw.rect(self.screen, (200, 60, 60), rect)
+                commands.append(("fill", rect, (200, 60, 60)))
 
-        # ---- Малюємо гравця зі спрайт-листа ----
-        player_x = self.offset_x + self.player.x * tile
-        player_y = self.offset_y + self.player.y * tile
+        # ---- Гравець зі спрайт-листа ----
+        lerp_x, lerp_y = self._lerp_pos(self.player)
+        player_x = self.offset_x + int(round(lerp_x * tile))
+        player_y = self.offset_y + int(round(lerp_y * tile))
 
         # невеликий зсув для "підстрибування"
         off_x, off_y = self.player.get_draw_offset()
-        player_x += off_x
-        player_y += off_y
+        rect = pygame.Rect(player_x + off_x, player_y + off_y, tile, tile)
 
         hero_img = self.get_hero_frame()
 
         if hero_img:
-            self.screen.blit(hero_img, (player_x, player_y))
+            commands.append(("img", rect, hero_img))
         elif self.hero_image:
             # fallback, якщо нема sheet'а
-            self.screen.blit(self.hero_image, (player_x, player_y))
+            commands.append(("img", rect, self.hero_image))
         else:
-            rect = pygame.Rect(player_x, player_y, tile, tile)
-            pygame.draw.rect(self.screen, (200, 200, 50), rect)
+            commands.append(("fill", rect, (200, 200, 50)))
 
-        # ---- HUD поверх ----
-        self.hud.draw(self.screen)
-        # flip робиться в Game.draw()
+        return commands
+
+    def _get_visible(self, entities, index, visible):
+        """Сутності у видимих тайлах: з індексу, якщо він є, інакше фільтром по списку."""
+        x0, y0, x1, y1 = visible
+        if index is not None:
+            return index.query(x0, y0, x1, y1)
+        return [e for e in entities if x0 <= e.x < x1 and y0 <= e.y < y1]
 
     def get_hero_frame(self):
         """Обирає кадр героя залежно від напрямку і walk_timer."""